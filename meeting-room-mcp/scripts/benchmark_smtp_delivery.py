@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""SMTP 발송 처리량 벤치마크 (발송마다 새 연결 + 수신자 순차 발송 vs 커넥션 풀 + 병렬 발송)
+
+로컬 SMTP 대역 서버를 띄우고 응답마다 --latency-ms만큼 지연시켜 네트워크 왕복을 흉내낸다.
+
+사용법: python scripts/benchmark_smtp_delivery.py [--notifications 50] [--recipients 5] [--latency-ms 5]
+"""
+
+import argparse
+import logging
+import smtplib
+import socketserver
+import sys
+import threading
+import time
+from email.mime.multipart import MIMEMultipart
+from email.mime.text import MIMEText
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.meeting_room_mcp.server.services.email_sevice import EmailService
+from src.meeting_room_mcp.shared.models import EmailNotification
+
+
+class StandInSMTPHandler(socketserver.StreamRequestHandler):
+    """메시지를 받기만 하는 최소 SMTP 서버 (EHLO/MAIL/RCPT/DATA/RSET/NOOP/QUIT)"""
+
+    def reply(self, line: str):
+        time.sleep(self.server.latency)
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        self.server.count('connections')
+        self.reply("220 stand-in ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+
+            command = line.decode(errors='replace').strip().upper()
+            if command.startswith(("EHLO", "HELO")):
+                self.reply("250-stand-in\r\n250 8BITMIME")
+            elif command.startswith(("MAIL", "RSET", "NOOP")):
+                self.reply("250 OK")
+            elif command.startswith("RCPT"):
+                self.server.count('recipients')
+                self.reply("250 OK")
+            elif command == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.server.count('messages')
+                self.reply("250 queued")
+            elif command == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 not implemented")
+
+
+class StandInSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, latency: float):
+        super().__init__(("127.0.0.1", 0), StandInSMTPHandler)
+        self.latency = latency
+        self.counters = {'connections': 0, 'messages': 0, 'recipients': 0}
+        self._lock = threading.Lock()
+
+    def count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+
+def legacy_send(host: str, port: int, notification: EmailNotification) -> bool:
+    """기존 방식: 발송마다 새 연결, 수신자마다 순차 발송"""
+    with smtplib.SMTP(host, port) as server:
+        for to_email in notification.to_emails:
+            msg = MIMEMultipart()
+            msg['From'] = 'meeting-system@company.com'
+            msg['To'] = to_email
+            msg['Subject'] = notification.subject
+            msg.attach(MIMEText(notification.body, 'plain', 'utf-8'))
+            server.send_message(msg)
+    return True
+
+
+def run_benchmark(label: str, send, notifications: int, recipients: int, latency: float, concurrency: int) -> dict:
+    """알림 발송 작업 concurrency개를 동시에 돌려 처리량 측정 (발송 대기열 워커와 같은 구조)"""
+    server = StandInSMTPServer(latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    host, port = server.server_address
+
+    notification = EmailNotification(
+        to_emails=[f"user{i}@company.com" for i in range(recipients)],
+        subject="[예약 확인] 벤치마크",
+        body="벤치마크 본문\n" * 20,
+        reservation=None,  # 제목/본문을 지정하면 사용하지 않음
+        room=None
+    )
+
+    sender, close = send(host, port)
+    remaining = list(range(notifications))
+    lock = threading.Lock()
+
+    def worker():
+        while True:
+            with lock:
+                if not remaining:
+                    return
+                remaining.pop()
+            sender(notification)
+
+    threads = [threading.Thread(target=worker) for _ in range(concurrency)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    if close:
+        close()
+    server.shutdown()
+    server.server_close()
+
+    return {
+        'label': label,
+        'seconds': elapsed,
+        'recipients_per_second': server.counters['recipients'] / elapsed,
+        **server.counters
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SMTP 발송 처리량 벤치마크")
+    parser.add_argument("--notifications", type=int, default=50, help="알림 발송 건수")
+    parser.add_argument("--recipients", type=int, default=5, help="알림당 수신자 수")
+    parser.add_argument("--latency-ms", type=float, default=5.0, help="SMTP 응답마다 추가할 지연(ms)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시 발송 작업 수 (발송 대기열 워커 수)")
+    parser.add_argument("--pool-size", type=int, default=4, help="SMTP 커넥션 풀 크기")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+    latency = args.latency_ms / 1000
+
+    def pooled(batch_recipients: bool):
+        def make(host: str, port: int):
+            service = EmailService(
+                smtp_server=host,
+                smtp_port=port,
+                use_tls=False,
+                mock_mode=False,
+                pool_size=args.pool_size,
+                batch_recipients=batch_recipients
+            )
+            return service._send_email, service.close
+        return make
+
+    profiles = [
+        ("기존 (발송마다 새 연결, 수신자 순차)", lambda host, port: (lambda n: legacy_send(host, port, n), None)),
+        ("커넥션 풀 + 수신자 병렬 발송", pooled(batch_recipients=False)),
+        ("커넥션 풀 + 수신자 일괄 발송 (RCPT TO 여러 번)", pooled(batch_recipients=True)),
+    ]
+
+    print(
+        f"알림 {args.notifications}건 x 수신자 {args.recipients}명, 응답 지연 {args.latency_ms}ms, "
+        f"동시 발송 {args.concurrency}개\n"
+    )
+    for label, send in profiles:
+        result = run_benchmark(label, send, args.notifications, args.recipients, latency, args.concurrency)
+        print(
+            f"{result['label']}: {result['recipients_per_second']:.1f} recipients/s "
+            f"(메시지 {result['messages']}, 수신자 {result['recipients']}, 연결 {result['connections']}, "
+            f"{result['seconds']:.2f}초)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""SQLite 쓰기 처리량 벤치마크 (기본 설정 vs 성능 PRAGMA 프로파일)
+
+사용법: python scripts/benchmark_sqlite_writes.py [--writers 8] [--per-writer 200]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.meeting_room_mcp.config.database_config import DatabaseConfig
+from src.meeting_room_mcp.config.settings import DatabaseSettings
+from src.meeting_room_mcp.server.migrations import run_migrations
+from src.meeting_room_mcp.server.reservation.reservation_repository import ReservationRepository
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+from src.meeting_room_mcp.server.room.room_repository import RoomRepository
+
+
+def run_benchmark(label: str, db_settings: DatabaseSettings, writers: int, per_writer: int) -> dict:
+    """동시 쓰기 스레드로 예약 생성 처리량 측정"""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        db_config = DatabaseConfig(f"sqlite:///{Path(tmp_dir) / 'bench.db'}", db_settings)
+        db_config.create_tables()
+        run_migrations(db_config)
+        with db_config.get_session() as session:
+            RoomRepository(session).insert_sample_data()
+
+        base_time = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(days=1)
+        failures = []
+
+        def write(writer_id: int):
+            # 회의실/시간대를 겹치지 않게 배정하여 순수 쓰기 경합만 측정
+            room_id = writer_id % 8 + 1
+            offset = writer_id // 8 * per_writer
+            for i in range(per_writer):
+                start_time = base_time + timedelta(hours=offset + i)
+                reservation = Reservation(
+                    id=None,
+                    room_id=room_id,
+                    title=f"bench-{writer_id}-{i}",
+                    description="",
+                    start_time=start_time,
+                    end_time=start_time + timedelta(minutes=30),
+                    organizer_email="bench@company.com",
+                    participants=[]
+                )
+                try:
+                    with db_config.get_session() as session:
+                        ReservationRepository(session).create(reservation)
+                except Exception as e:
+                    failures.append(e)
+
+        threads = [threading.Thread(target=write, args=(writer_id,)) for writer_id in range(writers)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        db_config.close()
+
+    total = writers * per_writer
+    return {
+        'label': label,
+        'writes': total - len(failures),
+        'failures': len(failures),
+        'seconds': elapsed,
+        'writes_per_second': (total - len(failures)) / elapsed
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="SQLite 쓰기 처리량 벤치마크")
+    parser.add_argument("--writers", type=int, default=8, help="동시 쓰기 스레드 수")
+    parser.add_argument("--per-writer", type=int, default=200, help="스레드당 예약 생성 수")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.ERROR)
+
+    profiles = [
+        ("기본 (rollback journal, synchronous=FULL)", DatabaseSettings(sqlite_tuning=False, lock_retry_attempts=1)),
+        ("성능 프로파일 (WAL, synchronous=NORMAL, 재시도)", DatabaseSettings(sqlite_tuning=True)),
+    ]
+
+    print(f"쓰기 스레드 {args.writers}개 x 예약 {args.per_writer}건\n")
+    for label, db_settings in profiles:
+        result = run_benchmark(label, db_settings, args.writers, args.per_writer)
+        print(
+            f"{result['label']}: {result['writes_per_second']:.1f} writes/s "
+            f"(성공 {result['writes']}, 실패 {result['failures']}, {result['seconds']:.2f}초)"
+        )
+
+
+if __name__ == "__main__":
+    main()
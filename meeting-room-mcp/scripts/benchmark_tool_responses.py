@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""회의실 목록 도구 응답 포맷 벤치마크 (페이로드 크기 및 직렬화 시간)
+
+사용법: python scripts/benchmark_tool_responses.py [--rooms 1000] [--repeat 50]
+"""
+
+import argparse
+import dataclasses
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.meeting_room_mcp.server.response_format import compact_table, dumps
+from src.meeting_room_mcp.server.room.room_enum import RoomStatus
+from src.meeting_room_mcp.server.room.room_tools import ROOM_COLUMNS
+from src.meeting_room_mcp.shared.models import MeetingRoom
+
+
+def make_rooms(count: int) -> list:
+    """벤치마크용 회의실 목록 생성"""
+    statuses = list(RoomStatus)
+    return [
+        MeetingRoom(
+            id=i,
+            name=f"회의실 {i}",
+            capacity=4 + i % 20,
+            location=f"{i % 12 + 1}층",
+            equipment="프로젝터, 화이트보드, 화상회의",
+            status=statuses[i % len(statuses)]
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+def prose_concat(rooms: list) -> str:
+    """기존 방식: 루프 안에서 result += ..."""
+    result = f"전체 회의실 ({len(rooms)}개):\n\n"
+    for room in rooms:
+        result += f"ID: {room.id}, 이름: {room.name}, 위치: {room.location}, "
+        result += f"수용인원: {room.capacity}명, 상태: {room.status.value}\n"
+    return result
+
+
+def prose_join(rooms: list) -> str:
+    """현재 prose 방식: 줄 목록을 한 번에 join"""
+    lines = [f"전체 회의실 ({len(rooms)}개):\n\n"]
+    lines.extend(
+        f"ID: {room.id}, 이름: {room.name}, 위치: {room.location}, "
+        f"수용인원: {room.capacity}명, 상태: {room.status.value}\n"
+        for room in rooms
+    )
+    return ''.join(lines)
+
+
+def stdlib_json(rooms: list) -> str:
+    """표준 json 모듈 직렬화 (비교용)"""
+    def default(value):
+        if isinstance(value, RoomStatus):
+            return value.value
+        raise TypeError(type(value))
+
+    items = [dataclasses.asdict(room) for room in rooms]
+    return json.dumps({'items': items, 'next_cursor': None}, ensure_ascii=False, default=default)
+
+
+def measure(render, rooms: list, repeat: int) -> dict:
+    """반복 실행하여 중간값 시간과 UTF-8 바이트 수 측정"""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        payload = render(rooms)
+        timings.append(time.perf_counter() - started)
+
+    return {
+        'bytes': len(payload.encode()),
+        'ms': statistics.median(timings) * 1000
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="도구 응답 포맷 벤치마크")
+    parser.add_argument("--rooms", type=int, default=1000, help="회의실 수")
+    parser.add_argument("--repeat", type=int, default=50, help="포맷별 반복 횟수")
+    args = parser.parse_args()
+
+    rooms = make_rooms(args.rooms)
+
+    renderers = [
+        ("prose (+= 연결)", prose_concat),
+        ("prose (join)", prose_join),
+        ("json (표준 json)", stdlib_json),
+        ("json (orjson)", lambda items: dumps({'items': items, 'next_cursor': None})),
+        ("compact", lambda items: compact_table(items, ROOM_COLUMNS)),
+    ]
+
+    print(f"회의실 {args.rooms}개 x {args.repeat}회\n")
+    for label, render in renderers:
+        result = measure(render, rooms, args.repeat)
+        print(f"{label:<18} {result['bytes']:>9,} bytes  {result['ms']:>8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -4,6 +4,7 @@
 
 import os
 from pathlib import Path
+from typing import List
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
@@ -30,11 +31,26 @@ class Settings(BaseSettings):
     api_port: int = Field(default=8000, description="API 서버 포트")
     api_debug: bool = Field(default=False, description="API 디버그 모드")
 
+    # 가용성 인덱스 설정
+    availability_index_enabled: bool = Field(default=False, description="인메모리 가용성 인덱스 사용")
+
+    # 조회 응답 캐시 설정
+    read_cache_enabled: bool = Field(default=True, description="조회 도구 응답 캐시 사용")
+    read_cache_max_entries: int = Field(default=1024, description="응답 캐시 최대 항목 수 (LRU)")
+    read_cache_ttl: float = Field(default=30.0, description="응답 캐시 유효 시간(초)")
+
     # MCP 서버 설정
     mcp_server_script: str = Field(
         default=str(PROJECT_ROOT / "scripts" / "start_server.py"),
         description="MCP 서버 스크립트 경로"
     )
+    mcp_transport: str = Field(default="stdio", description="MCP 전송 방식 (stdio, http)")
+    mcp_http_path: str = Field(default="/mcp", description="HTTP 모드 MCP 엔드포인트 경로")
+    mcp_http_workers: int = Field(default=1, description="HTTP 모드 워커 프로세스 수 (2 이상이면 EMAIL_OUTBOX_ENABLED 필요)")
+    mcp_graceful_shutdown_timeout: int = Field(default=30, description="HTTP 모드 종료 대기 시간(초)")
+    mcp_metrics_path: str = Field(
+        default="/metrics", description="HTTP 모드 Prometheus 지표 경로 (워커별 집계, worker 레이블로 구분)"
+    )
 
     # LLM API 키들
     openai_api_key: str = Field(default="", description="OpenAI API 키")
@@ -92,6 +108,12 @@ class Settings(BaseSettings):
 class DatabaseSettings(BaseSettings):
     """데이터베이스 전용 설정"""
 
+    # 연결 대상
+    url: str = Field(default="", description="데이터베이스 URL (지정 시 아래 연결 설정보다 우선)")
+    backend: str = Field(default="sqlite", description="URL 미지정 시 사용할 DB 종류 (sqlite, mysql)")
+    sqlite_path: str = Field(default=str(PROJECT_ROOT / "data" / "meeting_room.db"), description="SQLite 파일 경로")
+    echo: bool = Field(default=False, description="SQL 로그 출력 여부")
+
     # MySQL 설정
     mysql_host: str = Field(default="localhost")
     mysql_port: int = Field(default=3306)
@@ -105,9 +127,40 @@ class DatabaseSettings(BaseSettings):
     max_overflow: int = Field(default=20, description="최대 오버플로우")
     pool_timeout: int = Field(default=30, description="커넥션 타임아웃")
     pool_recycle: int = Field(default=3600, description="커넥션 재활용 시간")
+    pool_pre_ping: bool = Field(default=True, description="체크아웃 시 연결 상태 확인")
+    pool_class: str = Field(default="queue", description="커넥션 풀 종류 (queue, null, static)")
+
+    # SQLite 성능 설정 (연결 시 PRAGMA 적용)
+    sqlite_tuning: bool = Field(default=True, description="SQLite PRAGMA 성능 설정 적용")
+    sqlite_journal_mode: str = Field(default="WAL", description="저널 모드")
+    sqlite_synchronous: str = Field(default="NORMAL", description="커밋 동기화 수준")
+    sqlite_busy_timeout: int = Field(default=5000, description="잠금 대기 시간(ms)")
+    sqlite_cache_size: int = Field(default=-65536, description="페이지 캐시 크기 (음수는 KiB)")
+    sqlite_mmap_size: int = Field(default=268435456, description="메모리 맵 크기(바이트)")
+    sqlite_temp_store: str = Field(default="MEMORY", description="임시 테이블 저장 위치")
+
+    # 잠금 충돌 재시도 설정
+    lock_retry_attempts: int = Field(default=5, description="잠금 충돌 시 최대 시도 횟수")
+    lock_retry_base_delay: float = Field(default=0.05, description="재시도 기본 대기 시간(초)")
+    lock_retry_max_delay: float = Field(default=1.0, description="재시도 최대 대기 시간(초)")
+
+    # 읽기 복제본 설정
+    replica_urls: str = Field(default="", description="읽기 복제본 URL 목록 (쉼표 구분)")
+    replica_max_lag: float = Field(default=2.0, description="쓰기 후 읽기를 프라이머리로 고정할 복제 지연 허용 시간(초)")
+    replica_sync_interval: float = Field(default=1.0, description="SQLite 복제본 파일 동기화 주기(초, 0이면 사용 안 함)")
+
+    @property
+    def replica_url_list(self) -> List[str]:
+        return [url.strip() for url in self.replica_urls.split(",") if url.strip()]
 
     @property
     def database_url(self) -> str:
+        if self.url:
+            return self.url
+
+        if self.backend == "sqlite":
+            return f"sqlite:///{self.sqlite_path}"
+
         return (
             f"mysql+pymysql://{self.mysql_user}:{self.mysql_password}"
             f"@{self.mysql_host}:{self.mysql_port}/{self.mysql_database}"
@@ -130,12 +183,47 @@ class EmailSettings(BaseSettings):
     smtp_tls: bool = Field(default=True)
     mock_mode: bool = Field(default=True)
 
+    # SMTP 커넥션 풀 설정
+    smtp_pool_size: int = Field(default=4, description="SMTP 커넥션 풀 크기 (수신자별 병렬 발송 연결 수)")
+    smtp_max_connection_age: float = Field(default=300.0, description="SMTP 연결 최대 수명(초)")
+    smtp_noop_interval: float = Field(default=30.0, description="이 시간(초) 넘게 쉰 연결은 NOOP으로 확인 후 사용")
+    smtp_timeout: float = Field(default=10.0, description="SMTP 연결/응답 대기 시간(초)")
+    smtp_batch_recipients: bool = Field(default=False, description="수신자별 개별 발송 대신 한 메시지로 여러 수신자에게 발송")
+
     # 발송자 정보
     from_email: str = Field(default="meeting-system@company.com")
     from_name: str = Field(default="회의실 예약 시스템")
 
     # 템플릿 설정
     template_dir: str = Field(default=str(PROJECT_ROOT / "templates" / "email"))
+    template_auto_reload: bool = Field(default=True, description="템플릿 파일이 바뀌면 다시 읽기")
+    template_reload_interval: float = Field(default=2.0, description="템플릿 파일 수정 여부 확인 주기(초)")
+
+    # 발송 대기열 설정
+    queue_workers: int = Field(default=4, description="알림 발송 워커 수")
+    queue_max_pending: int = Field(default=1000, description="처리 대기 중인 최대 알림 작업 수")
+    send_max_attempts: int = Field(default=5, description="알림 발송 최대 시도 횟수")
+    retry_base_delay: float = Field(default=1.0, description="재시도 기본 대기 시간(초, 시도마다 2배)")
+    retry_max_delay: float = Field(default=60.0, description="재시도 최대 대기 시간(초)")
+
+    # 아웃박스 설정 (예약 확인/취소 알림 자동 발송)
+    outbox_enabled: bool = Field(default=True, description="예약 생성/삭제 시 확인/취소 알림을 같은 트랜잭션에 기록 후 자동 발송")
+    outbox_batch_size: int = Field(default=50, description="릴레이가 한 번에 가져오는 알림 수")
+    outbox_poll_interval: float = Field(default=1.0, description="릴레이 확인 주기(초)")
+    outbox_claim_timeout: float = Field(default=60.0, description="선점한 알림의 결과를 기록하지 못하면 다시 발송 대상이 되는 시간(초)")
+    outbox_coalesce_window: float = Field(
+        default=0.0, description="같은 수신자의 알림을 모음 메일로 합치기 위해 기다리는 시간(초, 0이면 합치지 않음)"
+    )
+
+    # 리마인더 설정 (아웃박스 사용 시)
+    reminder_enabled: bool = Field(default=True, description="회의 시작 전 리마인더 자동 발송")
+    reminder_offsets: str = Field(default="30", description="리마인더를 보낼 회의 시작 전 분 (쉼표 구분)")
+    reminder_horizon: float = Field(default=3600.0, description="리마인더 스케줄러가 미리 읽어 두는 기간(초)")
+    reminder_scan_interval: float = Field(default=60.0, description="다가오는 회의 조회 주기(초)")
+
+    @property
+    def reminder_offset_list(self) -> List[int]:
+        return [int(offset) for offset in self.reminder_offsets.split(",") if offset.strip()]
 
     class Config:
         env_prefix = "EMAIL_"
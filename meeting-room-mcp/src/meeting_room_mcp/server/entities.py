@@ -3,6 +3,8 @@ SQLAlchemy 데이터베이스 엔티티 모델
 """
 
 import json
+from datetime import datetime
+from typing import Iterable, List
 
 from sqlalchemy import (
     Column, Integer, String, DateTime, Text, ForeignKey, Index, CheckConstraint
@@ -12,6 +14,7 @@ from sqlalchemy.sql import func
 
 from src.meeting_room_mcp.config.database_config import Base
 from src.meeting_room_mcp.shared.models import Reservation
+from src.meeting_room_mcp.server.reservation.reservation_schemas import RecurrenceRule
 
 
 class ReservationEntity(Base):
@@ -31,6 +34,16 @@ class ReservationEntity(Base):
 
     # 관계 설정
     room = relationship("MeetingRoomEntity", back_populates="reservations")
+    recurrence = relationship(
+        "ReservationRecurrenceEntity",
+        uselist=False,
+        cascade="all, delete-orphan",
+        lazy="selectin"
+    )
+    participant_links = relationship(
+        "ReservationParticipantEntity",
+        cascade="all, delete-orphan"
+    )
 
     # 제약 조건 및 인덱스
     __table_args__ = (
@@ -38,8 +51,17 @@ class ReservationEntity(Base):
         Index('idx_reservations_room_time', 'room_id', 'start_time', 'end_time'),
         Index('idx_reservations_time_range', 'start_time', 'end_time'),
         Index('idx_reservations_organizer', 'organizer_email'),
+        # 삭제된 예약 ID를 다시 쓰지 않도록 (알림 중복 방지 키가 예약 ID를 포함)
+        {'sqlite_autoincrement': True},
     )
 
+    def sync_participants(self):
+        """participants JSON 컬럼 기준으로 참가자 연관 행 재구성"""
+        self.participant_links = [
+            ReservationParticipantEntity(email=email)
+            for email in normalize_emails(json.loads(self.participants) if self.participants else [])
+        ]
+
     def to_model(self) -> Reservation:
         """엔티티를 모델로 변환"""
         participants = json.loads(self.participants) if self.participants else []
@@ -53,5 +75,57 @@ class ReservationEntity(Base):
             end_time=self.end_time,
             organizer_email=self.organizer_email,
             participants=participants,
-            created_at=self.created_at
+            created_at=self.created_at,
+            recurrence=self.recurrence.to_rule() if self.recurrence else None
+        )
+
+
+class ReservationParticipantEntity(Base):
+    """예약-참가자 연관 테이블"""
+    __tablename__ = 'reservation_participants'
+
+    reservation_id = Column(Integer, ForeignKey('reservations.id', ondelete='CASCADE'), primary_key=True)
+    email = Column(String(255), primary_key=True)
+
+    # 인덱스 (참가자 -> 예약 조회용)
+    __table_args__ = (
+        Index('idx_reservation_participants_email', 'email', 'reservation_id'),
+    )
+
+
+def normalize_emails(emails: Iterable[str]) -> List[str]:
+    """이메일 목록을 소문자/공백 제거된 중복 없는 목록으로 변환"""
+    normalized = []
+    for email in emails:
+        email = email.strip().lower()
+        if email and email not in normalized:
+            normalized.append(email)
+
+    return normalized
+
+
+class ReservationRecurrenceEntity(Base):
+    """반복 예약 규칙 테이블 (reservations 행이 첫 회차)"""
+    __tablename__ = 'reservation_recurrences'
+
+    reservation_id = Column(Integer, ForeignKey('reservations.id', ondelete='CASCADE'), primary_key=True)
+    frequency = Column(String(10), nullable=False)  # daily, weekly, monthly
+    interval = Column(Integer, nullable=False, default=1)
+    count = Column(Integer, nullable=True)
+    until = Column(DateTime, nullable=True)
+    exceptions = Column(Text, nullable=False, default='[]')  # 제외 회차 시작 시각 JSON 배열
+    series_end = Column(DateTime, nullable=False)  # 마지막 회차 종료 시각 (구간 조회용)
+
+    __table_args__ = (
+        Index('idx_reservation_recurrences_series_end', 'series_end'),
+    )
+
+    def to_rule(self) -> RecurrenceRule:
+        """엔티티를 반복 규칙으로 변환"""
+        return RecurrenceRule(
+            frequency=self.frequency,
+            interval=self.interval,
+            count=self.count,
+            until=self.until,
+            exceptions=[datetime.fromisoformat(value) for value in json.loads(self.exceptions or '[]')]
         )
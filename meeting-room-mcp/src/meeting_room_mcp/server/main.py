@@ -2,20 +2,36 @@
 Meeting Room MCP Server - 순수한 도구 제공
 """
 
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
 
+import uvicorn
 from fastmcp import FastMCP
+from sqlalchemy import make_url
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import PlainTextResponse
 
+from src.meeting_room_mcp.server.notification.notification_queue import NotificationQueue
+from src.meeting_room_mcp.server.notification.notification_relay import NotificationRelay
+from src.meeting_room_mcp.server.notification.reminder_scheduler import ReminderScheduler
 from src.meeting_room_mcp.server.notification.notification_tools import register_notification_tools
 from src.meeting_room_mcp.server.reservation.reservation_tools import register_reservation_tools
 from src.meeting_room_mcp.server.room.room_tools import register_room_tools
-from ..config.settings import get_db_settings, get_email_settings
-from src.meeting_room_mcp.config.database_config import DatabaseConfig
+from ..config.settings import get_settings, get_db_settings, get_email_settings
+from src.meeting_room_mcp.config.database_config import AsyncDatabaseConfig, DatabaseConfig
 from src.meeting_room_mcp.server.services.email_sevice import EmailService
 from src.meeting_room_mcp.server.services import RoomService
 from src.meeting_room_mcp.server.reservation.reservation_service import ReservationService
+from src.meeting_room_mcp.server.room.availability_index import AvailabilityIndex
+from src.meeting_room_mcp.server.migrations import run_migrations
+from src.meeting_room_mcp.server.read_cache import ReadCache
+from src.meeting_room_mcp.server.tool_metrics import ToolMetrics, ToolMetricsMiddleware
 
 # 설정 로드
+settings = get_settings()
 db_settings = get_db_settings()
 email_settings = get_email_settings()
 
@@ -23,63 +39,304 @@ email_settings = get_email_settings()
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-# FastMCP 앱 생성
-app = FastMCP("Meeting Room MCP Server")
+# 데이터베이스 URL (DatabaseSettings 기준)
+database_url = db_settings.database_url
 
-# SQLite 개발용 데이터베이스 URL
-from pathlib import Path
 
-project_root = Path(__file__).parent.parent.parent.parent
-database_url = f"sqlite:///{project_root / 'data' / 'meeting_room.db'}"
+class MeetingRoomServer:
+    """MCP 서버 구성 요소
 
-# 전역 객체들
-db_config = DatabaseConfig(database_url)
-room_service = RoomService(db_config)
-reservation_service = ReservationService(db_config)
+    엔진/커넥션 풀과 서비스는 프로세스마다 따로 만들어야 하므로 모듈 전역이 아닌
+    인스턴스로 묶는다. HTTP 모드에서는 uvicorn 워커마다 하나씩 생성된다.
+    """
 
-email_service = EmailService(
-    smtp_server=email_settings.smtp_host,
-    smtp_port=email_settings.smtp_port,
-    username=email_settings.smtp_user,
-    password=email_settings.smtp_pass,
-    use_tls=email_settings.smtp_tls,
-    mock_mode=email_settings.mock_mode
-)
+    def __init__(
+            self,
+            use_availability_index: bool = settings.availability_index_enabled,
+            use_read_cache: bool = settings.read_cache_enabled
+    ):
+        self.db_config = DatabaseConfig(database_url, db_settings)  # 테이블 생성/마이그레이션용 동기 연결
+        self.async_db_config = AsyncDatabaseConfig(database_url, db_settings)  # 도구 호출용 비동기 연결
+        self.availability_index = AvailabilityIndex() if use_availability_index else None
+        self.read_cache = ReadCache(
+            settings.read_cache_max_entries, settings.read_cache_ttl
+        ) if use_read_cache else None
+        self.replica_sync_task = None
+        # 리마인더는 아웃박스를 거쳐 발송
+        self.reminder_scheduler = ReminderScheduler(
+            self.async_db_config,
+            offsets=email_settings.reminder_offset_list,
+            horizon=email_settings.reminder_horizon,
+            scan_interval=email_settings.reminder_scan_interval
+        ) if email_settings.outbox_enabled and email_settings.reminder_enabled else None
+        self.room_service = RoomService(self.async_db_config, self.availability_index, self.read_cache)
+        self.reservation_service = ReservationService(
+            self.async_db_config,
+            self.availability_index,
+            self.read_cache,
+            email_settings.outbox_enabled,
+            self.reminder_scheduler
+        )
 
-def main():
-    """서버 시작"""
-    try:
-        logger.info("=== Meeting Room MCP Server 시작 ===")
-        logger.info(f"데이터베이스: {database_url}")
+        self.email_service = EmailService(
+            smtp_server=email_settings.smtp_host,
+            smtp_port=email_settings.smtp_port,
+            username=email_settings.smtp_user,
+            password=email_settings.smtp_pass,
+            use_tls=email_settings.smtp_tls,
+            mock_mode=email_settings.mock_mode,
+            pool_size=email_settings.smtp_pool_size,
+            max_connection_age=email_settings.smtp_max_connection_age,
+            noop_interval=email_settings.smtp_noop_interval,
+            timeout=email_settings.smtp_timeout,
+            batch_recipients=email_settings.smtp_batch_recipients,
+            template_dir=email_settings.template_dir,
+            template_auto_reload=email_settings.template_auto_reload,
+            template_reload_interval=email_settings.template_reload_interval
+        )
+        self.notification_queue = NotificationQueue(
+            workers=email_settings.queue_workers,
+            max_pending=email_settings.queue_max_pending,
+            max_attempts=email_settings.send_max_attempts,
+            retry_base_delay=email_settings.retry_base_delay,
+            retry_max_delay=email_settings.retry_max_delay
+        )
+        self.notification_relay = NotificationRelay(
+            self.async_db_config,
+            self.email_service,
+            batch_size=email_settings.outbox_batch_size,
+            poll_interval=email_settings.outbox_poll_interval,
+            concurrency=email_settings.queue_workers,
+            max_attempts=email_settings.send_max_attempts,
+            retry_base_delay=email_settings.retry_base_delay,
+            retry_max_delay=email_settings.retry_max_delay,
+            claim_timeout=email_settings.outbox_claim_timeout,
+            coalesce_window=email_settings.outbox_coalesce_window
+        ) if email_settings.outbox_enabled else None
+
+        # FastMCP 앱 생성 및 MCP 도구 등록 (모든 도구 호출은 지표 미들웨어를 거침)
+        self.tool_metrics = ToolMetrics()
+        self.app = FastMCP("Meeting Room MCP Server")
+        self.app.add_middleware(ToolMetricsMiddleware(self.tool_metrics))
+        register_room_tools(self.app, self.room_service)
+        register_reservation_tools(self.app, self.room_service, self.reservation_service)
+        register_notification_tools(
+            self.app,
+            self.room_service,
+            self.reservation_service,
+            self.email_service,
+            self.notification_queue,
+            self.notification_relay
+        )
+
+        @self.app.resource("metrics://database/pool")
+        def database_pool_metrics() -> dict:
+            """커넥션 풀 상태 및 체크아웃 대기/고갈 지표"""
+            return {
+                'sync': self.db_config.pool_status(),
+                'async': self.async_db_config.pool_status()
+            }
+
+        @self.app.resource("metrics://cache/read")
+        def read_cache_metrics() -> dict:
+            """조회 응답 캐시 적중/실패/제거 지표"""
+            return self.read_cache.stats() if self.read_cache else {'enabled': False}
+
+        @self.app.resource("metrics://rooms/search")
+        def room_search_metrics() -> dict:
+            """회의실 검색 실행/병합(coalesced) 횟수"""
+            return self.room_service.search_flights.stats()
+
+        @self.app.resource("metrics://notifications/queue")
+        def notification_queue_metrics() -> dict:
+            """알림 발송 대기열 상태 및 발송/재시도/실패 수"""
+            return self.notification_queue.stats()
+
+        @self.app.resource("metrics://notifications/outbox")
+        async def notification_outbox_metrics() -> dict:
+            """알림 아웃박스 상태별 건수 및 릴레이 발송/재시도/dead 수"""
+            return await self.notification_relay.stats() if self.notification_relay else {'enabled': False}
+
+        @self.app.resource("metrics://notifications/reminders")
+        def reminder_scheduler_metrics() -> dict:
+            """예약된 리마인더 수, 다음 발송 시각, 조회/등록 지표"""
+            return self.reminder_scheduler.stats() if self.reminder_scheduler else {'enabled': False}
+
+        @self.app.resource("metrics://email/smtp")
+        def smtp_pool_metrics() -> dict:
+            """SMTP 커넥션 풀 연결 생성/재사용/폐기 수"""
+            return self.email_service.smtp_pool.stats()
 
-        # 데이터베이스 연결 확인 및 테이블 생성
-        db_config.create_tables()
-        
-        if not db_config.health_check():
+        @self.app.resource("metrics://tools")
+        def tool_metrics() -> dict:
+            """도구별 호출/오류 수와 지연 시간 분위수"""
+            return self.tool_metrics.snapshot()
+
+        @self.app.custom_route(settings.mcp_metrics_path, methods=["GET"])
+        async def prometheus_metrics(request: Request) -> PlainTextResponse:
+            """HTTP 모드 Prometheus 지표 (워커마다 따로 집계하므로 시계열에 worker 레이블)"""
+            return PlainTextResponse(self.tool_metrics.to_prometheus(), media_type="text/plain; version=0.0.4")
+
+    async def initialize_database(self):
+        """테이블 생성, 마이그레이션, 샘플 데이터 초기화 (배포당 한 번)"""
+        self.db_config.create_tables()
+        run_migrations(self.db_config)
+
+        if not self.db_config.health_check():
             logger.warning("데이터베이스 연결 실패 - 계속 진행")
-        else:
-            # 샘플 데이터 초기화
-            room_service.initialize_sample_data()
+            return
+
+        await self.room_service.initialize_sample_data()
+        self.db_config.sync_sqlite_replicas()
+
+    async def startup(self):
+        """프로세스별 초기화"""
+        # 로컬 SQLite 복제본 파일 주기적 동기화
+        if db_settings.replica_sync_interval > 0 and self.db_config.sync_sqlite_replicas():
+            self.replica_sync_task = asyncio.create_task(self.sync_replicas_periodically())
 
-        # MCP 도구 등록
-        register_room_tools(app, room_service)
-        register_reservation_tools(app, room_service, reservation_service)
-        register_notification_tools(app, room_service, reservation_service, email_service)
+        # 가용성 인덱스 로드 후 SQL 결과와 비교
+        if self.availability_index is not None:
+            await self.room_service.load_availability_index()
+            now = datetime.now()
+            await self.room_service.check_availability_consistency(now, now + timedelta(hours=1))
 
         # 이메일 서비스 테스트
-        if email_service.test_connection():
+        if await asyncio.to_thread(self.email_service.test_connection):
             logger.info("이메일 서비스 준비 완료")
         else:
             logger.warning("이메일 서비스 연결 실패 - 모의 모드로 진행")
 
-        app.run()
+        await self.notification_queue.start()
+        if self.notification_relay is not None:
+            await self.notification_relay.start()
+        if self.reminder_scheduler is not None:
+            await self.reminder_scheduler.start()
+
+    async def sync_replicas_periodically(self):
+        """SQLite 복제본 파일을 replica_sync_interval마다 프라이머리와 동기화"""
+        while True:
+            await asyncio.sleep(db_settings.replica_sync_interval)
+            try:
+                await asyncio.to_thread(self.db_config.sync_sqlite_replicas)
+            except Exception as e:
+                logger.warning(f"SQLite 복제본 동기화 실패: {e}")
+
+    async def shutdown(self):
+        """알림 대기열/릴레이/리마인더 정리 후 커넥션 풀 정리"""
+        if self.reminder_scheduler is not None:
+            await self.reminder_scheduler.stop()
+        if self.notification_relay is not None:
+            await self.notification_relay.stop()
+        await self.notification_queue.stop()
+        self.email_service.close()
+
+        if self.replica_sync_task is not None:
+            self.replica_sync_task.cancel()
+
+        await self.async_db_config.close()
+        self.db_config.close()
+
+    def http_app(self) -> Starlette:
+        """Streamable HTTP ASGI 앱 (워커 시작/종료 시 초기화/풀 정리)"""
+        # 여러 워커가 요청을 나눠 받으므로 세션 상태를 프로세스에 두지 않는다
+        http_app = self.app.http_app(path=settings.mcp_http_path, stateless_http=True)
+        mcp_lifespan = http_app.router.lifespan_context
+
+        @asynccontextmanager
+        async def lifespan(app: Starlette):
+            await self.startup()
+            try:
+                async with mcp_lifespan(app):
+                    yield
+            finally:
+                await self.shutdown()
+                logger.info("워커 종료")
+
+        http_app.router.lifespan_context = lifespan
+        return http_app
+
+
+def check_http_workers():
+    """멀티 워커 HTTP 모드 설정 확인
+
+    send_notification 작업 상태는 아웃박스(DB)에 남아야 다른 워커로 간 get_notification_status 요청에서도
+    조회된다. 아웃박스를 끄면 작업이 프로세스 내 대기열에만 있으므로 멀티 워커로 띄우지 않는다.
+    """
+    if settings.mcp_http_workers > 1 and not email_settings.outbox_enabled:
+        raise ValueError("멀티 워커 HTTP 모드(MCP_HTTP_WORKERS > 1)에는 EMAIL_OUTBOX_ENABLED=True가 필요합니다")
+
+
+def create_http_app() -> Starlette:
+    """uvicorn 워커마다 호출되는 ASGI 앱 팩토리"""
+    check_http_workers()
+    # 인메모리 인덱스/캐시는 다른 워커의 예약 변경을 알 수 없으므로 멀티 워커에서는 사용하지 않음
+    single_worker = settings.mcp_http_workers == 1
+    return MeetingRoomServer(
+        settings.availability_index_enabled and single_worker,
+        settings.read_cache_enabled and single_worker
+    ).http_app()
+
+
+def main():
+    """서버 시작"""
+    logger.info("=== Meeting Room MCP Server 시작 ===")
+    logger.info(f"데이터베이스: {make_url(database_url)!r}")
+
+    if settings.mcp_transport == "http":
+        serve_http()
+    else:
+        asyncio.run(serve_stdio())
+
+
+async def serve_stdio():
+    """stdio 모드 서버 실행"""
+    server = MeetingRoomServer()
+    try:
+        await server.initialize_database()
+        await server.startup()
+        await server.app.run_async()
 
     except Exception as e:
         logger.error(f"서버 실행 오류: {e}")
         raise
     finally:
-        db_config.close()
+        await server.shutdown()
         logger.info("서버 종료")
 
+
+def serve_http():
+    """Streamable HTTP 모드 서버 실행 (멀티 워커)"""
+    check_http_workers()
+    if settings.availability_index_enabled and settings.mcp_http_workers > 1:
+        logger.warning("멀티 워커 모드에서는 가용성 인덱스를 사용하지 않습니다")
+    if settings.read_cache_enabled and settings.mcp_http_workers > 1:
+        logger.warning("멀티 워커 모드에서는 조회 응답 캐시를 사용하지 않습니다")
+
+    # 테이블/샘플 데이터는 워커를 띄우기 전에 한 번만 준비
+    async def prepare():
+        server = MeetingRoomServer(use_availability_index=False, use_read_cache=False)
+        try:
+            await server.initialize_database()
+        finally:
+            await server.shutdown()
+
+    asyncio.run(prepare())
+
+    logger.info(
+        f"HTTP 모드: http://{settings.api_host}:{settings.api_port}{settings.mcp_http_path} "
+        f"(워커 {settings.mcp_http_workers}개)"
+    )
+    uvicorn.run(
+        "src.meeting_room_mcp.server.main:create_http_app",
+        factory=True,
+        host=settings.api_host,
+        port=settings.api_port,
+        workers=settings.mcp_http_workers,
+        timeout_graceful_shutdown=settings.mcp_graceful_shutdown_timeout
+    )
+    logger.info("서버 종료")
+
+
 if __name__ == "__main__":
-    app.run()  # stdIo
+    main()
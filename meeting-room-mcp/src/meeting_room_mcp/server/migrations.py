@@ -0,0 +1,150 @@
+"""
+데이터 마이그레이션
+
+create_tables()가 새 테이블을 만든 뒤, 기존 데이터를 새 구조로 옮기는 작업을 한 번씩만 실행한다.
+"""
+
+import logging
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Column, DateTime, MetaData, String, inspect, select, text
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import CreateTable
+from sqlalchemy.sql import func
+
+from src.meeting_room_mcp.config.database_config import Base, DatabaseConfig
+from src.meeting_room_mcp.server.entities import ReservationEntity
+from src.meeting_room_mcp.server.notification.notification_models import NotificationOutboxEntity
+from src.meeting_room_mcp.server.room.room_models import MeetingRoomEntity
+
+logger = logging.getLogger(__name__)
+
+
+class SchemaMigrationEntity(Base):
+    """적용된 마이그레이션 기록 테이블"""
+    __tablename__ = 'schema_migrations'
+
+    name = Column(String(100), primary_key=True)
+    applied_at = Column(DateTime, nullable=False, default=func.now())
+
+
+def backfill_room_equipment(session: Session) -> int:
+    """equipment 텍스트 컬럼에서 회의실-장비 연관 테이블 백필"""
+    rooms = session.query(MeetingRoomEntity).filter(
+        ~MeetingRoomEntity.equipment_tags.any()
+    ).all()
+
+    for room in rooms:
+        room.sync_equipment_tags()
+
+    return len(rooms)
+
+
+def backfill_reservation_participants(session: Session) -> int:
+    """participants JSON 컬럼에서 예약-참가자 연관 테이블 백필"""
+    reservations = session.query(ReservationEntity).filter(
+        ~ReservationEntity.participant_links.any()
+    ).all()
+
+    for reservation in reservations:
+        reservation.sync_participants()
+
+    return len(reservations)
+
+
+def create_room_pagination_indexes(session: Session) -> int:
+    """기존 meeting_rooms 테이블에 키셋 페이지네이션용 인덱스 추가 (create_all은 기존 테이블에 인덱스를 추가하지 않음)"""
+    indexes = [
+        index for index in MeetingRoomEntity.__table__.indexes
+        if index.name in ('idx_meeting_rooms_capacity_name', 'idx_meeting_rooms_location_capacity')
+    ]
+
+    for index in indexes:
+        index.create(session.connection(), checkfirst=True)
+
+    return len(indexes)
+
+
+def rebuild_reservations_autoincrement(session: Session) -> int:
+    """기존 SQLite reservations 테이블을 AUTOINCREMENT 테이블로 재생성 (삭제된 최대 ID 재사용 방지)
+
+    SQLite는 AUTOINCREMENT가 없으면 마지막 행을 지운 뒤 같은 ID를 다시 발급해, 예약 ID를 포함한
+    알림 중복 방지 키가 이전 예약의 아웃박스 행과 충돌한다. MySQL(InnoDB 8.0 이상)은 ID를 재사용하지 않는다.
+    """
+    connection = session.connection()
+    if connection.dialect.name != 'sqlite':
+        return 0
+
+    table = ReservationEntity.__table__
+    current_sql = connection.execute(
+        text("SELECT sql FROM sqlite_master WHERE type = 'table' AND name = :name"), {'name': table.name}
+    ).scalar()
+    if current_sql is None or 'AUTOINCREMENT' in current_sql.upper():
+        return 0
+
+    # 외래 키 대상 테이블도 같은 메타데이터에 있어야 CREATE TABLE을 만들 수 있다
+    metadata = MetaData()
+    MeetingRoomEntity.__table__.to_metadata(metadata)
+    rebuilt = table.to_metadata(metadata, name=f"{table.name}_rebuild")
+    columns = ', '.join(column.name for column in table.columns)
+    connection.execute(CreateTable(rebuilt))
+    count = connection.execute(
+        text(f"INSERT INTO {rebuilt.name} ({columns}) SELECT {columns} FROM {table.name}")
+    ).rowcount
+    connection.execute(text(f"DROP TABLE {table.name}"))
+    connection.execute(text(f"ALTER TABLE {rebuilt.name} RENAME TO {table.name}"))
+    for index in table.indexes:
+        index.create(connection)
+
+    # 이미 지워진 예약 ID도 아웃박스에 남아 있으면 다시 발급하지 않도록 시퀀스를 맞춘다
+    last_id = max(
+        connection.execute(select(func.max(table.c.id))).scalar() or 0,
+        connection.execute(select(func.max(NotificationOutboxEntity.reservation_id))).scalar() or 0
+    )
+    connection.execute(text("DELETE FROM sqlite_sequence WHERE name = :name"), {'name': table.name})
+    connection.execute(
+        text("INSERT INTO sqlite_sequence (name, seq) VALUES (:name, :seq)"), {'name': table.name, 'seq': last_id}
+    )
+    return count
+
+
+def add_outbox_delivered_to(session: Session) -> int:
+    """기존 notification_outbox 테이블에 수신자별 발송 기록 컬럼 추가 (create_all은 기존 테이블에 컬럼을 추가하지 않음)"""
+    connection = session.connection()
+    table = NotificationOutboxEntity.__table__
+    if 'delivered_to' in {column['name'] for column in inspect(connection).get_columns(table.name)}:
+        return 0
+
+    connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN delivered_to TEXT"))
+    return 1
+
+
+# (이름, 실행 함수) - 이름 순서대로 적용
+MIGRATIONS: List[Tuple[str, Callable[[Session], int]]] = [
+    ('0001_backfill_room_equipment', backfill_room_equipment),
+    ('0002_backfill_reservation_participants', backfill_reservation_participants),
+    ('0003_create_room_pagination_indexes', create_room_pagination_indexes),
+    ('0004_rebuild_reservations_autoincrement', rebuild_reservations_autoincrement),
+    ('0005_add_outbox_delivered_to', add_outbox_delivered_to),
+]
+
+
+def run_migrations(db_config: DatabaseConfig):
+    """아직 적용되지 않은 마이그레이션 실행"""
+    with db_config.get_session() as session:
+        applied = {name for (name,) in session.query(SchemaMigrationEntity.name).all()}
+
+        for name, migrate in MIGRATIONS:
+            if name in applied:
+                continue
+
+            try:
+                count = migrate(session)
+                session.add(SchemaMigrationEntity(name=name))
+                session.commit()
+                logger.info(f"마이그레이션 적용 완료: {name} ({count}건)")
+
+            except Exception as e:
+                session.rollback()
+                logger.error(f"마이그레이션 실패: {name}: {e}")
+                raise
@@ -0,0 +1,124 @@
+"""
+알림 아웃박스 엔티티
+"""
+
+import json
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Optional, Set
+
+from sqlalchemy import Column, DateTime, Index, Integer, String, Text
+from sqlalchemy.sql import func
+
+from src.meeting_room_mcp.config.database_config import Base
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+
+# 아웃박스 행 상태
+OUTBOX_PENDING = 'pending'
+OUTBOX_SENT = 'sent'
+OUTBOX_DEAD = 'dead'
+
+
+@dataclass
+class OutboxMessage:
+    """릴레이가 선점한 알림"""
+    id: int
+    notification_type: str
+    reservation: Reservation
+    attempts: int
+    minutes_before: Optional[int] = None  # 리마인더 알림의 회의 시작 전 분
+    message: str = ""  # send_notification 도구로 요청한 추가 메시지 (취소 사유)
+    delivered: Set[str] = field(default_factory=set)  # 이전 시도에서 이미 받은 수신자 (재시도 시 제외)
+
+
+@dataclass
+class OutboxStatus:
+    """아웃박스 알림 진행 상황 (send_notification 작업 조회용)"""
+    notification_type: str
+    reservation_id: int
+    status: str
+    attempts: int
+    claimed: bool  # 릴레이가 선점해 발송 중인지
+    next_attempt_at: datetime
+    created_at: datetime
+    sent_at: Optional[datetime]
+    last_error: Optional[str]
+
+
+class NotificationOutboxEntity(Base):
+    """발송할 알림 테이블 (예약 생성/삭제와 같은 트랜잭션에서 기록)"""
+    __tablename__ = 'notification_outbox'
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    dedupe_key = Column(String(100), nullable=False, unique=True)  # 같은 알림을 두 번 기록하지 않도록
+    notification_type = Column(String(20), nullable=False)  # confirmation, cancellation, reminder
+    reservation_id = Column(Integer, nullable=False)  # 삭제된 예약도 남아야 하므로 외래 키 없음
+    payload = Column(Text, nullable=False)  # 기록 시점 예약 정보 JSON
+    status = Column(String(10), nullable=False, default=OUTBOX_PENDING)
+    attempts = Column(Integer, nullable=False, default=0)
+    next_attempt_at = Column(DateTime, nullable=False, default=func.now())
+    claim_token = Column(String(32), nullable=True)  # 발송 중인 릴레이 식별자
+    last_error = Column(Text, nullable=True)
+    delivered_to = Column(Text, nullable=True)  # 이미 받은 수신자 JSON 배열 (일부 수신자만 실패한 경우)
+    created_at = Column(DateTime, nullable=False, default=func.now())
+    sent_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index('idx_notification_outbox_status_next', 'status', 'next_attempt_at'),
+    )
+
+    def to_message(self) -> OutboxMessage:
+        """엔티티를 릴레이용 알림으로 변환 (기록 시점 예약 정보 복원)"""
+        data = json.loads(self.payload)
+        reservation = Reservation(
+            id=data['id'],
+            room_id=data['room_id'],
+            title=data['title'],
+            description=data['description'],
+            start_time=datetime.fromisoformat(data['start_time']),
+            end_time=datetime.fromisoformat(data['end_time']),
+            organizer_email=data['organizer_email'],
+            participants=data['participants']
+        )
+        return OutboxMessage(
+            self.id,
+            self.notification_type,
+            reservation,
+            self.attempts,
+            data.get('minutes_before'),
+            data.get('message', ""),
+            set(json.loads(self.delivered_to or '[]'))
+        )
+
+    def to_status(self) -> OutboxStatus:
+        """엔티티를 진행 상황으로 변환"""
+        return OutboxStatus(
+            notification_type=self.notification_type,
+            reservation_id=self.reservation_id,
+            status=self.status,
+            attempts=self.attempts,
+            claimed=self.claim_token is not None,
+            next_attempt_at=self.next_attempt_at,
+            created_at=self.created_at,
+            sent_at=self.sent_at,
+            last_error=self.last_error
+        )
+
+
+def outbox_payload(reservation: Reservation, minutes_before: Optional[int] = None, message: str = "") -> str:
+    """아웃박스에 저장할 예약 정보 JSON (리마인더는 회의 시작 전 분, 도구 요청은 추가 메시지 포함)"""
+    data = {
+        'id': reservation.id,
+        'room_id': reservation.room_id,
+        'title': reservation.title,
+        'description': reservation.description,
+        'start_time': reservation.start_time.isoformat(),
+        'end_time': reservation.end_time.isoformat(),
+        'organizer_email': reservation.organizer_email,
+        'participants': reservation.participants
+    }
+    if minutes_before is not None:
+        data['minutes_before'] = minutes_before
+    if message:
+        data['message'] = message
+    return json.dumps(data, ensure_ascii=False)
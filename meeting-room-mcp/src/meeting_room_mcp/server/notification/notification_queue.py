@@ -0,0 +1,219 @@
+"""
+이메일 알림 발송 대기열 (프로세스 내 큐 + 백그라운드 워커 풀)
+"""
+
+import asyncio
+import logging
+import random
+import uuid
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Callable, Dict, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+# 작업 상태
+QUEUED = 'queued'
+SENDING = 'sending'
+RETRYING = 'retrying'
+SENT = 'sent'
+FAILED = 'failed'
+
+FINISHED_STATUSES = (SENT, FAILED)
+
+
+@dataclass
+class NotificationJob:
+    """알림 발송 작업"""
+    job_id: str
+    notification_type: str
+    reservation_id: int
+    send: Callable[[], bool]  # 블로킹 발송 함수 (성공 여부 반환)
+    max_attempts: int
+    status: str = QUEUED
+    attempts: int = 0
+    last_error: Optional[str] = None
+    next_attempt_at: Optional[datetime] = None
+    created_at: datetime = field(default_factory=datetime.now)
+    finished_at: Optional[datetime] = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in FINISHED_STATUSES
+
+
+class NotificationQueue:
+    """알림 발송 대기열
+
+    도구 호출은 작업을 넣고 바로 작업 ID를 돌려받는다. 워커 workers개가 대기열에서 작업을 꺼내
+    스레드에서 발송하고, 실패하면 지수 백오프(full jitter) 후 다시 대기열에 넣는다.
+    재시도 대기 중에는 워커를 점유하지 않는다. 작업 기록은 프로세스 메모리에만 남으므로
+    아웃박스를 끈 단일 프로세스 구성에서만 send_notification에 쓰인다.
+    """
+
+    def __init__(
+            self,
+            workers: int = 4,
+            max_pending: int = 1000,
+            max_attempts: int = 5,
+            retry_base_delay: float = 1.0,
+            retry_max_delay: float = 60.0,
+            max_retained_jobs: int = 10000
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.max_retained_jobs = max_retained_jobs
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker_tasks: list = []
+        self._retry_handles: Set[asyncio.TimerHandle] = set()
+        self._jobs: "OrderedDict[str, NotificationJob]" = OrderedDict()
+        self._pending = 0
+
+        self.sent = 0
+        self.failed = 0
+        self.retries = 0
+
+    async def start(self):
+        """워커 시작"""
+        if self._worker_tasks:
+            return
+
+        self._queue = asyncio.Queue()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker(), name=f"notification-worker-{i}") for i in range(self.workers)
+        ]
+        logger.info(f"알림 발송 워커 {self.workers}개 시작")
+
+    async def stop(self, timeout: float = 10.0):
+        """대기 중인 작업을 timeout초까지 처리한 뒤 워커 종료 (재시도 대기 작업은 실패 처리하지 않고 중단)"""
+        if not self._worker_tasks:
+            return
+
+        for handle in self._retry_handles:
+            handle.cancel()
+        self._retry_handles.clear()
+
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"알림 대기열 종료 대기 시간 초과 - 남은 작업 {self._queue.qsize()}개")
+
+        for task in self._worker_tasks:
+            task.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+
+    def submit(self, notification_type: str, reservation_id: int, send: Callable[[], bool]) -> NotificationJob:
+        """발송 작업 추가 (대기열이 가득 차면 ValueError)"""
+        if self._queue is None:
+            raise RuntimeError("알림 대기열이 시작되지 않았습니다")
+        if self._pending >= self.max_pending:
+            raise ValueError("알림 대기열이 가득 찼습니다. 잠시 후 다시 시도해주세요")
+
+        job = NotificationJob(
+            job_id=uuid.uuid4().hex[:12],
+            notification_type=notification_type,
+            reservation_id=reservation_id,
+            send=send,
+            max_attempts=self.max_attempts
+        )
+        self._jobs[job.job_id] = job
+        self._prune_jobs()
+
+        self._pending += 1
+        self._queue.put_nowait(job)
+        return job
+
+    def get_job(self, job_id: str) -> Optional[NotificationJob]:
+        """작업 조회"""
+        return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        """대기열 지표"""
+        return {
+            'workers': len(self._worker_tasks),
+            'pending': self._pending,
+            'queued': self._queue.qsize() if self._queue else 0,
+            'retry_scheduled': len(self._retry_handles),
+            'sent': self.sent,
+            'failed': self.failed,
+            'retries': self.retries
+        }
+
+    async def _worker(self):
+        """대기열에서 작업을 꺼내 발송"""
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._attempt(job)
+            except Exception as e:
+                logger.error(f"알림 발송 워커 오류: job={job.job_id}, {e}")
+            finally:
+                self._queue.task_done()
+
+    async def _attempt(self, job: NotificationJob):
+        """발송 1회 시도 후 성공/재시도/실패 처리"""
+        job.status = SENDING
+        job.attempts += 1
+        job.next_attempt_at = None
+
+        try:
+            success = await asyncio.to_thread(job.send)
+            if not success:
+                job.last_error = "이메일 발송에 실패했습니다"
+        except Exception as e:
+            success = False
+            job.last_error = str(e)
+
+        if success:
+            self._finish(job, SENT)
+            self.sent += 1
+            logger.info(f"알림 발송 완료: job={job.job_id}, 예약={job.reservation_id}, 시도={job.attempts}")
+            return
+
+        if job.attempts >= job.max_attempts:
+            self._finish(job, FAILED)
+            self.failed += 1
+            logger.error(f"알림 발송 최종 실패: job={job.job_id}, 예약={job.reservation_id}, {job.last_error}")
+            return
+
+        # 재시도 대기 중에는 워커를 점유하지 않도록 타이머로 다시 넣는다
+        delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** (job.attempts - 1)))
+        job.status = RETRYING
+        job.next_attempt_at = datetime.now() + timedelta(seconds=delay)
+        self.retries += 1
+        logger.warning(
+            f"알림 발송 실패 - {delay:.1f}초 후 재시도 ({job.attempts}/{job.max_attempts}): "
+            f"job={job.job_id}, {job.last_error}"
+        )
+
+        handle = None
+
+        def requeue():
+            self._retry_handles.discard(handle)
+            job.status = QUEUED
+            self._queue.put_nowait(job)
+
+        handle = asyncio.get_running_loop().call_later(delay, requeue)
+        self._retry_handles.add(handle)
+
+    def _finish(self, job: NotificationJob, status: str):
+        """작업 종료 처리"""
+        job.status = status
+        job.finished_at = datetime.now()
+        self._pending -= 1
+
+    def _prune_jobs(self):
+        """보관 한도를 넘으면 오래된 완료 작업 기록부터 삭제"""
+        if len(self._jobs) <= self.max_retained_jobs:
+            return
+
+        for job_id in [job_id for job_id, job in self._jobs.items() if job.finished]:
+            del self._jobs[job_id]
+            if len(self._jobs) <= self.max_retained_jobs:
+                break
@@ -0,0 +1,340 @@
+"""
+알림 아웃박스 릴레이 (아웃박스 테이블을 일괄로 읽어 이메일 발송)
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+import uuid
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.meeting_room_mcp.config.database_config import AsyncDatabaseConfig
+from src.meeting_room_mcp.server.notification.notification_models import OutboxMessage, OutboxStatus
+from src.meeting_room_mcp.server.notification.notification_repository import (
+    CANCELLATION, CONFIRMATION, REMINDER, NotificationOutboxRepository, job_dedupe_key
+)
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+from src.meeting_room_mcp.server.room.room_repository import RoomRepository
+from src.meeting_room_mcp.server.services.email_sevice import ComposedEmail, EmailService
+from src.meeting_room_mcp.shared.models import MeetingRoom
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationRelay:
+    """알림 아웃박스 릴레이
+
+    poll_interval초마다 발송할 때가 된 알림을 batch_size건씩 선점해 동시에 최대 concurrency건 발송하고,
+    결과를 한 트랜잭션으로 기록한다. 실패하면 지수 백오프(full jitter) 후 다시 시도하고,
+    max_attempts번 실패하면 dead 상태로 남긴다. 알림마다 받은 수신자를 기록해 두고 재시도 때는 받지 못한
+    수신자에게만 다시 보낸다. 선점한 알림은 claim_timeout초 동안 다른 릴레이(워커)가
+    가져가지 않으며, 그 안에 결과를 기록하지 못하면(프로세스 종료, 느린 발송 등) 다시 발송 대상이 된다.
+    그 사이 다른 릴레이가 다시 선점한 알림의 늦은 결과는 기록하지 않는다.
+
+    coalesce_window초를 주면 가장 오래 기다린 알림이 그만큼 쌓일 때까지 선점을 미루고, 한 묶음 안에서
+    같은 수신자에게 갈 알림이 여럿이면 알림 모음 메일 1건으로 합쳐 보낸다. 수신자에게 갈 내용이 같은
+    알림(제목과 본문 해시가 같음)은 한 번만 보낸다.
+    """
+
+    def __init__(
+            self,
+            db_config: AsyncDatabaseConfig,
+            email_service: EmailService,
+            batch_size: int = 50,
+            poll_interval: float = 1.0,
+            concurrency: int = 4,
+            max_attempts: int = 5,
+            retry_base_delay: float = 1.0,
+            retry_max_delay: float = 60.0,
+            claim_timeout: float = 60.0,
+            coalesce_window: float = 0.0
+    ):
+        self.db_config = db_config
+        self.email_service = email_service
+        self.batch_size = batch_size
+        self.poll_interval = poll_interval
+        self.concurrency = concurrency
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.claim_timeout = claim_timeout
+        self.coalesce_window = coalesce_window
+
+        self._task: Optional[asyncio.Task] = None
+        self._token = uuid.uuid4().hex
+
+        self.batches = 0
+        self.sent = 0
+        self.retries = 0
+        self.dead = 0
+        self.lease_lost = 0
+        self.digests = 0
+        self.deduplicated = 0
+        self.saved_sends = 0
+
+    async def start(self):
+        """릴레이 시작"""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="notification-relay")
+            logger.info("알림 아웃박스 릴레이 시작")
+
+    async def stop(self):
+        """릴레이 종료 (발송 중인 알림은 선점 시간이 지나면 다시 발송 대상이 됨)"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    async def drain_once(self) -> int:
+        """발송할 때가 된 알림 한 묶음 처리 (처리 건수 반환)"""
+        now = datetime.now()
+        lease_until = now + timedelta(seconds=self.claim_timeout)
+        hold_until = now - timedelta(seconds=self.coalesce_window) if self.coalesce_window > 0 else None
+        claimed, rooms = await self.db_config.run_sync(lambda session: self._claim(session, lease_until, hold_until))
+        if not claimed:
+            return 0
+
+        if self.coalesce_window > 0:
+            errors = await self._deliver_coalesced(claimed, rooms)
+        else:
+            semaphore = asyncio.Semaphore(self.concurrency)
+
+            async def deliver(message: OutboxMessage) -> Optional[str]:
+                async with semaphore:
+                    return await self._deliver(message, rooms.get(message.reservation.room_id))
+
+            errors = await asyncio.gather(*(deliver(message) for message in claimed))
+
+        # 재시도/최종 실패에는 이번까지 받은 수신자를 함께 기록해 다음 시도에서 제외
+        sent: List[int] = []
+        retries: List[Tuple[int, datetime, str, Set[str]]] = []
+        dead: List[Tuple[int, str, Set[str]]] = []
+        for message, error in zip(claimed, errors):
+            if error is None:
+                sent.append(message.id)
+            elif message.attempts >= self.max_attempts:
+                dead.append((message.id, error, message.delivered))
+                logger.error(
+                    f"알림 발송 최종 실패: outbox={message.id}, {message.notification_type}, "
+                    f"예약={message.reservation.id}, {error}"
+                )
+            else:
+                delay = random.uniform(0, min(self.retry_max_delay, self.retry_base_delay * 2 ** (message.attempts - 1)))
+                retries.append((message.id, datetime.now() + timedelta(seconds=delay), error, message.delivered))
+                logger.warning(
+                    f"알림 발송 실패 - {delay:.1f}초 후 재시도 ({message.attempts}/{self.max_attempts}): "
+                    f"outbox={message.id}, {error}"
+                )
+
+        lost = set(await self.db_config.run_sync(
+            lambda session: NotificationOutboxRepository(session).record_results(self._token, sent, retries, dead)
+        ))
+        if lost:
+            logger.warning(
+                f"선점 시간이 지나 다른 릴레이가 가져간 알림 {len(lost)}건의 발송 결과는 기록하지 않음: "
+                f"outbox={sorted(lost)}"
+            )
+
+        self.batches += 1
+        self.sent += sum(1 for outbox_id in sent if outbox_id not in lost)
+        self.retries += sum(1 for outbox_id, *_ in retries if outbox_id not in lost)
+        self.dead += sum(1 for outbox_id, *_ in dead if outbox_id not in lost)
+        self.lease_lost += len(lost)
+        return len(claimed)
+
+    async def get_status(self, key: str) -> Optional[str]:
+        """중복 방지 키에 해당하는 알림 상태 (없으면 None)"""
+        def load(session: Session) -> Optional[str]:
+            entry = NotificationOutboxRepository(session).get_by_dedupe_key(key)
+            return entry.status if entry else None
+
+        return await self.db_config.run_sync(load, read_only=True)
+
+    async def submit(
+            self,
+            notification_type: str,
+            reservation: Reservation,
+            minutes_before: Optional[int] = None,
+            message: str = ""
+    ) -> str:
+        """send_notification 도구 요청 알림을 아웃박스에 기록하고 작업 ID 반환"""
+        job_id = uuid.uuid4().hex[:12]
+        await self.db_config.run_sync(
+            lambda session: NotificationOutboxRepository(session).add_job(
+                job_id, notification_type, reservation, minutes_before, message
+            )
+        )
+        return job_id
+
+    async def get_job(self, job_id: str) -> Optional[OutboxStatus]:
+        """작업 ID로 알림 진행 상황 조회 (다른 워커가 등록한 작업도 조회됨)"""
+        return await self.db_config.run_sync(
+            lambda session: NotificationOutboxRepository(session).get_status(job_dedupe_key(job_id))
+        )
+
+    async def stats(self) -> Dict[str, int]:
+        """상태별 알림 수 및 릴레이 처리 지표"""
+        counts = await self.db_config.run_sync(
+            lambda session: NotificationOutboxRepository(session).count_by_status()
+        )
+        return {
+            **counts,
+            'running': self._task is not None,
+            'batches': self.batches,
+            'relayed_sent': self.sent,
+            'relayed_retries': self.retries,
+            'relayed_dead': self.dead,
+            'lease_lost': self.lease_lost,
+            'coalesce_window': self.coalesce_window,
+            'digests': self.digests,
+            'deduplicated': self.deduplicated,
+            'saved_sends': self.saved_sends
+        }
+
+    async def _run(self):
+        """한 묶음이 가득 차면 바로 다음 묶음을, 아니면 poll_interval초 후 다시 확인"""
+        while True:
+            try:
+                if await self.drain_once() >= self.batch_size:
+                    continue
+            except Exception as e:
+                logger.error(f"알림 아웃박스 릴레이 오류: {e}")
+
+            await asyncio.sleep(self.poll_interval)
+
+    def _claim(
+            self,
+            session: Session,
+            lease_until: datetime,
+            hold_until: Optional[datetime]
+    ) -> Tuple[List[OutboxMessage], Dict[int, MeetingRoom]]:
+        """알림 선점 후 필요한 회의실 정보를 한 번에 조회"""
+        claimed = NotificationOutboxRepository(session).claim(self.batch_size, self._token, lease_until, hold_until)
+        if not claimed:
+            return [], {}
+
+        rooms = RoomRepository(session).get_by_ids(message.reservation.room_id for message in claimed)
+        return claimed, rooms
+
+    def _compose(self, message: OutboxMessage, room: Optional[MeetingRoom]) -> ComposedEmail:
+        """알림 1건을 메일로 렌더링"""
+        if room is None:
+            raise ValueError("회의실 정보를 찾을 수 없습니다")
+
+        if message.notification_type == CONFIRMATION:
+            return self.email_service.compose_confirmation(message.reservation, room)
+        if message.notification_type == CANCELLATION:
+            return self.email_service.compose_cancellation(message.reservation, room, message.message)
+        if message.notification_type == REMINDER:
+            return self.email_service.compose_reminder(message.reservation, room, message.minutes_before)
+        raise ValueError(f"지원하지 않는 알림 타입: {message.notification_type}")
+
+    async def _deliver(self, message: OutboxMessage, room: Optional[MeetingRoom]) -> Optional[str]:
+        """알림 1건을 아직 받지 않은 수신자에게 발송 (받은 수신자는 message.delivered에 추가, 실패 시 오류 메시지 반환)"""
+        try:
+            email = self._compose(message, room)
+            pending = pending_recipients(message, email)
+            if pending:
+                message.delivered |= await asyncio.to_thread(self.email_service.deliver_composed, email, pending)
+            return failed_recipients_error(message, pending)
+        except Exception as e:
+            return str(e)
+
+    async def _deliver_coalesced(
+            self,
+            claimed: List[OutboxMessage],
+            rooms: Dict[int, MeetingRoom]
+    ) -> List[Optional[str]]:
+        """선점한 알림을 수신자별로 모아 발송 (알림이 여럿인 수신자는 모음 메일 1건, 알림별 오류 메시지 반환)"""
+        messages = {message.id: message for message in claimed}
+        errors: Dict[int, Optional[str]] = {}
+        composed: Dict[int, ComposedEmail] = {}
+        pending: Dict[int, List[str]] = {}
+        for message in claimed:
+            try:
+                composed[message.id] = self._compose(message, rooms.get(message.reservation.room_id))
+                pending[message.id] = pending_recipients(message, composed[message.id])
+            except Exception as e:
+                errors[message.id] = str(e)
+
+        # 수신자별 받을 알림 (내용 해시 -> 처음 나온 알림 ID) 및 수신자에게 가는 모든 알림 ID (이미 받은 수신자 제외)
+        contents: Dict[str, Dict[str, int]] = {}
+        addressed: Dict[str, Set[int]] = {}
+        deduplicated = 0
+        for message_id, email in composed.items():
+            for recipient in pending[message_id]:
+                content_hash = hashlib.sha256(f"{email.subject}\0{email.text_for(recipient)}".encode()).hexdigest()
+                received = contents.setdefault(recipient, {})
+                if content_hash in received:
+                    deduplicated += 1
+                else:
+                    received[content_hash] = message_id
+                addressed.setdefault(recipient, set()).add(message_id)
+
+        def send_digest(recipient: str, emails: List[ComposedEmail]) -> Set[str]:
+            return {recipient} if self.email_service.send_digest(recipient, emails) else set()
+
+        # (받은 수신자를 반환하는 발송 함수, 인자)
+        sends: List[Tuple[Callable[..., Set[str]], tuple]] = []
+        direct: Dict[int, List[str]] = {}
+        for recipient, received in contents.items():
+            message_ids = list(received.values())
+            if len(message_ids) > 1:
+                sends.append((send_digest, (recipient, [composed[message_id] for message_id in message_ids])))
+            else:
+                direct.setdefault(message_ids[0], []).append(recipient)
+
+        for message_id, recipients in direct.items():
+            sends.append((self.email_service.deliver_composed, (composed[message_id], recipients)))
+
+        semaphore = asyncio.Semaphore(self.concurrency)
+
+        async def send(function: Callable[..., Set[str]], args: tuple) -> Set[str]:
+            async with semaphore:
+                try:
+                    return await asyncio.to_thread(function, *args)
+                except Exception as e:
+                    logger.error(f"알림 발송 오류: {e}")
+                    return set()
+
+        # 수신자가 받은 메일(모음 또는 단건)에 담긴 알림은 모두 그 수신자에게 전달된 것으로 기록
+        for delivered in await asyncio.gather(*(send(function, args) for function, args in sends)):
+            for recipient in delivered:
+                for message_id in addressed[recipient]:
+                    messages[message_id].delivered.add(recipient)
+
+        for message_id in composed:
+            errors[message_id] = failed_recipients_error(messages[message_id], pending[message_id])
+
+        # 합치지 않았다면 보냈을 SMTP 메시지 수와 실제 보낸 수의 차이
+        digests = sum(1 for received in contents.values() if len(received) > 1)
+        baseline = sum(self.email_service.message_count(len(recipients)) for recipients in pending.values())
+        actual = digests + sum(self.email_service.message_count(len(recipients)) for recipients in direct.values())
+
+        self.digests += digests
+        self.deduplicated += deduplicated
+        self.saved_sends += baseline - actual
+        if baseline > actual:
+            logger.info(
+                f"알림 {len(composed)}건을 메시지 {actual}건으로 발송 "
+                f"(모음 {digests}건, 중복 제외 {deduplicated}건, {baseline - actual}건 절약)"
+            )
+
+        return [errors[message.id] for message in claimed]
+
+
+def pending_recipients(message: OutboxMessage, email: ComposedEmail) -> List[str]:
+    """알림을 아직 받지 않은 수신자 (이전 시도에서 받은 수신자 제외, 중복 주소는 한 번)"""
+    return [recipient for recipient in dict.fromkeys(email.to_emails) if recipient not in message.delivered]
+
+
+def failed_recipients_error(message: OutboxMessage, pending: List[str]) -> Optional[str]:
+    """이번 시도에서 받지 못한 수신자가 있으면 오류 메시지"""
+    failed = [recipient for recipient in pending if recipient not in message.delivered]
+    if not failed:
+        return None
+    return f"이메일 발송에 실패한 수신자: {', '.join(failed)}"
@@ -0,0 +1,256 @@
+"""
+알림 아웃박스 데이터 접근 레이어
+"""
+
+import json
+import logging
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import bindparam, func, insert, update
+from sqlalchemy.orm import Session
+
+from src.meeting_room_mcp.server.notification.notification_models import (
+    OUTBOX_DEAD, OUTBOX_PENDING, OUTBOX_SENT, NotificationOutboxEntity, OutboxMessage, OutboxStatus, outbox_payload
+)
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+
+logger = logging.getLogger(__name__)
+
+# 아웃박스로 발송하는 알림 타입
+CONFIRMATION = 'confirmation'
+CANCELLATION = 'cancellation'
+REMINDER = 'reminder'
+
+
+def dedupe_key(notification_type: str, reservation_id: int) -> str:
+    """알림 중복 기록 방지 키"""
+    return f"{notification_type}:{reservation_id}"
+
+
+def job_dedupe_key(job_id: str) -> str:
+    """send_notification 도구로 요청한 알림의 중복 방지 키 (요청마다 새 작업 ID)"""
+    return f"job:{job_id}"
+
+
+def reminder_dedupe_key(reservation_id: int, occurrence_start: datetime, minutes_before: int) -> str:
+    """리마인더 중복 기록 방지 키 (예약 회차와 시작 전 분마다 한 번)"""
+    return f"{REMINDER}:{reservation_id}:{occurrence_start.strftime('%Y%m%d%H%M%S')}:{minutes_before}"
+
+
+def delivered_json(recipients: Iterable[str]) -> Optional[str]:
+    """이미 받은 수신자 목록 JSON (없으면 None)"""
+    recipients = sorted(recipients)
+    return json.dumps(recipients, ensure_ascii=False) if recipients else None
+
+
+class NotificationOutboxRepository:
+    """알림 아웃박스 데이터 접근 객체"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def add(self, notification_type: str, reservations: Iterable[Reservation]):
+        """알림 기록 (커밋하지 않음 - 예약 변경과 같은 트랜잭션으로 커밋)"""
+        rows = [
+            {
+                'dedupe_key': dedupe_key(notification_type, reservation.id),
+                'notification_type': notification_type,
+                'reservation_id': reservation.id,
+                'payload': outbox_payload(reservation),
+                'status': OUTBOX_PENDING,
+                'attempts': 0,
+                'next_attempt_at': datetime.now()
+            }
+            for reservation in reservations
+        ]
+        if rows:
+            self.session.execute(insert(NotificationOutboxEntity), rows)
+
+    def add_reminders(self, reminders: List[Tuple[Reservation, int]]) -> int:
+        """(회차 예약 정보, 시작 전 분) 리마인더 기록 후 커밋 (이미 기록된 것은 건너뛰고 새로 기록한 수 반환)"""
+        rows = [
+            {
+                'dedupe_key': reminder_dedupe_key(reservation.id, reservation.start_time, minutes_before),
+                'notification_type': REMINDER,
+                'reservation_id': reservation.id,
+                'payload': outbox_payload(reservation, minutes_before),
+                'status': OUTBOX_PENDING,
+                'attempts': 0,
+                'next_attempt_at': datetime.now()
+            }
+            for reservation, minutes_before in reminders
+        ]
+        if not rows:
+            return 0
+
+        try:
+            # 여러 워커의 스케줄러가 같은 리마인더를 기록해도 한 행만 남도록 중복 키는 무시
+            statement = insert(NotificationOutboxEntity.__table__).prefix_with(
+                'OR IGNORE', dialect='sqlite'
+            ).prefix_with('IGNORE', dialect='mysql')
+            inserted = self.session.connection().execute(statement, rows).rowcount
+            self.session.commit()
+            return inserted
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"리마인더 기록 실패: {e}")
+            raise
+
+    def add_job(
+            self,
+            job_id: str,
+            notification_type: str,
+            reservation: Reservation,
+            minutes_before: Optional[int] = None,
+            message: str = ""
+    ):
+        """send_notification 도구 요청 알림 기록 후 커밋 (어느 워커에서든 작업 ID로 상태 조회 가능)"""
+        try:
+            self.session.add(NotificationOutboxEntity(
+                dedupe_key=job_dedupe_key(job_id),
+                notification_type=notification_type,
+                reservation_id=reservation.id,
+                payload=outbox_payload(reservation, minutes_before, message),
+                status=OUTBOX_PENDING,
+                attempts=0,
+                next_attempt_at=datetime.now()
+            ))
+            self.session.commit()
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"알림 작업 기록 실패: {e}")
+            raise
+
+    def claim(
+            self,
+            limit: int,
+            token: str,
+            lease_until: datetime,
+            hold_until: Optional[datetime] = None
+    ) -> List[OutboxMessage]:
+        """발송할 때가 된 알림을 limit건까지 선점 (선점 시 시도 횟수 증가, lease_until까지 다른 릴레이가 가져가지 않음)"""
+        try:
+            now = datetime.now()
+            due = NotificationOutboxEntity.status == OUTBOX_PENDING, NotificationOutboxEntity.next_attempt_at <= now
+            rows = self.session.query(NotificationOutboxEntity.id, NotificationOutboxEntity.next_attempt_at).filter(
+                *due
+            ).order_by(
+                NotificationOutboxEntity.next_attempt_at, NotificationOutboxEntity.id
+            ).limit(limit).all()
+            # hold_until을 주면 가장 오래 기다린 알림이 그보다 먼저 발송 대상이 됐을 때만 선점 (그 사이 쌓인 알림을 한 묶음으로)
+            if not rows or (hold_until is not None and rows[0].next_attempt_at > hold_until):
+                self.session.rollback()
+                return []
+
+            ids = [row.id for row in rows]
+
+            # 다른 릴레이가 먼저 선점한 행은 조건에 맞지 않아 건너뛴다
+            self.session.execute(
+                update(NotificationOutboxEntity).where(NotificationOutboxEntity.id.in_(ids), *due).values(
+                    claim_token=token,
+                    next_attempt_at=lease_until,
+                    attempts=NotificationOutboxEntity.attempts + 1
+                )
+            )
+            claimed = [
+                entity.to_message() for entity in self.session.query(NotificationOutboxEntity).filter(
+                    NotificationOutboxEntity.id.in_(ids),
+                    NotificationOutboxEntity.claim_token == token
+                ).order_by(NotificationOutboxEntity.id)
+            ]
+            self.session.commit()
+            return claimed
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"알림 아웃박스 선점 실패: {e}")
+            raise
+
+    def record_results(
+            self,
+            token: str,
+            sent: List[int],
+            retries: List[Tuple[int, datetime, str, Iterable[str]]],
+            dead: List[Tuple[int, str, Iterable[str]]]
+    ) -> List[int]:
+        """발송 결과 일괄 기록 (발송 완료 / (ID, 다음 시도 시각, 오류, 받은 수신자) / (ID, 오류, 받은 수신자))
+
+        token으로 선점한 행만 기록하고, 선점 시간이 지나 다른 릴레이가 다시 선점한 행은 건너뛴 뒤 그 ID를 반환한다
+        (늦게 끝난 발송 결과가 새로 선점한 릴레이의 상태나 받은 수신자 목록을 덮어쓰지 않도록).
+        """
+        table = NotificationOutboxEntity.__table__
+        ids = sent + [outbox_id for outbox_id, *_ in retries] + [outbox_id for outbox_id, *_ in dead]
+        if not ids:
+            return []
+
+        try:
+            held = {
+                outbox_id for (outbox_id,) in self.session.query(NotificationOutboxEntity.id).filter(
+                    NotificationOutboxEntity.id.in_(ids),
+                    NotificationOutboxEntity.claim_token == token
+                )
+            }
+            sent = [outbox_id for outbox_id in sent if outbox_id in held]
+            retries = [retry for retry in retries if retry[0] in held]
+            dead = [failure for failure in dead if failure[0] in held]
+            claimed_by_me = table.c.claim_token == token
+
+            if sent:
+                self.session.execute(
+                    update(table).where(table.c.id.in_(sent), claimed_by_me).values(
+                        status=OUTBOX_SENT, sent_at=datetime.now(), claim_token=None, last_error=None
+                    )
+                )
+            if retries:
+                self.session.connection().execute(
+                    update(table).where(table.c.id == bindparam('outbox_id'), claimed_by_me).values(
+                        next_attempt_at=bindparam('retry_at'),
+                        last_error=bindparam('error'),
+                        delivered_to=bindparam('delivered'),
+                        claim_token=None
+                    ),
+                    [
+                        {'outbox_id': outbox_id, 'retry_at': retry_at, 'error': error, 'delivered': delivered_json(delivered)}
+                        for outbox_id, retry_at, error, delivered in retries
+                    ]
+                )
+            if dead:
+                self.session.connection().execute(
+                    update(table).where(table.c.id == bindparam('outbox_id'), claimed_by_me).values(
+                        status=OUTBOX_DEAD, last_error=bindparam('error'), delivered_to=bindparam('delivered'), claim_token=None
+                    ),
+                    [
+                        {'outbox_id': outbox_id, 'error': error, 'delivered': delivered_json(delivered)}
+                        for outbox_id, error, delivered in dead
+                    ]
+                )
+            self.session.commit()
+            return [outbox_id for outbox_id in ids if outbox_id not in held]
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"알림 발송 결과 기록 실패: {e}")
+            raise
+
+    def get_by_dedupe_key(self, key: str) -> Optional[NotificationOutboxEntity]:
+        """중복 방지 키로 조회"""
+        return self.session.query(NotificationOutboxEntity).filter(
+            NotificationOutboxEntity.dedupe_key == key
+        ).first()
+
+    def get_status(self, key: str) -> Optional[OutboxStatus]:
+        """중복 방지 키로 알림 진행 상황 조회"""
+        entry = self.get_by_dedupe_key(key)
+        return entry.to_status() if entry else None
+
+    def count_by_status(self) -> Dict[str, int]:
+        """상태별 알림 수"""
+        counts = {OUTBOX_PENDING: 0, OUTBOX_SENT: 0, OUTBOX_DEAD: 0}
+        for status, count in self.session.query(
+                NotificationOutboxEntity.status, func.count()
+        ).group_by(NotificationOutboxEntity.status):
+            counts[status] = count
+        return counts
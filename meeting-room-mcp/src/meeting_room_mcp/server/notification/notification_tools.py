@@ -2,56 +2,190 @@
 알림 관련 MCP Tools
 """
 
+import functools
 import logging
+from datetime import datetime
+from typing import Optional
 
 from fastmcp import FastMCP
 
+from src.meeting_room_mcp.server.notification.notification_models import (
+    OUTBOX_DEAD, OUTBOX_PENDING, OUTBOX_SENT, OutboxStatus
+)
+from src.meeting_room_mcp.server.notification.notification_queue import (
+    FAILED, QUEUED, RETRYING, SENDING, SENT, NotificationQueue
+)
+from src.meeting_room_mcp.server.notification.notification_relay import NotificationRelay
+from src.meeting_room_mcp.server.notification.notification_repository import (
+    CANCELLATION, CONFIRMATION, REMINDER, dedupe_key
+)
+from src.meeting_room_mcp.server.response_format import render_error
 from src.meeting_room_mcp.server.services.email_sevice import EmailService
 from src.meeting_room_mcp.server.services import RoomService
 from src.meeting_room_mcp.server.reservation.reservation_service import ReservationService
 
 logger = logging.getLogger(__name__)
 
+STATUS_LABELS = {
+    QUEUED: '발송 대기',
+    SENDING: '발송 중',
+    RETRYING: '재시도 대기',
+    SENT: '발송 완료',
+    FAILED: '발송 실패',
+}
+
+OUTBOX_STATUS_LABELS = {
+    OUTBOX_PENDING: '발송 대기',
+    OUTBOX_SENT: '발송 완료',
+    OUTBOX_DEAD: '발송 실패',
+}
+
+
+def outbox_job_status(entry: OutboxStatus) -> str:
+    """아웃박스 알림 상태를 작업 상태로 변환"""
+    if entry.status == OUTBOX_SENT:
+        return SENT
+    if entry.status == OUTBOX_DEAD:
+        return FAILED
+    if entry.claimed:
+        return SENDING
+    return RETRYING if entry.attempts else QUEUED
+
+
+def format_job_status(
+        job_id: str,
+        reservation_id: int,
+        notification_type: str,
+        status: str,
+        attempts: int,
+        max_attempts: int,
+        created_at: datetime,
+        next_attempt_at: Optional[datetime],
+        finished_at: Optional[datetime],
+        last_error: Optional[str]
+) -> str:
+    """알림 작업 진행 상황 응답"""
+    result = f"알림 작업 {job_id}:\n"
+    result += f"• 예약 ID: {reservation_id}\n"
+    result += f"• 알림 타입: {notification_type}\n"
+    result += f"• 상태: {STATUS_LABELS.get(status, status)}\n"
+    result += f"• 시도: {attempts}/{max_attempts}\n"
+    result += f"• 등록: {created_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+    if next_attempt_at:
+        result += f"• 다음 시도: {next_attempt_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+    if finished_at:
+        result += f"• 완료: {finished_at.strftime('%Y-%m-%d %H:%M:%S')}\n"
+    if last_error and status != SENT:
+        result += f"• 마지막 오류: {last_error}\n"
+
+    return result
+
 
 def register_notification_tools(
     app: FastMCP,
     room_service: RoomService,
     reservation_service: ReservationService,
-    email_service: EmailService
+    email_service: EmailService,
+    notification_queue: NotificationQueue,
+    notification_relay: Optional[NotificationRelay] = None
 ):
     """알림 관련 도구 등록"""
-    
+
     @app.tool()
-    def send_notification(
+    async def send_notification(
             reservation_id: int,
             notification_type: str = "confirmation",  # confirmation, cancellation, reminder
             message: str = ""
     ) -> str:
-        """예약 관련 이메일 알림을 발송합니다."""
+        """예약 관련 이메일 알림 발송을 대기열에 등록합니다. 진행 상황은 get_notification_status로 확인합니다."""
+        if notification_type not in (CONFIRMATION, CANCELLATION, REMINDER):
+            return f"지원하지 않는 알림 타입: {notification_type}"
+
         try:
-            reservation = reservation_service.get_reservation_details(reservation_id)
+            # 예약 생성/삭제 시 아웃박스에 기록된 확인/취소 알림은 다시 보내지 않는다
+            if notification_relay and notification_type in (CONFIRMATION, CANCELLATION):
+                status = await notification_relay.get_status(dedupe_key(notification_type, reservation_id))
+                if status:
+                    return (
+                        f"예약 ID {reservation_id}의 {notification_type} 알림은 자동 발송 대상입니다. "
+                        f"상태: {OUTBOX_STATUS_LABELS.get(status, status)}"
+                    )
+
+            reservation = await reservation_service.get_reservation_details(reservation_id)
             if not reservation:
                 return f"예약 ID {reservation_id}를 찾을 수 없습니다."
 
-            room = room_service.get_room_info(reservation.room_id)
+            room = await room_service.get_room_info(reservation.room_id)
             if not room:
                 return "회의실 정보를 찾을 수 없습니다."
 
-            success = False
-            if notification_type == "confirmation":
-                success = email_service.send_reservation_confirmation(reservation, room)
-            elif notification_type == "cancellation":
-                success = email_service.send_reservation_cancellation(reservation, room, message)
-            elif notification_type == "reminder":
-                success = email_service.send_reminder(reservation, room)
-            else:
-                return f"지원하지 않는 알림 타입: {notification_type}"
+            # 아웃박스에 기록해 릴레이가 발송 (작업 상태가 DB에 남아 어느 워커에서든 조회 가능)
+            if notification_relay:
+                job_id = await notification_relay.submit(
+                    notification_type,
+                    reservation,
+                    minutes_before=30 if notification_type == REMINDER else None,
+                    message=message if notification_type == CANCELLATION else ""
+                )
+                return f"이메일 알림 발송이 등록되었습니다. 작업 ID: {job_id}"
 
-            if success:
-                return f"이메일 알림이 성공적으로 발송되었습니다."
+            # SMTP 발송은 블로킹 I/O이므로 대기열 워커가 스레드에서 실행
+            if notification_type == CONFIRMATION:
+                send = functools.partial(email_service.send_reservation_confirmation, reservation, room)
+            elif notification_type == CANCELLATION:
+                send = functools.partial(email_service.send_reservation_cancellation, reservation, room, message)
             else:
-                return "이메일 발송에 실패했습니다."
+                send = functools.partial(email_service.send_reminder, reservation, room)
+
+            job = notification_queue.submit(notification_type, reservation_id, send)
+
+            return f"이메일 알림 발송이 등록되었습니다. 작업 ID: {job.job_id}"
+
+        except Exception as e:
+            logger.error(f"이메일 발송 등록 오류: {e}")
+            return render_error("prose", str(e))
+
+    @app.tool()
+    async def get_notification_status(job_id: str) -> str:
+        """이메일 알림 발송 작업의 진행 상황을 조회합니다."""
+        job_id = job_id.strip()
+        try:
+            if notification_relay:
+                entry = await notification_relay.get_job(job_id)
+                if not entry:
+                    return f"작업 ID {job_id}를 찾을 수 없습니다."
+
+                status = outbox_job_status(entry)
+                return format_job_status(
+                    job_id,
+                    entry.reservation_id,
+                    entry.notification_type,
+                    status,
+                    entry.attempts,
+                    notification_relay.max_attempts,
+                    entry.created_at,
+                    entry.next_attempt_at if status == RETRYING else None,
+                    entry.sent_at,
+                    entry.last_error
+                )
 
         except Exception as e:
-            logger.error(f"이메일 발송 오류: {e}")
-            return f"오류: {e}"
\ No newline at end of file
+            logger.error(f"알림 작업 조회 오류: {e}")
+            return render_error("prose", str(e))
+
+        job = notification_queue.get_job(job_id)
+        if not job:
+            return f"작업 ID {job_id}를 찾을 수 없습니다."
+
+        return format_job_status(
+            job.job_id,
+            job.reservation_id,
+            job.notification_type,
+            job.status,
+            job.attempts,
+            job.max_attempts,
+            job.created_at,
+            job.next_attempt_at,
+            job.finished_at,
+            job.last_error
+        )
@@ -0,0 +1,247 @@
+"""
+회의 리마인더 스케줄러 (다가오는 회의를 시작 시각 범위로 조회해 최소 힙에 예약)
+"""
+
+import asyncio
+import heapq
+import logging
+import threading
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.meeting_room_mcp.config.database_config import AsyncDatabaseConfig
+from src.meeting_room_mcp.server.notification.notification_repository import NotificationOutboxRepository
+from src.meeting_room_mcp.server.reservation.recurrence import expand_occurrences
+from src.meeting_room_mcp.server.reservation.reservation_repository import ReservationRepository
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+
+logger = logging.getLogger(__name__)
+
+# (발송 시각, 예약 ID, 회차 시작 시각, 시작 전 분)
+ReminderEntry = Tuple[datetime, int, datetime, int]
+
+# 조회/기록 실패 후 다시 시도하기까지 대기 시간(초)
+ERROR_RETRY_DELAY = 1.0
+
+
+class ReminderScheduler:
+    """리마인더 스케줄러
+
+    scan_interval초마다 지난번 조회 끝 시각부터 now + horizon초까지 새로 들어온 구간만 시작 시각 인덱스로
+    조회해, 회차마다 offsets(시작 전 분)별 발송 시각을 최소 힙에 넣는다. 이미 조회한 구간에 예약이
+    생기거나 취소되면 저장소가 add()/remove()로 힙을 바로 고친다. 발송 시각이 되면 아웃박스에
+    리마인더를 기록하고(릴레이가 발송), 회차와 시작 전 분으로 만든 중복 방지 키 덕분에 재시작이나
+    여러 워커에서도 한 번만 기록된다. 회의가 이미 시작됐으면 보내지 않는다.
+    """
+
+    def __init__(
+            self,
+            db_config: AsyncDatabaseConfig,
+            offsets: Iterable[int] = (30,),
+            horizon: float = 3600.0,
+            scan_interval: float = 60.0,
+            clock: Callable[[], datetime] = datetime.now
+    ):
+        self.db_config = db_config
+        self.offsets = sorted(set(offsets))
+        # 가장 이른 리마인더 발송 시각이 다음 조회보다 늦지 않도록 horizon 보정
+        self.horizon = max(horizon, max(self.offsets, default=0) * 60 + scan_interval)
+        self.scan_interval = scan_interval
+        self._clock = clock
+
+        self._heap: List[ReminderEntry] = []
+        self._scheduled: Set[Tuple[int, datetime, int]] = set()
+        self._scanned_until: Optional[datetime] = None
+        self._lock = threading.Lock()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+        self.scans = 0
+        self.scanned = 0
+        self.enqueued = 0
+        self.skipped = 0
+
+    async def start(self):
+        """스케줄러 시작"""
+        if self._task is None:
+            self._loop = asyncio.get_running_loop()
+            self._wakeup = asyncio.Event()
+            self._task = asyncio.create_task(self._run(), name="reminder-scheduler")
+            logger.info(f"리마인더 스케줄러 시작: 시작 전 {self.offsets}분")
+
+    async def stop(self):
+        """스케줄러 종료"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def add(self, reservation: Reservation):
+        """새 예약 중 이미 조회한 구간에 시작하는 회차의 리마인더 추가"""
+        with self._lock:
+            if self._scanned_until is None:
+                return
+
+            now = self._clock()
+            if reservation.recurrence:
+                occurrences = [
+                    start for start, _ in expand_occurrences(
+                        reservation.recurrence, reservation.start_time, reservation.end_time, now, self._scanned_until
+                    )
+                ]
+            else:
+                occurrences = [reservation.start_time]
+
+            earliest = self._heap[0][0] if self._heap else None
+            for occurrence_start in occurrences:
+                if now < occurrence_start < self._scanned_until:
+                    self._push(reservation.id, occurrence_start)
+
+        if self._heap and (earliest is None or self._heap[0][0] < earliest):
+            self._wake()
+
+    def remove(self, reservation_id: int, occurrence_start: Optional[datetime] = None):
+        """취소된 예약(또는 회차)의 리마인더 제거"""
+        with self._lock:
+            kept = [
+                entry for entry in self._heap
+                if entry[1] != reservation_id or (occurrence_start is not None and entry[2] != occurrence_start)
+            ]
+            if len(kept) == len(self._heap):
+                return
+
+            for entry in self._heap:
+                if entry[1] == reservation_id and (occurrence_start is None or entry[2] == occurrence_start):
+                    self._scheduled.discard(entry[1:])
+            heapq.heapify(kept)
+            self._heap = kept
+
+    def stats(self) -> Dict[str, Any]:
+        """예약된 리마인더 수 및 조회/기록 지표"""
+        with self._lock:
+            return {
+                'scheduled': len(self._heap),
+                'next_fire_at': self._heap[0][0].isoformat() if self._heap else None,
+                'scanned_until': self._scanned_until.isoformat() if self._scanned_until else None,
+                'scans': self.scans,
+                'scanned_occurrences': self.scanned,
+                'enqueued': self.enqueued,
+                'skipped': self.skipped
+            }
+
+    async def scan(self):
+        """지난번 조회 이후 새로 horizon 안에 들어온 구간의 회차를 조회해 힙에 추가"""
+        now = self._clock()
+        window_end = now + timedelta(seconds=self.horizon)
+        with self._lock:
+            window_start = max(self._scanned_until or now, now)
+            # 조회 도중 생성된 예약은 add()가 처리하도록 먼저 조회 범위를 넓혀 둔다 (중복은 _scheduled로 제거)
+            self._scanned_until = window_end
+
+        if window_start >= window_end:
+            return
+
+        # 복제 지연으로 방금 생성된 예약을 놓치지 않도록 프라이머리에서 조회
+        try:
+            reservations = await self.db_config.run_sync(
+                lambda session: ReservationRepository(session).get_starting_between(window_start, window_end)
+            )
+        except Exception:
+            # 조회하지 못한 구간은 다음 조회에 다시 포함
+            with self._lock:
+                if self._scanned_until == window_end:
+                    self._scanned_until = window_start
+            raise
+
+        with self._lock:
+            for reservation in reservations:
+                if reservation.start_time > now:
+                    self._push(reservation.id, reservation.start_time)
+
+        self.scans += 1
+        self.scanned += len(reservations)
+        logger.debug(f"리마인더 조회: {window_start} ~ {window_end}, 회차 {len(reservations)}건")
+
+    async def fire_due(self) -> int:
+        """발송 시각이 된 리마인더를 아웃박스에 기록 (새로 기록한 수 반환)"""
+        now = self._clock()
+        with self._lock:
+            due = []
+            while self._heap and self._heap[0][0] <= now:
+                entry = heapq.heappop(self._heap)
+                self._scheduled.discard(entry[1:])
+                due.append(entry)
+
+        if not due:
+            return 0
+
+        def enqueue(session: Session) -> int:
+            occurrences = ReservationRepository(session).get_occurrences(
+                (reservation_id, occurrence_start) for _, reservation_id, occurrence_start, _ in due
+            )
+            reminders = [
+                (occurrences[reservation_id, occurrence_start], minutes_before)
+                for _, reservation_id, occurrence_start, minutes_before in due
+                if (reservation_id, occurrence_start) in occurrences and occurrence_start > now
+            ]
+            return NotificationOutboxRepository(session).add_reminders(reminders)
+
+        try:
+            inserted = await self.db_config.run_sync(enqueue)
+        except Exception:
+            # 기록하지 못한 리마인더는 다음 루프에서 다시 시도
+            with self._lock:
+                for entry in due:
+                    if entry[1:] not in self._scheduled:
+                        self._scheduled.add(entry[1:])
+                        heapq.heappush(self._heap, entry)
+            raise
+
+        self.enqueued += inserted
+        self.skipped += len(due) - inserted
+
+        if inserted:
+            logger.info(f"리마인더 {inserted}건 발송 등록 (취소/중복 {len(due) - inserted}건 제외)")
+        return inserted
+
+    async def _run(self):
+        """다음 발송 시각이나 다음 조회 시각 중 이른 쪽까지 대기 (새 리마인더가 더 이르면 깨어남)"""
+        next_scan_at = self._clock()
+        while True:
+            failed = False
+            try:
+                if self._clock() >= next_scan_at:
+                    await self.scan()
+                    next_scan_at = self._clock() + timedelta(seconds=self.scan_interval)
+                await self.fire_due()
+            except Exception as e:
+                failed = True
+                logger.error(f"리마인더 스케줄러 오류: {e}")
+
+            with self._lock:
+                wake_at = min(next_scan_at, self._heap[0][0]) if self._heap else next_scan_at
+            timeout = max((wake_at - self._clock()).total_seconds(), ERROR_RETRY_DELAY if failed else 0.0)
+
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _push(self, reservation_id: int, occurrence_start: datetime):
+        """회차의 시작 전 분별 리마인더를 힙에 추가 (이미 있으면 건너뜀, 잠금 보유 상태에서 호출)"""
+        for minutes_before in self.offsets:
+            key = (reservation_id, occurrence_start, minutes_before)
+            if key in self._scheduled:
+                continue
+
+            self._scheduled.add(key)
+            heapq.heappush(self._heap, (occurrence_start - timedelta(minutes=minutes_before), *key))
+
+    def _wake(self):
+        """대기 중인 스케줄러 루프 깨우기 (다른 스레드에서 호출될 수 있음)"""
+        if self._loop is not None and self._wakeup is not None:
+            self._loop.call_soon_threadsafe(self._wakeup.set)
@@ -0,0 +1,149 @@
+"""
+조회 도구 응답 캐시 (TTL + LRU, 쓰기 시 회의실/시간 범위 단위 무효화)
+"""
+
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, FrozenSet, Hashable, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class CacheScope:
+    """캐시 항목이 의존하는 데이터 범위 (None은 제한 없음)"""
+    room_ids: Optional[FrozenSet[int]] = None
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    def touches(self, room_id: Optional[int], start: Optional[datetime], end: Optional[datetime]) -> bool:
+        """해당 회의실/시간 범위의 변경이 이 항목에 영향을 주는지 여부 (경계 포함, 판단 불가 시 True)"""
+        if room_id is not None and self.room_ids is not None and room_id not in self.room_ids:
+            return False
+
+        try:
+            if self.start is not None and end is not None and end < self.start:
+                return False
+            if self.end is not None and start is not None and self.end < start:
+                return False
+        except TypeError:
+            # 시간대 있는 값과 없는 값은 비교할 수 없으므로 영향이 있다고 본다
+            pass
+
+        return True
+
+
+@dataclass
+class _Entry:
+    value: Any
+    scope: CacheScope
+    expires_at: float
+
+
+class ReadCache:
+    """조회 결과 캐시
+
+    항목마다 의존하는 회의실/시간 범위(CacheScope)를 함께 보관하고, 예약 생성/삭제나
+    회의실 상태 변경이 커밋되면 저장소가 invalidate()를 호출해 겹치는 항목만 지운다.
+    조회 도중 무효화가 일어났으면 그 결과는 저장하지 않는다 (오래된 값이 다시 들어가지 않도록).
+    캐시된 객체는 호출자 간에 공유되므로 수정하지 않는다.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 30.0, clock: Callable[[], float] = time.monotonic):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, _Entry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    async def get_or_load(
+            self,
+            key: Hashable,
+            loader: Callable[[], Awaitable[Any]],
+            scope: Union[CacheScope, Callable[[Any], CacheScope]] = CacheScope()
+    ) -> Any:
+        """캐시에 있으면 반환, 없으면 loader 결과를 저장 후 반환 (scope는 결과로 계산할 수도 있음)"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.expires_at > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry.value
+
+                del self._entries[key]
+                self.expirations += 1
+
+            self.misses += 1
+            version = self._version
+
+        value = await loader()
+        if value is None:
+            return value
+
+        entry = _Entry(value, scope(value) if callable(scope) else scope, self._clock() + self.ttl)
+        with self._lock:
+            if self._version != version:
+                return value
+
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+        return value
+
+    def invalidate(self, room_id: Optional[int] = None, start: Optional[datetime] = None, end: Optional[datetime] = None):
+        """회의실/시간 범위가 겹치는 항목 삭제 (room_id 미지정 시 모든 회의실, 시간 미지정 시 전체 기간)"""
+        with self._lock:
+            self._version += 1
+            stale = [key for key, entry in self._entries.items() if entry.scope.touches(room_id, start, end)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+
+        if stale:
+            logger.debug(f"응답 캐시 무효화: 회의실={room_id}, 범위={start} ~ {end}, 항목={len(stale)}")
+
+    def clear(self):
+        """전체 항목 삭제"""
+        self.invalidate()
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 적중/실패/제거 지표"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl_seconds': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_ratio': round(self.hits / lookups, 4) if lookups else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'invalidations': self.invalidations
+            }
+
+
+async def read_through(
+        cache: Optional[ReadCache],
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        scope: Union[CacheScope, Callable[[Any], CacheScope]] = CacheScope()
+) -> Any:
+    """캐시가 설정되어 있으면 캐시를 거쳐, 아니면 바로 loader 호출"""
+    if cache is None:
+        return await loader()
+    return await cache.get_or_load(key, loader, scope)
@@ -0,0 +1,119 @@
+"""
+반복 예약 회차 전개
+
+반복 예약은 첫 회차 한 행과 규칙만 저장하고, 조회 구간에 걸치는 회차만 그때그때 계산한다.
+"""
+
+import calendar
+from datetime import datetime, timedelta
+from typing import Iterator, List, Optional, Tuple
+
+from src.meeting_room_mcp.server.reservation.reservation_schemas import RecurrenceRule
+
+FREQUENCIES = ('daily', 'weekly', 'monthly')
+
+# 반복 예약 전체 기간 상한 (일)
+MAX_SERIES_DAYS = 730
+
+Occurrence = Tuple[datetime, datetime]
+
+
+def validate_rule(rule: RecurrenceRule, first_start: datetime, first_end: datetime):
+    """반복 규칙 검증"""
+    if rule.frequency not in FREQUENCIES:
+        raise ValueError(f"반복 주기는 {', '.join(FREQUENCIES)} 중 하나여야 합니다")
+    if rule.interval < 1:
+        raise ValueError("반복 간격은 1 이상이어야 합니다")
+    if rule.count is None and rule.until is None:
+        raise ValueError("반복 횟수 또는 종료 날짜를 지정해주세요")
+    if rule.count is not None and rule.count < 1:
+        raise ValueError("반복 횟수는 1 이상이어야 합니다")
+    if rule.until is not None and rule.until < first_start:
+        raise ValueError("반복 종료 날짜가 첫 회차보다 빠를 수 없습니다")
+    if series_end(rule, first_start, first_end) - first_start > timedelta(days=MAX_SERIES_DAYS):
+        raise ValueError(f"반복 예약 기간은 {MAX_SERIES_DAYS}일을 초과할 수 없습니다")
+
+
+def occurrence_start(rule: RecurrenceRule, first_start: datetime, n: int) -> datetime:
+    """n번째(0부터) 회차 시작 시각 (월 반복은 없는 날짜를 말일로 보정)"""
+    if rule.frequency == 'daily':
+        return first_start + timedelta(days=n * rule.interval)
+    if rule.frequency == 'weekly':
+        return first_start + timedelta(weeks=n * rule.interval)
+
+    months = first_start.month - 1 + n * rule.interval
+    year = first_start.year + months // 12
+    month = months % 12 + 1
+    day = min(first_start.day, calendar.monthrange(year, month)[1])
+    return first_start.replace(year=year, month=month, day=day)
+
+
+def _first_index_after(rule: RecurrenceRule, first_start: datetime, first_end: datetime, moment: datetime) -> int:
+    """종료 시각이 moment 이후인 첫 회차 번호 (구간 앞부분은 계산으로 건너뜀)"""
+    if moment < first_end:
+        return 0
+
+    if rule.frequency == 'monthly':
+        months = (moment.year - first_start.year) * 12 + moment.month - first_start.month
+        return max(0, months // rule.interval - 1)
+
+    step = timedelta(days=rule.interval) if rule.frequency == 'daily' else timedelta(weeks=rule.interval)
+    return (moment - first_end) // step + 1
+
+
+def expand_occurrences(
+        rule: RecurrenceRule,
+        first_start: datetime,
+        first_end: datetime,
+        window_start: Optional[datetime] = None,
+        window_end: Optional[datetime] = None
+) -> Iterator[Occurrence]:
+    """조회 구간과 겹치는 회차만 시작 시각 순으로 생성 (구간 미지정 시 전체)"""
+    duration = first_end - first_start
+    exceptions = set(rule.exceptions)
+    n = _first_index_after(rule, first_start, first_end, window_start) if window_start else 0
+
+    while rule.count is None or n < rule.count:
+        start = occurrence_start(rule, first_start, n)
+        n += 1
+
+        if rule.until is not None and start > rule.until:
+            return
+        if window_end is not None and start >= window_end:
+            return
+        if window_start is not None and start + duration <= window_start:
+            continue
+        if start in exceptions:
+            continue
+
+        yield start, start + duration
+
+
+def series_end(rule: RecurrenceRule, first_start: datetime, first_end: datetime) -> datetime:
+    """마지막 회차 종료 시각 (제외 회차와 무관한 상한)"""
+    if rule.count is not None:
+        last_start = occurrence_start(rule, first_start, rule.count - 1)
+        if rule.until is None or last_start <= rule.until:
+            return last_start + (first_end - first_start)
+
+    # until 기준: until 이하인 마지막 회차
+    n = _first_index_after(rule, first_start, first_start, rule.until)
+    while n > 0 and occurrence_start(rule, first_start, n) > rule.until:
+        n -= 1
+    while occurrence_start(rule, first_start, n + 1) <= rule.until and (rule.count is None or n + 1 < rule.count):
+        n += 1
+    return occurrence_start(rule, first_start, n) + (first_end - first_start)
+
+
+def find_overlaps(items: List[Occurrence], booked: List[Occurrence]) -> List[bool]:
+    """시작 시각 순으로 정렬된 items 각각이 booked와 겹치는지 (booked는 서로 겹치지 않는 정렬 목록)
+
+    두 목록을 한 번씩만 훑는 스윕으로 O(len(items) + len(booked))에 판단한다.
+    """
+    overlaps = []
+    position = 0
+    for start, end in items:
+        while position < len(booked) and booked[position][1] <= start:
+            position += 1
+        overlaps.append(position < len(booked) and booked[position][0] < end)
+    return overlaps
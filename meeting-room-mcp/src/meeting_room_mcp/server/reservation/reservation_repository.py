@@ -4,32 +4,105 @@
 
 import json
 import logging
-from datetime import datetime
-from typing import List, Optional
+from collections import defaultdict
+from dataclasses import replace
+from itertools import islice
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import bindparam, exists, insert, select, tuple_, union
 from sqlalchemy.orm import Session
 from sqlalchemy.sql import func
 
-from src.meeting_room_mcp.server.entities import ReservationEntity
-from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+from src.meeting_room_mcp.config.database_config import is_database_locked, retry_on_database_lock
+from src.meeting_room_mcp.server.entities import (
+    ReservationEntity, ReservationParticipantEntity, ReservationRecurrenceEntity, normalize_emails
+)
+from src.meeting_room_mcp.server.notification.notification_repository import (
+    CANCELLATION, CONFIRMATION, NotificationOutboxRepository
+)
+from src.meeting_room_mcp.server.reservation.recurrence import expand_occurrences, find_overlaps, series_end
+from src.meeting_room_mcp.server.read_cache import ReadCache
+from src.meeting_room_mcp.server.reservation.reservation_schemas import BulkReservationResult, Reservation
+from src.meeting_room_mcp.server.room.availability_index import AvailabilityIndex
+from src.meeting_room_mcp.server.room.room_models import MeetingRoomEntity
+from src.meeting_room_mcp.shared.pagination import keyset_after
+
+if TYPE_CHECKING:
+    from src.meeting_room_mcp.server.notification.reminder_scheduler import ReminderScheduler
 
 logger = logging.getLogger(__name__)
 
+# 일괄 예약 중 동시 예약이 끼어들었을 때 다시 확인하는 횟수
+BULK_CONCURRENT_RETRIES = 3
+
+# 반복 규칙이 없는 단일 예약 (반복 예약 행은 첫 회차일 뿐이므로 회차 전개로 따로 처리)
+SINGLE_RESERVATION = ~ReservationEntity.recurrence.has()
+
+# 충돌 체크 INSERT에 바인딩하는 컬럼
+INSERT_COLUMNS = (
+    'room_id', 'title', 'description', 'start_time', 'end_time', 'organizer_email', 'participants'
+)
+
 
 class ReservationRepository:
     """예약 데이터 접근 객체"""
 
-    def __init__(self, session: Session):
+    def __init__(
+            self,
+            session: Session,
+            availability_index: Optional[AvailabilityIndex] = None,
+            read_cache: Optional[ReadCache] = None,
+            notification_outbox: bool = False,
+            reminder_scheduler: Optional['ReminderScheduler'] = None
+    ):
         self.session = session
+        self.availability_index = availability_index
+        self.read_cache = read_cache
+        self.notification_outbox = notification_outbox  # 예약 생성/삭제 시 알림을 같은 트랜잭션으로 기록
+        self.reminder_scheduler = reminder_scheduler
 
+    @retry_on_database_lock
     def create(self, reservation: Reservation) -> int:
-        """예약 생성"""
+        """예약 생성 (겹치는 예약이 없을 때만 한 문장으로 INSERT)"""
         try:
-            # 중복 예약 체크
-            if self._check_conflict(reservation):
+            reservation_id = self._insert_if_free(reservation)
+            if reservation_id is None or any(self._find_series_conflicts(
+                    reservation.room_id, [(reservation.start_time, reservation.end_time)], reservation_id
+            )):
                 raise ValueError("해당 시간에 이미 예약이 있습니다")
 
-            # 예약 엔티티 생성
+            self._insert_participants({reservation_id: reservation.participants})
+            self._add_notifications(CONFIRMATION, [replace(reservation, id=reservation_id)])
+            self.session.commit()
+
+            if self.availability_index:
+                self.availability_index.add(
+                    reservation_id,
+                    reservation.room_id,
+                    reservation.start_time,
+                    reservation.end_time
+                )
+            if self.read_cache:
+                self.read_cache.invalidate(reservation.room_id, reservation.start_time, reservation.end_time)
+            if self.reminder_scheduler:
+                self.reminder_scheduler.add(replace(reservation, id=reservation_id))
+
+            logger.info(f"예약 생성 완료: ID={reservation_id}, 회의실={reservation.room_id}")
+            return reservation_id
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"예약 생성 실패: {e}")
+            raise
+
+    @retry_on_database_lock
+    def create_series(self, reservation: Reservation) -> int:
+        """반복 예약 생성 (규칙과 첫 회차만 저장, 전체 회차는 한 번에 충돌 체크)"""
+        rule = reservation.recurrence
+        try:
+            self._lock_room(reservation.room_id)
+
             reservation_entity = ReservationEntity(
                 room_id=reservation.room_id,
                 title=reservation.title,
@@ -39,18 +112,169 @@ class ReservationRepository:
                 organizer_email=reservation.organizer_email,
                 participants=json.dumps(reservation.participants, ensure_ascii=False)
             )
+            reservation_entity.recurrence = ReservationRecurrenceEntity(
+                frequency=rule.frequency,
+                interval=rule.interval,
+                count=rule.count,
+                until=rule.until,
+                exceptions=json.dumps([value.isoformat() for value in rule.exceptions]),
+                series_end=series_end(rule, reservation.start_time, reservation.end_time)
+            )
+            reservation_entity.sync_participants()
 
+            # 먼저 flush해 쓰기 잠금을 잡은 뒤 충돌 체크 (동시 생성과 경합하지 않도록)
             self.session.add(reservation_entity)
+            self.session.flush()
+            reservation_id = reservation_entity.id
+
+            occurrences = list(expand_occurrences(rule, reservation.start_time, reservation.end_time))
+            overlaps = self._find_conflicts(reservation.room_id, occurrences, reservation_id)
+            if any(overlaps):
+                conflict_start = occurrences[overlaps.index(True)][0]
+                raise ValueError(f"{conflict_start.strftime('%Y-%m-%d %H:%M')} 회차 시간에 이미 예약이 있습니다")
+
+            self._add_notifications(CONFIRMATION, [replace(reservation, id=reservation_id)])
             self.session.commit()
-            self.session.refresh(reservation_entity)
 
-            reservation_id = reservation_entity.id
-            logger.info(f"예약 생성 완료: ID={reservation_id}, 회의실={reservation.room_id}")
+            if self.availability_index:
+                self.availability_index.add_series(reservation_id, reservation.room_id, occurrences)
+            if self.read_cache:
+                self.read_cache.invalidate(reservation.room_id, occurrences[0][0], occurrences[-1][1])
+            if self.reminder_scheduler:
+                self.reminder_scheduler.add(replace(reservation, id=reservation_id))
+
+            logger.info(
+                f"반복 예약 생성 완료: ID={reservation_id}, 회의실={reservation.room_id}, 회차={len(occurrences)}"
+            )
             return reservation_id
 
         except Exception as e:
             self.session.rollback()
-            logger.error(f"예약 생성 실패: {e}")
+            logger.error(f"반복 예약 생성 실패: {e}")
+            raise
+
+    @retry_on_database_lock
+    def add_exception(self, reservation_id: int, occurrence_start: datetime) -> bool:
+        """반복 예약의 한 회차 취소 (제외 회차로 기록)"""
+        try:
+            reservation_entity = self.session.query(ReservationEntity).filter(
+                ReservationEntity.id == reservation_id
+            ).first()
+            if not reservation_entity or not reservation_entity.recurrence:
+                return False
+
+            rule = reservation_entity.recurrence.to_rule()
+            occurs = any(
+                start == occurrence_start for start, _ in expand_occurrences(
+                    rule,
+                    reservation_entity.start_time,
+                    reservation_entity.end_time,
+                    occurrence_start,
+                    occurrence_start + timedelta(microseconds=1)
+                )
+            )
+            if not occurs:
+                return False
+
+            rule.exceptions.append(occurrence_start)
+            reservation_entity.recurrence.exceptions = json.dumps([value.isoformat() for value in rule.exceptions])
+            self.session.commit()
+
+            if self.availability_index:
+                self.availability_index.add_series(
+                    reservation_id,
+                    reservation_entity.room_id,
+                    expand_occurrences(rule, reservation_entity.start_time, reservation_entity.end_time)
+                )
+            if self.read_cache:
+                self.read_cache.invalidate(
+                    reservation_entity.room_id,
+                    occurrence_start,
+                    occurrence_start + (reservation_entity.end_time - reservation_entity.start_time)
+                )
+            if self.reminder_scheduler:
+                self.reminder_scheduler.remove(reservation_id, occurrence_start)
+
+            logger.info(f"반복 예약 회차 취소 완료: reservation_id={reservation_id}, 회차={occurrence_start}")
+            return True
+
+        except Exception as e:
+            self.session.rollback()
+            if is_database_locked(e):
+                raise
+            logger.error(f"반복 예약 회차 취소 실패: {e}")
+            return False
+
+    @retry_on_database_lock
+    def create_bulk(self, reservations: List[Reservation], all_or_nothing: bool = True) -> List[BulkReservationResult]:
+        """예약 일괄 생성 (한 트랜잭션, 충돌 체크는 회의실별 정렬 후 스윕 한 번)
+
+        all_or_nothing이면 하나라도 충돌할 때 아무것도 생성하지 않고,
+        아니면 충돌하지 않는 항목만 생성한다.
+        """
+        try:
+            for attempt in range(1, BULK_CONCURRENT_RETRIES + 1):
+                errors = self._find_bulk_conflicts(reservations)
+                accepted = [i for i in range(len(reservations)) if i not in errors]
+
+                if all_or_nothing and errors:
+                    return [
+                        BulkReservationResult(
+                            index=i, error=errors.get(i, "다른 항목 충돌로 생성하지 않았습니다")
+                        )
+                        for i in range(len(reservations))
+                    ]
+
+                # 스윕 이후 다른 요청이 끼어들었으면 충돌 체크 INSERT가 일부 행을 건너뛴다
+                if accepted:
+                    result = self.session.execute(
+                        self._conflict_safe_insert(),
+                        [self._to_row(reservations[i]) for i in accepted]
+                    )
+                    if result.rowcount != len(accepted) or self._bulk_conflicts_with_series(
+                            [reservations[i] for i in accepted]
+                    ):
+                        self.session.rollback()
+                        logger.warning(f"일괄 예약 중 동시 예약 발생 - 다시 확인 ({attempt}/{BULK_CONCURRENT_RETRIES})")
+                        continue
+
+                ids = self._find_inserted_ids([reservations[i] for i in accepted])
+                self._insert_participants({
+                    ids[(reservations[i].room_id, reservations[i].start_time)]: reservations[i].participants
+                    for i in accepted
+                })
+                self._add_notifications(CONFIRMATION, [
+                    replace(reservations[i], id=ids[(reservations[i].room_id, reservations[i].start_time)])
+                    for i in accepted
+                ])
+                self.session.commit()
+                break
+            else:
+                raise ValueError("동시 예약이 많아 일괄 예약을 완료하지 못했습니다")
+
+            results = []
+            for i, reservation in enumerate(reservations):
+                if i in errors:
+                    results.append(BulkReservationResult(index=i, error=errors[i]))
+                    continue
+
+                reservation_id = ids[(reservation.room_id, reservation.start_time)]
+                if self.availability_index:
+                    self.availability_index.add(
+                        reservation_id, reservation.room_id, reservation.start_time, reservation.end_time
+                    )
+                if self.read_cache:
+                    self.read_cache.invalidate(reservation.room_id, reservation.start_time, reservation.end_time)
+                if self.reminder_scheduler:
+                    self.reminder_scheduler.add(replace(reservation, id=reservation_id))
+                results.append(BulkReservationResult(index=i, reservation_id=reservation_id))
+
+            logger.info(f"예약 일괄 생성 완료: 성공={len(accepted)}, 실패={len(errors)}")
+            return results
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"예약 일괄 생성 실패: {e}")
             raise
 
     def get_by_id(self, reservation_id: int) -> Optional[Reservation]:
@@ -70,29 +294,157 @@ class ReservationRepository:
             self,
             room_id: int,
             start_date: Optional[datetime] = None,
-            end_date: Optional[datetime] = None
+            end_date: Optional[datetime] = None,
+            after: Optional[Tuple[datetime, int]] = None,
+            limit: Optional[int] = None
     ) -> List[Reservation]:
-        """특정 회의실의 예약 목록 조회"""
+        """특정 회의실의 예약 목록을 (start_time, id) 순으로 키셋 조회 (반복 예약은 회차로 전개)"""
         try:
-            query = self.session.query(ReservationEntity).filter(
-                ReservationEntity.room_id == room_id
+            return self._find_with_occurrences(
+                ReservationEntity.room_id == room_id, start_date, end_date, after, limit
+            )
+
+        except Exception as e:
+            logger.error(f"회의실 예약 목록 조회 실패 (room_id: {room_id}): {e}")
+            return []
+
+    def get_by_email(
+            self,
+            email: str,
+            start_time: datetime,
+            end_time: datetime,
+            after: Optional[Tuple[datetime, int]] = None,
+            limit: Optional[int] = None
+    ) -> List[Reservation]:
+        """주최자 또는 참가자로 포함된 예약을 (start_time, id) 순으로 키셋 조회
+
+        주최자는 idx_reservations_organizer, 참가자는 idx_reservation_participants_email로 찾는다.
+        """
+        email = email.strip()
+        mine = ReservationEntity.id.in_(union(
+            select(ReservationEntity.id).where(ReservationEntity.organizer_email.in_({email, email.lower()})),
+            select(ReservationParticipantEntity.reservation_id).where(
+                ReservationParticipantEntity.email == email.lower()
+            )
+        ))
+
+        return self._find_with_occurrences(mine, start_time, end_time, after, limit)
+
+    def get_starting_between(self, start_time: datetime, end_time: datetime) -> List[Reservation]:
+        """start_time 이상 end_time 미만에 시작하는 예약/반복 예약 회차 (시작 시각 범위로 idx_reservations_time_range 사용)"""
+        reservations = [
+            entity.to_model() for entity in self.session.query(ReservationEntity).filter(
+                ReservationEntity.start_time >= start_time,
+                ReservationEntity.start_time < end_time,
+                SINGLE_RESERVATION
             )
+        ]
 
-            if start_date:
-                query = query.filter(ReservationEntity.end_time >= start_date)
+        for entity in self.session.query(ReservationEntity).join(ReservationEntity.recurrence).filter(
+                ReservationEntity.start_time < end_time,
+                ReservationRecurrenceEntity.series_end > start_time
+        ):
+            reservation = entity.to_model()
+            reservations.extend(
+                replace(reservation, start_time=occurrence_start, end_time=occurrence_end)
+                for occurrence_start, occurrence_end in expand_occurrences(
+                    reservation.recurrence, entity.start_time, entity.end_time, start_time, end_time
+                )
+                if occurrence_start >= start_time
+            )
+
+        return reservations
+
+    def get_occurrences(self, keys: Iterable[Tuple[int, datetime]]) -> Dict[Tuple[int, datetime], Reservation]:
+        """(예약 ID, 회차 시작 시각) 중 아직 유효한 것의 예약 정보 (삭제/제외된 회차는 빠짐)"""
+        keys = list(keys)
+        entities = {
+            entity.id: entity for entity in self.session.query(ReservationEntity).filter(
+                ReservationEntity.id.in_({reservation_id for reservation_id, _ in keys})
+            )
+        }
+
+        found = {}
+        for reservation_id, occurrence_start in keys:
+            entity = entities.get(reservation_id)
+            if entity is None:
+                continue
 
-            if end_date:
-                query = query.filter(ReservationEntity.start_time <= end_date)
+            reservation = entity.to_model()
+            if not reservation.recurrence:
+                if reservation.start_time == occurrence_start:
+                    found[reservation_id, occurrence_start] = reservation
+                continue
 
-            query = query.order_by(ReservationEntity.start_time.asc())
+            for start, end in expand_occurrences(
+                    reservation.recurrence,
+                    entity.start_time,
+                    entity.end_time,
+                    occurrence_start,
+                    occurrence_start + timedelta(microseconds=1)
+            ):
+                if start == occurrence_start:
+                    found[reservation_id, occurrence_start] = replace(reservation, start_time=start, end_time=end)
 
-            reservation_entities = query.all()
-            return [entity.to_model() for entity in reservation_entities]
+        return found
+
+    def get_intervals_in_range(
+            self,
+            start_time: datetime,
+            end_time: datetime
+    ) -> List[Tuple[int, datetime, datetime]]:
+        """기간과 겹치는 예약의 (room_id, start_time, end_time) 목록 조회"""
+        try:
+            return [
+                tuple(row) for row in self.session.query(
+                    ReservationEntity.room_id,
+                    ReservationEntity.start_time,
+                    ReservationEntity.end_time
+                ).filter(
+                    ReservationEntity.start_time < end_time,
+                    ReservationEntity.end_time > start_time,
+                    SINGLE_RESERVATION
+                ).all()
+            ] + self.get_series_intervals(start_time, end_time)
 
         except Exception as e:
-            logger.error(f"회의실 예약 목록 조회 실패 (room_id: {room_id}): {e}")
+            logger.error(f"기간 예약 조회 실패 ({start_time} ~ {end_time}): {e}")
             return []
 
+    def get_series_intervals(
+            self,
+            start_time: datetime,
+            end_time: datetime,
+            room_ids: Optional[List[int]] = None,
+            exclude_id: Optional[int] = None
+    ) -> List[Tuple[int, datetime, datetime]]:
+        """기간과 겹치는 반복 예약 회차의 (room_id, start_time, end_time) 목록"""
+        query = self.session.query(
+            ReservationEntity.id,
+            ReservationEntity.room_id,
+            ReservationEntity.start_time,
+            ReservationEntity.end_time,
+            ReservationRecurrenceEntity
+        ).join(ReservationEntity.recurrence).filter(
+            ReservationEntity.start_time < end_time,
+            ReservationRecurrenceEntity.series_end > start_time
+        )
+
+        if room_ids is not None:
+            query = query.filter(ReservationEntity.room_id.in_(room_ids))
+
+        if exclude_id is not None:
+            query = query.filter(ReservationEntity.id != exclude_id)
+
+        return [
+            (room_id, occurrence_start, occurrence_end)
+            for _, room_id, first_start, first_end, recurrence in query.all()
+            for occurrence_start, occurrence_end in expand_occurrences(
+                recurrence.to_rule(), first_start, first_end, start_time, end_time
+            )
+        ]
+
+    @retry_on_database_lock
     def delete(self, reservation_id: int) -> bool:
         """예약 삭제"""
         try:
@@ -101,9 +453,25 @@ class ReservationRepository:
             ).first()
 
             if reservation_entity:
+                # 삭제 후에는 반복 규칙을 읽을 수 없으므로 무효화할 범위를 먼저 계산
+                room_id = reservation_entity.room_id
+                start_time = reservation_entity.start_time
+                end_time = (
+                    reservation_entity.recurrence.series_end if reservation_entity.recurrence
+                    else reservation_entity.end_time
+                )
+
+                self._add_notifications(CANCELLATION, [reservation_entity.to_model()])
                 self.session.delete(reservation_entity)
                 self.session.commit()
 
+                if self.availability_index:
+                    self.availability_index.remove(reservation_id)
+                if self.read_cache:
+                    self.read_cache.invalidate(room_id, start_time, end_time)
+                if self.reminder_scheduler:
+                    self.reminder_scheduler.remove(reservation_id)
+
                 logger.info(f"예약 삭제 완료: reservation_id={reservation_id}")
                 return True
 
@@ -111,6 +479,8 @@ class ReservationRepository:
 
         except Exception as e:
             self.session.rollback()
+            if is_database_locked(e):
+                raise
             logger.error(f"예약 삭제 실패: {e}")
             return False
 
@@ -125,14 +495,258 @@ class ReservationRepository:
             func.date(ReservationEntity.start_time) == today
         ).count()
 
-    def _check_conflict(self, reservation: Reservation) -> bool:
-        """예약 충돌 체크"""
-        conflict_count = self.session.query(ReservationEntity).filter(
-            ReservationEntity.room_id == reservation.room_id,
-            (
-                    (ReservationEntity.start_time < reservation.end_time) &
-                    (ReservationEntity.end_time > reservation.start_time)
+    def _insert_if_free(self, reservation: Reservation) -> Optional[int]:
+        """충돌 체크 INSERT 한 문장으로 예약 삽입
+
+        겹치는 예약이 있으면 아무 행도 삽입하지 않고 None을 반환한다.
+        SQLite는 문장 단위로 쓰기 잠금을 잡으므로 이 문장 하나로 동시 생성이 직렬화되고,
+        MySQL은 회의실 행을 FOR UPDATE로 잠가 같은 회의실의 동시 생성을 직렬화한다.
+        """
+        dialect = self.session.get_bind().dialect
+        self._lock_room(reservation.room_id)
+
+        statement = self._conflict_safe_insert()
+        row = self._to_row(reservation)
+
+        # RETURNING 지원 DB(SQLite 3.35+, MariaDB 등)는 삽입과 ID 조회를 한 번에 처리
+        if dialect.insert_returning:
+            return self.session.execute(
+                statement.returning(ReservationEntity.__table__.c.id), row
+            ).scalar_one_or_none()
+
+        result = self.session.execute(statement, row)
+        return result.lastrowid if result.rowcount else None
+
+    def _find_with_occurrences(
+            self,
+            condition,
+            start_time: Optional[datetime],
+            end_time: Optional[datetime],
+            after: Optional[Tuple[datetime, int]],
+            limit: Optional[int]
+    ) -> List[Reservation]:
+        """조건에 맞는 단일 예약과 반복 예약 회차를 (start_time, id) 순으로 after 이후 limit건 조회
+
+        단일 예약은 키셋 조건과 LIMIT을 SQL로 내려보내고, 반복 예약은 기간 내 회차만 전개해 병합한다.
+        """
+        single_query = self.session.query(ReservationEntity).filter(condition, SINGLE_RESERVATION)
+        series_query = self.session.query(ReservationEntity).join(ReservationEntity.recurrence).filter(condition)
+
+        if start_time:
+            single_query = single_query.filter(ReservationEntity.end_time > start_time)
+            series_query = series_query.filter(ReservationRecurrenceEntity.series_end > start_time)
+
+        if end_time:
+            single_query = single_query.filter(ReservationEntity.start_time < end_time)
+            series_query = series_query.filter(ReservationEntity.start_time < end_time)
+
+        if after:
+            single_query = single_query.filter(
+                keyset_after((ReservationEntity.start_time, ReservationEntity.id), after)
             )
-        ).count()
 
-        return conflict_count > 0
+        single_query = single_query.order_by(ReservationEntity.start_time, ReservationEntity.id)
+        if limit is not None:
+            single_query = single_query.limit(limit)
+
+        reservations = [entity.to_model() for entity in single_query.all()]
+
+        for entity in series_query.all():
+            reservation = entity.to_model()
+            occurrences = (
+                replace(reservation, start_time=occurrence_start, end_time=occurrence_end)
+                for occurrence_start, occurrence_end in expand_occurrences(
+                    reservation.recurrence, entity.start_time, entity.end_time, start_time, end_time
+                )
+                if after is None or (occurrence_start, entity.id) > after
+            )
+            reservations.extend(islice(occurrences, limit))
+
+        reservations.sort(key=lambda reservation: (reservation.start_time, reservation.id))
+        return reservations[:limit]
+
+    def _add_notifications(self, notification_type: str, reservations: List[Reservation]):
+        """예약 변경과 같은 트랜잭션에 알림 기록 (커밋되면 릴레이가 발송)"""
+        if self.notification_outbox:
+            NotificationOutboxRepository(self.session).add(notification_type, reservations)
+
+    def _insert_participants(self, participants_by_id: Dict[int, List[str]]):
+        """예약-참가자 연관 행 일괄 삽입"""
+        rows = [
+            {'reservation_id': reservation_id, 'email': email}
+            for reservation_id, participants in participants_by_id.items()
+            for email in normalize_emails(participants)
+        ]
+        if rows:
+            self.session.execute(insert(ReservationParticipantEntity), rows)
+
+    def _lock_room(self, room_id: int):
+        """SQLite 외 DB에서 회의실 행을 잠가 같은 회의실의 동시 예약 생성을 직렬화"""
+        if self.session.get_bind().dialect.name != 'sqlite':
+            self.session.execute(
+                select(MeetingRoomEntity.id).where(MeetingRoomEntity.id == room_id).with_for_update()
+            )
+
+    @staticmethod
+    def _conflict_safe_insert():
+        """INSERT ... SELECT ... WHERE NOT EXISTS(겹치는 예약) 문장 (executemany 가능)"""
+        table = ReservationEntity.__table__
+        params = {name: bindparam(name, type_=table.c[name].type) for name in INSERT_COLUMNS}
+
+        conflict = exists().where(
+            ReservationEntity.room_id == params['room_id'],
+            ReservationEntity.start_time < params['end_time'],
+            ReservationEntity.end_time > params['start_time'],
+            SINGLE_RESERVATION
+        )
+        return insert(table).from_select(list(params), select(*params.values()).where(~conflict))
+
+    @staticmethod
+    def _to_row(reservation: Reservation) -> dict:
+        """충돌 체크 INSERT 파라미터"""
+        return {
+            'room_id': reservation.room_id,
+            'title': reservation.title,
+            'description': reservation.description,
+            'start_time': reservation.start_time,
+            'end_time': reservation.end_time,
+            'organizer_email': reservation.organizer_email,
+            'participants': json.dumps(reservation.participants, ensure_ascii=False)
+        }
+
+    def _find_bulk_conflicts(self, reservations: List[Reservation]) -> Dict[int, str]:
+        """회의실별로 시작 시간 정렬 후 스윕하여 DB 예약/요청 내 다른 항목과의 충돌 검출"""
+        if not reservations:
+            return {}
+
+        room_ids = sorted({reservation.room_id for reservation in reservations})
+        window_start = min(reservation.start_time for reservation in reservations)
+        window_end = max(reservation.end_time for reservation in reservations)
+
+        # 관련 회의실의 기존 예약(반복 예약 회차 포함)을 한 번에 조회
+        booked = defaultdict(list)
+        for room_id, start_time, end_time in self.session.query(
+                ReservationEntity.room_id,
+                ReservationEntity.start_time,
+                ReservationEntity.end_time
+        ).filter(
+            ReservationEntity.room_id.in_(room_ids),
+            ReservationEntity.start_time < window_end,
+            ReservationEntity.end_time > window_start,
+            SINGLE_RESERVATION
+        ):
+            booked[room_id].append((start_time, end_time))
+
+        for room_id, start_time, end_time in self.get_series_intervals(window_start, window_end, room_ids):
+            booked[room_id].append((start_time, end_time))
+
+        by_room = defaultdict(list)
+        for i, reservation in enumerate(reservations):
+            by_room[reservation.room_id].append(i)
+
+        errors = {}
+        for room_id, indexes in by_room.items():
+            # 같은 회의실 예약끼리는 겹치지 않으므로 시작 시간으로 정렬하면 종료 시간도 정렬됨
+            indexes.sort(key=lambda i: (reservations[i].start_time, reservations[i].end_time))
+            overlaps = find_overlaps(
+                [(reservations[i].start_time, reservations[i].end_time) for i in indexes],
+                sorted(booked[room_id])
+            )
+            last_end = None
+
+            for i, overlapped in zip(indexes, overlaps):
+                reservation = reservations[i]
+                if overlapped:
+                    errors[i] = "해당 시간에 이미 예약이 있습니다"
+                elif last_end is not None and reservation.start_time < last_end:
+                    errors[i] = "같은 요청의 다른 예약과 시간이 겹칩니다"
+                else:
+                    last_end = reservation.end_time
+
+        return errors
+
+    def _bulk_conflicts_with_series(self, reservations: List[Reservation]) -> bool:
+        """일괄 삽입한 예약이 그 사이 생성된 반복 예약 회차와 겹치는지 확인"""
+        series = self.get_series_intervals(
+            min(reservation.start_time for reservation in reservations),
+            max(reservation.end_time for reservation in reservations),
+            sorted({reservation.room_id for reservation in reservations})
+        )
+        return any(
+            room_id == reservation.room_id
+            and start_time < reservation.end_time
+            and end_time > reservation.start_time
+            for room_id, start_time, end_time in series
+            for reservation in reservations
+        )
+
+    def _find_conflicts(
+            self,
+            room_id: int,
+            occurrences: List[Tuple[datetime, datetime]],
+            exclude_id: Optional[int] = None
+    ) -> List[bool]:
+        """시작 시각 순 구간 각각이 회의실의 단일 예약/다른 반복 예약 회차와 겹치는지 (한 번에 스윕)"""
+        if not occurrences:
+            return []
+
+        window_start, window_end = occurrences[0][0], occurrences[-1][1]
+        booked = [
+            tuple(row) for row in self.session.query(
+                ReservationEntity.start_time,
+                ReservationEntity.end_time
+            ).filter(
+                ReservationEntity.room_id == room_id,
+                ReservationEntity.start_time < window_end,
+                ReservationEntity.end_time > window_start,
+                ReservationEntity.id != exclude_id,
+                SINGLE_RESERVATION
+            ).all()
+        ]
+        booked.extend(self._series_booked(room_id, window_start, window_end, exclude_id))
+        return find_overlaps(occurrences, sorted(booked))
+
+    def _find_series_conflicts(
+            self,
+            room_id: int,
+            occurrences: List[Tuple[datetime, datetime]],
+            exclude_id: Optional[int] = None
+    ) -> List[bool]:
+        """시작 시각 순 구간 각각이 반복 예약 회차와 겹치는지"""
+        if not occurrences:
+            return []
+
+        booked = self._series_booked(room_id, occurrences[0][0], occurrences[-1][1], exclude_id)
+        return find_overlaps(occurrences, sorted(booked))
+
+    def _series_booked(
+            self,
+            room_id: int,
+            start_time: datetime,
+            end_time: datetime,
+            exclude_id: Optional[int] = None
+    ) -> List[Tuple[datetime, datetime]]:
+        """회의실의 반복 예약 회차 구간"""
+        return [
+            (occurrence_start, occurrence_end)
+            for _, occurrence_start, occurrence_end in self.get_series_intervals(
+                start_time, end_time, [room_id], exclude_id
+            )
+        ]
+
+    def _find_inserted_ids(self, reservations: List[Reservation]) -> Dict[Tuple[int, datetime], int]:
+        """삽입한 예약의 (room_id, start_time) -> ID (같은 회의실 예약은 겹치지 않으므로 유일)"""
+        if not reservations:
+            return {}
+
+        rows = self.session.query(
+            ReservationEntity.id,
+            ReservationEntity.room_id,
+            ReservationEntity.start_time
+        ).filter(
+            tuple_(ReservationEntity.room_id, ReservationEntity.start_time).in_(
+                [(reservation.room_id, reservation.start_time) for reservation in reservations]
+            )
+        ).all()
+
+        return {(room_id, start_time): reservation_id for reservation_id, room_id, start_time in rows}
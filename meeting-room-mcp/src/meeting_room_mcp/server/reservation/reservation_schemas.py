@@ -1,8 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional, List
 
 
+@dataclass
+class RecurrenceRule:
+    """반복 예약 규칙 (count 또는 until로 종료)"""
+    frequency: str  # daily, weekly, monthly
+    interval: int = 1
+    count: Optional[int] = None  # 총 반복 횟수
+    until: Optional[datetime] = None  # 마지막 회차 시작 시각 상한
+    exceptions: List[datetime] = field(default_factory=list)  # 제외할 회차 시작 시각
+
+
 @dataclass
 class Reservation:
     """예약 모델"""
@@ -15,6 +25,7 @@ class Reservation:
     organizer_email: str
     participants: List[str]
     created_at: Optional[datetime] = None
+    recurrence: Optional[RecurrenceRule] = None
 
     def __post_init__(self):
         if self.created_at is None:
@@ -30,3 +41,15 @@ class Reservation:
     def participant_count(self) -> int:
         """참가자 수"""
         return len(self.participants)
+
+
+@dataclass
+class BulkReservationResult:
+    """일괄 예약 항목별 결과"""
+    index: int
+    reservation_id: Optional[int] = None
+    error: Optional[str] = None
+
+    @property
+    def success(self) -> bool:
+        return self.reservation_id is not None
@@ -4,40 +4,116 @@
 
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import TYPE_CHECKING, List, Optional
 
-from src.meeting_room_mcp.config.database_config import DatabaseConfig
+from sqlalchemy.orm import Session
+
+from src.meeting_room_mcp.config.database_config import AsyncDatabaseConfig
+from src.meeting_room_mcp.server.read_cache import CacheScope, ReadCache, read_through
+from src.meeting_room_mcp.server.reservation.recurrence import expand_occurrences, series_end, validate_rule
 from src.meeting_room_mcp.server.reservation.reservation_repository import ReservationRepository
-from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+from src.meeting_room_mcp.server.reservation.reservation_schemas import BulkReservationResult, Reservation
+from src.meeting_room_mcp.server.room.availability_index import AvailabilityIndex
+from src.meeting_room_mcp.shared.pagination import Page, decode_cursor, paginate, validate_limit
+
+if TYPE_CHECKING:
+    from src.meeting_room_mcp.server.notification.reminder_scheduler import ReminderScheduler
 
 logger = logging.getLogger(__name__)
 
+# 일괄 예약 한 번에 받을 수 있는 최대 건수
+MAX_BULK_RESERVATIONS = 500
+
 
 class ReservationService:
     """예약 비즈니스 로직"""
 
-    def __init__(self, db_config: DatabaseConfig):
+    def __init__(
+            self,
+            db_config: AsyncDatabaseConfig,
+            availability_index: Optional[AvailabilityIndex] = None,
+            read_cache: Optional[ReadCache] = None,
+            notification_outbox: bool = False,
+            reminder_scheduler: Optional['ReminderScheduler'] = None
+    ):
         self.db_config = db_config
+        self.availability_index = availability_index
+        self.read_cache = read_cache
+        self.notification_outbox = notification_outbox
+        self.reminder_scheduler = reminder_scheduler
 
-    def create_reservation(self, reservation: Reservation) -> int:
-        """예약 생성"""
+    async def create_reservation(self, reservation: Reservation) -> int:
+        """예약 생성 (recurrence가 있으면 반복 예약)"""
         # 비즈니스 규칙 검증
         self._validate_reservation(reservation)
 
-        with self.db_config.get_session() as session:
-            reservation_repo = ReservationRepository(session)
-            return reservation_repo.create(reservation)
+        if reservation.recurrence:
+            validate_rule(reservation.recurrence, reservation.start_time, reservation.end_time)
+            if next(expand_occurrences(
+                    reservation.recurrence, reservation.start_time, reservation.end_time
+            ), None) is None:
+                raise ValueError("모든 회차가 제외되어 생성할 예약이 없습니다")
+
+            return await self.db_config.run_sync(
+                lambda session: self._repository(session).create_series(reservation)
+            )
+
+        return await self.db_config.run_sync(
+            lambda session: self._repository(session).create(reservation)
+        )
+
+    async def create_reservations_bulk(
+            self,
+            reservations: List[Reservation],
+            all_or_nothing: bool = True
+    ) -> List[BulkReservationResult]:
+        """예약 일괄 생성 (한 트랜잭션)"""
+        if len(reservations) > MAX_BULK_RESERVATIONS:
+            raise ValueError(f"일괄 예약은 한 번에 {MAX_BULK_RESERVATIONS}건을 초과할 수 없습니다")
 
-    def get_reservation_details(self, reservation_id: int) -> Optional[Reservation]:
+        # 비즈니스 규칙 검증은 항목별로
+        results: List[Optional[BulkReservationResult]] = [None] * len(reservations)
+        valid_indexes = []
+        for i, reservation in enumerate(reservations):
+            try:
+                if reservation.recurrence:
+                    raise ValueError("반복 예약은 일괄 생성할 수 없습니다")
+                self._validate_reservation(reservation)
+                valid_indexes.append(i)
+            except ValueError as e:
+                results[i] = BulkReservationResult(index=i, error=str(e))
+
+        if all_or_nothing and len(valid_indexes) < len(reservations):
+            return [
+                result or BulkReservationResult(index=i, error="다른 항목 오류로 생성하지 않았습니다")
+                for i, result in enumerate(results)
+            ]
+
+        valid_reservations = [reservations[i] for i in valid_indexes]
+        created = await self.db_config.run_sync(
+            lambda session: self._repository(session).create_bulk(valid_reservations, all_or_nothing)
+        )
+
+        # 저장소 결과의 index를 원래 요청 순서로 변환
+        for result in created:
+            result.index = valid_indexes[result.index]
+            results[result.index] = result
+
+        return results
+
+    async def get_reservation_details(self, reservation_id: int) -> Optional[Reservation]:
         """예약 상세 정보 조회"""
-        with self.db_config.get_session() as session:
-            reservation_repo = ReservationRepository(session)
-            return reservation_repo.get_by_id(reservation_id)
+        async def load() -> Optional[Reservation]:
+            return await self.db_config.run_sync(
+                lambda session: self._repository(session).get_by_id(reservation_id), read_only=True
+            )
+
+        return await read_through(self.read_cache, ('get_reservation_details', reservation_id), load, self._scope_of)
 
-    def cancel_reservation(self, reservation_id: int) -> bool:
+    async def cancel_reservation(self, reservation_id: int) -> bool:
         """예약 취소"""
-        with self.db_config.get_session() as session:
-            reservation_repo = ReservationRepository(session)
+        def cancel(session: Session) -> bool:
+            reservation_repo = self._repository(session)
 
             # 예약 존재 여부 확인
             reservation = reservation_repo.get_by_id(reservation_id)
@@ -50,21 +126,77 @@ class ReservationService:
 
             return reservation_repo.delete(reservation_id)
 
-    def get_room_reservations(
+        return await self.db_config.run_sync(cancel)
+
+    async def cancel_occurrence(self, reservation_id: int, occurrence_start: datetime) -> bool:
+        """반복 예약의 한 회차 취소"""
+        if (occurrence_start - datetime.now()).total_seconds() / 3600 < 1:
+            raise ValueError("예약 취소 불가: 시작 시간이 너무 가까움")
+
+        return await self.db_config.run_sync(
+            lambda session: self._repository(session).add_exception(reservation_id, occurrence_start)
+        )
+
+    async def get_room_reservations(
             self,
             room_id: int,
             start_date: Optional[datetime] = None,
-            end_date: Optional[datetime] = None
-    ) -> List[Reservation]:
-        """특정 회의실의 예약 목록 조회"""
-        with self.db_config.get_session() as session:
-            reservation_repo = ReservationRepository(session)
-            return reservation_repo.get_by_room(room_id, start_date, end_date)
-
-    def get_reservation_statistics(self) -> dict:
+            end_date: Optional[datetime] = None,
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None
+    ) -> Page[Reservation]:
+        """특정 회의실의 예약 목록 조회 (키셋 페이지네이션, limit 미지정 시 전체)"""
+        if limit is not None:
+            validate_limit(limit)
+        after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
+
+        async def load() -> Page[Reservation]:
+            reservations = await self.db_config.run_sync(
+                lambda session: self._repository(session).get_by_room(
+                    room_id, start_date, end_date, after, limit + 1 if limit is not None else None
+                ),
+                read_only=True
+            )
+            return paginate(reservations, limit, self._page_key)
+
+        return await read_through(
+            self.read_cache,
+            ('get_room_reservations', room_id, start_date, end_date, limit, cursor),
+            load,
+            CacheScope(frozenset([room_id]), start_date, end_date)
+        )
+
+    async def get_my_reservations(
+            self,
+            email: str,
+            start_time: datetime,
+            end_time: datetime,
+            limit: int = 20,
+            cursor: Optional[str] = None
+    ) -> Page[Reservation]:
+        """주최자 또는 참가자로 포함된 예약 목록 조회 (키셋 페이지네이션)"""
+        validate_limit(limit)
+        after = decode_cursor(cursor, datetime.fromisoformat, int) if cursor else None
+
+        async def load() -> Page[Reservation]:
+            # 다음 페이지 존재 여부 확인용으로 한 건 더 조회
+            reservations = await self.db_config.run_sync(
+                lambda session: self._repository(session).get_by_email(email, start_time, end_time, after, limit + 1),
+                read_only=True
+            )
+            return paginate(reservations, limit, self._page_key)
+
+        return await read_through(
+            self.read_cache,
+            ('get_my_reservations', email.strip(), start_time, end_time, limit, cursor),
+            load,
+            CacheScope(start=start_time, end=end_time)
+        )
+
+    async def get_reservation_statistics(self) -> dict:
         """예약 통계 정보"""
-        with self.db_config.get_session() as session:
-            reservation_repo = ReservationRepository(session)
+        def count(session: Session) -> dict:
+            reservation_repo = self._repository(session)
 
             total_reservations = reservation_repo.get_reservation_count()
             today_reservations = reservation_repo.get_today_reservation_count()
@@ -74,6 +206,27 @@ class ReservationService:
                 'today_reservations': today_reservations
             }
 
+        return await self.db_config.run_sync(count, read_only=True)
+
+    def _repository(self, session: Session) -> ReservationRepository:
+        """세션에 묶인 예약 Repository 생성"""
+        return ReservationRepository(
+            session, self.availability_index, self.read_cache, self.notification_outbox, self.reminder_scheduler
+        )
+
+    @staticmethod
+    def _scope_of(reservation: Reservation) -> CacheScope:
+        """예약 한 건의 캐시 범위 (반복 예약은 마지막 회차까지)"""
+        end_time = reservation.end_time
+        if reservation.recurrence:
+            end_time = series_end(reservation.recurrence, reservation.start_time, reservation.end_time)
+        return CacheScope(frozenset([reservation.room_id]), reservation.start_time, end_time)
+
+    @staticmethod
+    def _page_key(reservation: Reservation) -> tuple:
+        """예약 목록 정렬/커서 키"""
+        return reservation.start_time.isoformat(), reservation.id
+
     def _validate_reservation(self, reservation: Reservation):
         """예약 유효성 검증"""
         current_time = datetime.now()
@@ -102,7 +255,18 @@ class ReservationService:
     def _can_cancel_reservation(self, reservation: Reservation) -> bool:
         """예약 취소 가능 여부 확인"""
         current_time = datetime.now()
-        time_until_start = (reservation.start_time - current_time).total_seconds() / 3600
+        start_time = reservation.start_time
+
+        # 반복 예약은 다가오는 회차 기준 (남은 회차가 없으면 취소 가능)
+        if reservation.recurrence:
+            upcoming = next(expand_occurrences(
+                reservation.recurrence, reservation.start_time, reservation.end_time, current_time
+            ), None)
+            if upcoming is None:
+                return True
+            start_time = upcoming[0]
+
+        time_until_start = (start_time - current_time).total_seconds() / 3600
 
         # 시작 시간 1시간 전까지만 취소 가능
         return time_until_start >= 1
@@ -4,16 +4,25 @@
 
 import logging
 from datetime import datetime
-from typing import List
+from typing import Any, Dict, List
 
 from fastmcp import FastMCP
 
-from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+from src.meeting_room_mcp.server.reservation.reservation_schemas import RecurrenceRule, Reservation
 from src.meeting_room_mcp.server.reservation.reservation_service import ReservationService
+from src.meeting_room_mcp.server.response_format import (
+    render_error, render_list, render_not_found, render_object, validate_format
+)
 from src.meeting_room_mcp.server.services import RoomService
 
 logger = logging.getLogger(__name__)
 
+FREQUENCY_LABELS = {'daily': '일', 'weekly': '주', 'monthly': '개월'}
+
+RESERVATION_COLUMNS = (
+    'id', 'room_id', 'title', 'start_time', 'end_time', 'organizer_email', 'participants'
+)
+
 
 def register_reservation_tools(
         app: FastMCP,
@@ -23,17 +32,20 @@ def register_reservation_tools(
     """예약 관련 도구 등록"""
 
     @app.tool()
-    def create_reservation(
+    async def create_reservation(
             room_id: int,
             title: str,
             description: str,
             start_time: str,  # ISO 8601
             end_time: str,  # ISO 8601
             organizer_email: str,
-            participants: List[str]  # 참가자 이메일 목록
+            participants: List[str],  # 참가자 이메일 목록
+            format: str = "prose"  # 응답 형식: prose, json, compact
     ) -> str:
         """회의실 예약을 생성합니다."""
         try:
+            validate_format(format)
+
             # 시간 변환
             start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
             end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
@@ -51,23 +63,131 @@ def register_reservation_tools(
             )
 
             # 예약 생성
-            reservation_id = reservation_service.create_reservation(reservation)
+            reservation_id = await reservation_service.create_reservation(reservation)
 
-            return f"예약이 성공적으로 생성되었습니다. 예약 ID: {reservation_id}"
+            return render_object(
+                format, {'reservation_id': reservation_id}, ('reservation_id',),
+                lambda: f"예약이 성공적으로 생성되었습니다. 예약 ID: {reservation_id}"
+            )
 
         except Exception as e:
             logger.error(f"예약 생성 오류: {e}")
-            return f"오류: {e}"
+            return render_error(format, str(e))
+
+    @app.tool()
+    async def create_recurring_reservation(
+            room_id: int,
+            title: str,
+            description: str,
+            start_time: str,  # 첫 회차 시작 (ISO 8601)
+            end_time: str,  # 첫 회차 종료 (ISO 8601)
+            organizer_email: str,
+            participants: List[str],  # 참가자 이메일 목록
+            frequency: str,  # daily, weekly, monthly
+            interval: int = 1,  # 반복 간격 (예: 2주마다면 2)
+            count: int = 0,  # 총 반복 횟수 (0이면 until 사용)
+            until: str = "",  # 마지막 회차 시작 상한 (ISO 8601)
+            exceptions: List[str] = [],  # 제외할 회차 시작 시각 (ISO 8601)
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
+        """반복 회의실 예약을 생성합니다. 모든 회차의 충돌을 한 번에 확인합니다."""
+        try:
+            validate_format(format)
+
+            reservation = Reservation(
+                id=None,
+                room_id=room_id,
+                title=title,
+                description=description,
+                start_time=datetime.fromisoformat(start_time.replace('Z', '+00:00')),
+                end_time=datetime.fromisoformat(end_time.replace('Z', '+00:00')),
+                organizer_email=organizer_email,
+                participants=participants,
+                recurrence=RecurrenceRule(
+                    frequency=frequency,
+                    interval=interval,
+                    count=count or None,
+                    until=datetime.fromisoformat(until.replace('Z', '+00:00')) if until else None,
+                    exceptions=[datetime.fromisoformat(value.replace('Z', '+00:00')) for value in exceptions]
+                )
+            )
+
+            reservation_id = await reservation_service.create_reservation(reservation)
+
+            return render_object(
+                format, {'reservation_id': reservation_id}, ('reservation_id',),
+                lambda: f"반복 예약이 성공적으로 생성되었습니다. 예약 ID: {reservation_id}"
+            )
+
+        except Exception as e:
+            logger.error(f"반복 예약 생성 오류: {e}")
+            return render_error(format, str(e))
+
+    @app.tool()
+    async def create_reservations_bulk(
+            reservations: List[Dict[str, Any]],  # create_reservation과 같은 필드의 예약 목록
+            all_or_nothing: bool = True,  # True면 하나라도 실패 시 전부 취소, False면 가능한 항목만 생성
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
+        """여러 회의실 예약을 한 번에 생성합니다."""
+        try:
+            validate_format(format)
+
+            # 예약 객체 생성
+            parsed = []
+            for i, item in enumerate(reservations):
+                try:
+                    parsed.append(Reservation(
+                        id=None,
+                        room_id=int(item['room_id']),
+                        title=item['title'],
+                        description=item.get('description', ''),
+                        start_time=datetime.fromisoformat(item['start_time'].replace('Z', '+00:00')),
+                        end_time=datetime.fromisoformat(item['end_time'].replace('Z', '+00:00')),
+                        organizer_email=item['organizer_email'],
+                        participants=item.get('participants', [])
+                    ))
+                except (KeyError, TypeError, ValueError) as e:
+                    return render_error(format, f"{i + 1}번째 예약 형식이 올바르지 않습니다 ({e})")
+
+            results = await reservation_service.create_reservations_bulk(parsed, all_or_nothing)
+
+            def prose() -> str:
+                succeeded = sum(1 for result in results if result.success)
+
+                lines = [f"일괄 예약 결과: 성공 {succeeded}건, 실패 {len(results) - succeeded}건\n\n"]
+                for item in results:
+                    reservation = parsed[item.index]
+                    lines.append(
+                        f"{item.index + 1}. 회의실 {reservation.room_id}, "
+                        f"{reservation.start_time.strftime('%Y-%m-%d %H:%M')} ~ {reservation.end_time.strftime('%H:%M')}: "
+                    )
+                    lines.append(f"예약 ID {item.reservation_id}\n" if item.success else f"실패 - {item.error}\n")
+                return ''.join(lines)
+
+            return render_list(format, results, ('index', 'reservation_id', 'error'), prose)
+
+        except Exception as e:
+            logger.error(f"일괄 예약 생성 오류: {e}")
+            return render_error(format, str(e))
 
     @app.tool()
-    def get_reservation_details(reservation_id: int) -> str:
+    async def get_reservation_details(
+            reservation_id: int,
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
         """예약 상세 정보를 조회합니다."""
         try:
-            reservation = reservation_service.get_reservation_details(reservation_id)
+            validate_format(format)
+
+            reservation = await reservation_service.get_reservation_details(reservation_id)
             if not reservation:
-                return f"예약 ID {reservation_id}를 찾을 수 없습니다."
+                return render_not_found(format, f"예약 ID {reservation_id}를 찾을 수 없습니다.")
+
+            if format != 'prose':
+                return render_object(format, reservation, RESERVATION_COLUMNS, None)
 
-            room = room_service.get_room_info(reservation.room_id)
+            room = await room_service.get_room_info(reservation.room_id)
 
             result = f"예약 상세 정보 (ID: {reservation_id}):\n"
             result += f"• 제목: {reservation.title}\n"
@@ -78,27 +198,157 @@ def register_reservation_tools(
             result += f"• 주최자: {reservation.organizer_email}\n"
             result += f"• 참가자: {', '.join(reservation.participants)}\n"
 
+            if reservation.recurrence:
+                rule = reservation.recurrence
+                result += f"• 반복: {rule.interval}{FREQUENCY_LABELS.get(rule.frequency, rule.frequency)}마다"
+                if rule.count:
+                    result += f", {rule.count}회"
+                if rule.until:
+                    result += f", {rule.until.strftime('%Y-%m-%d')}까지"
+                result += "\n"
+                if rule.exceptions:
+                    result += f"• 제외 회차: {', '.join(value.strftime('%Y-%m-%d %H:%M') for value in rule.exceptions)}\n"
+
             return result
 
         except Exception as e:
             logger.error(f"예약 조회 오류: {e}")
-            return f"오류: {e}"
+            return render_error(format, str(e))
+
+    @app.tool()
+    async def get_my_reservations(
+            email: str,
+            start_time: str,  # 조회 시작 (ISO 8601)
+            end_time: str,  # 조회 종료 (ISO 8601)
+            limit: int = 20,  # 페이지 크기
+            cursor: str = "",  # 이전 결과의 다음 페이지 커서
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
+        """주최하거나 참가하는 예약 목록을 조회합니다."""
+        try:
+            validate_format(format)
+
+            start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
+            end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
+
+            page = await reservation_service.get_my_reservations(email, start_dt, end_dt, limit, cursor or None)
+            if format != 'prose':
+                return render_list(format, page.items, RESERVATION_COLUMNS, None, page.next_cursor)
+
+            if not page.items:
+                return f"{email}의 예약이 없습니다."
+
+            rooms = await room_service.get_rooms_by_ids({reservation.room_id for reservation in page.items})
+
+            lines = [f"{email}의 예약 ({len(page.items)}건):\n\n"]
+            for reservation in page.items:
+                role = "주최" if reservation.organizer_email.lower() == email.strip().lower() else "참가"
+                lines.append(
+                    f"ID: {reservation.id}, [{role}] {reservation.title}, "
+                    f"{reservation.start_time.strftime('%Y-%m-%d %H:%M')} ~ {reservation.end_time.strftime('%H:%M')}, "
+                    f"회의실: {rooms[reservation.room_id].name if reservation.room_id in rooms else '알 수 없음'}\n"
+                )
+
+            if page.next_cursor:
+                lines.append(f"\n다음 페이지 커서: {page.next_cursor}\n")
+
+            return ''.join(lines)
+
+        except Exception as e:
+            logger.error(f"내 예약 조회 오류: {e}")
+            return render_error(format, str(e))
+
+    @app.tool()
+    async def get_room_reservations(
+            room_id: int,
+            start_time: str = "",  # 조회 시작 (ISO 8601, 생략 시 제한 없음)
+            end_time: str = "",  # 조회 종료 (ISO 8601, 생략 시 제한 없음)
+            limit: int = 20,  # 페이지 크기
+            cursor: str = "",  # 이전 결과의 다음 페이지 커서
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
+        """특정 회의실의 예약 목록을 시간순으로 조회합니다."""
+        try:
+            validate_format(format)
+
+            start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00')) if start_time else None
+            end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00')) if end_time else None
+
+            page = await reservation_service.get_room_reservations(room_id, start_dt, end_dt, limit, cursor or None)
+
+            def prose() -> str:
+                if not page.items:
+                    return f"회의실 ID {room_id}의 예약이 없습니다."
+
+                lines = [f"회의실 ID {room_id}의 예약 ({len(page.items)}건):\n\n"]
+                lines.extend(
+                    f"ID: {reservation.id}, {reservation.title}, "
+                    f"{reservation.start_time.strftime('%Y-%m-%d %H:%M')} ~ {reservation.end_time.strftime('%H:%M')}, "
+                    f"주최자: {reservation.organizer_email}\n"
+                    for reservation in page.items
+                )
+                if page.next_cursor:
+                    lines.append(f"\n다음 페이지 커서: {page.next_cursor}\n")
+                return ''.join(lines)
+
+            return render_list(format, page.items, RESERVATION_COLUMNS, prose, page.next_cursor)
+
+        except Exception as e:
+            logger.error(f"회의실 예약 목록 조회 오류: {e}")
+            return render_error(format, str(e))
 
     @app.tool()
-    def cancel_reservation(reservation_id: int, reason: str = "") -> str:
+    async def cancel_reservation(
+            reservation_id: int,
+            reason: str = "",
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
         """예약을 취소합니다."""
         try:
+            validate_format(format)
+
             # 예약 취소
-            if reservation_service.cancel_reservation(reservation_id):
+            if await reservation_service.cancel_reservation(reservation_id):
                 result = f"예약 ID {reservation_id}가 성공적으로 취소되었습니다."
                 if reason:
                     result += f"\n취소 사유: {reason}"
-                return result
+                return render_object(
+                    format, {'reservation_id': reservation_id, 'cancelled': True}, ('reservation_id', 'cancelled'),
+                    lambda: result
+                )
             else:
-                return f"예약 ID {reservation_id}를 찾을 수 없습니다."
+                return render_not_found(format, f"예약 ID {reservation_id}를 찾을 수 없습니다.")
 
         except ValueError as e:
-            return f"취소 실패: {e}"
+            return render_not_found(format, f"취소 실패: {e}")
         except Exception as e:
             logger.error(f"예약 취소 오류: {e}")
-            return f"오류: {e}"
+            return render_error(format, str(e))
+
+    @app.tool()
+    async def cancel_reservation_occurrence(
+            reservation_id: int,
+            occurrence_start: str,
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
+        """반복 예약의 특정 회차 하나만 취소합니다."""
+        try:
+            validate_format(format)
+
+            occurrence_dt = datetime.fromisoformat(occurrence_start.replace('Z', '+00:00'))
+
+            if await reservation_service.cancel_occurrence(reservation_id, occurrence_dt):
+                return render_object(
+                    format,
+                    {'reservation_id': reservation_id, 'occurrence_start': occurrence_dt, 'cancelled': True},
+                    ('reservation_id', 'occurrence_start', 'cancelled'),
+                    lambda: f"예약 ID {reservation_id}의 {occurrence_dt.strftime('%Y-%m-%d %H:%M')} 회차가 취소되었습니다."
+                )
+            else:
+                return render_not_found(format, f"예약 ID {reservation_id}에서 해당 회차를 찾을 수 없습니다.")
+
+        except ValueError as e:
+            return render_not_found(format, f"취소 실패: {e}")
+        except Exception as e:
+            logger.error(f"반복 예약 회차 취소 오류: {e}")
+            return render_error(format, str(e))
@@ -0,0 +1,100 @@
+"""
+MCP 도구 응답 포맷
+
+prose: 기존 한국어 문장 (기본값)
+json: MeetingRoom/Reservation 필드 그대로의 JSON (orjson 직렬화)
+compact: 헤더 한 줄 + 행마다 '|' 구분 값 (LLM 컨텍스트 토큰 절약용)
+"""
+
+from datetime import datetime
+from enum import Enum
+from operator import attrgetter, itemgetter
+from typing import Any, Callable, List, Optional, Sequence
+
+import orjson
+
+from src.meeting_room_mcp.server.tool_metrics import mark_tool_failed
+
+FORMATS = ('prose', 'json', 'compact')
+
+
+def validate_format(format: str):
+    """응답 포맷 검증"""
+    if format not in FORMATS:
+        raise ValueError(f"format은 {', '.join(FORMATS)} 중 하나여야 합니다")
+
+
+def dumps(data: Any) -> str:
+    """dataclass/datetime/Enum을 포함한 값을 JSON 문자열로 직렬화"""
+    return orjson.dumps(data).decode()
+
+
+def compact_table(rows: Sequence[Any], columns: Sequence[str], next_cursor: Optional[str] = None) -> str:
+    """객체(또는 dict) 목록을 '|' 구분 표로 변환 (datetime은 분 단위, Enum은 값)"""
+    lines = ['|'.join(columns)]
+    if rows:
+        # attrgetter/itemgetter는 칸이 하나면 튜플이 아닌 값 하나를 반환
+        getter = (itemgetter if isinstance(rows[0], dict) else attrgetter)(*columns)
+        single = len(columns) == 1
+        for row in rows:
+            values = (getter(row),) if single else getter(row)
+            lines.append('|'.join(map(_compact_value, values)))
+
+    if next_cursor:
+        lines.append(f"next_cursor={next_cursor}")
+
+    return '\n'.join(lines)
+
+
+def render_list(
+        format: str,
+        items: List[Any],
+        columns: Sequence[str],
+        prose: Callable[[], str],
+        next_cursor: Optional[str] = None
+) -> str:
+    """목록 응답을 포맷에 맞게 변환 (prose는 필요할 때만 생성)"""
+    if format == 'json':
+        return dumps({'items': items, 'next_cursor': next_cursor})
+    if format == 'compact':
+        return compact_table(items, columns, next_cursor)
+    return prose()
+
+
+def render_object(format: str, data: Any, columns: Sequence[str], prose: Callable[[], str]) -> str:
+    """단건 응답을 포맷에 맞게 변환"""
+    if format == 'json':
+        return dumps(data)
+    if format == 'compact':
+        return compact_table([data], columns)
+    return prose()
+
+
+def render_error(format: str, message: str) -> str:
+    """오류 응답 (도구 호출 지표에 오류로 기록)"""
+    mark_tool_failed()
+    if format == 'json':
+        return dumps({'error': message})
+    return f"오류: {message}"
+
+
+def render_not_found(format: str, message: str) -> str:
+    """대상 없음 응답 (prose는 메시지 그대로)"""
+    if format == 'json':
+        return dumps({'error': message})
+    return message
+
+
+def _compact_value(value: Any) -> str:
+    """표 칸 값 문자열 변환"""
+    if value is None:
+        return ''
+    if isinstance(value, int):
+        return str(value)
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d %H:%M')
+    if isinstance(value, Enum):
+        return str(value.value)
+    if isinstance(value, (list, tuple)):
+        return ','.join(_compact_value(item) for item in value)
+    return str(value).replace('|', '/').replace('\n', ' ')
@@ -0,0 +1,129 @@
+"""
+회의실 가용성 인메모리 인덱스
+"""
+
+import logging
+import threading
+from bisect import bisect_left, insort
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, Iterable, List, Set, Tuple
+
+from sqlalchemy.orm import Session
+
+from src.meeting_room_mcp.server.entities import ReservationEntity, ReservationRecurrenceEntity
+from src.meeting_room_mcp.server.reservation.recurrence import expand_occurrences
+
+logger = logging.getLogger(__name__)
+
+# (start_time, end_time, reservation_id)
+Interval = Tuple[datetime, datetime, int]
+
+
+class AvailabilityIndex:
+    """회의실별 예약 구간을 시작 시간 순으로 정렬해 보관하는 인덱스
+
+    같은 회의실의 예약은 충돌 체크로 서로 겹치지 않으므로 시작 시간 순서와
+    종료 시간 순서가 같다. 따라서 겹침 여부는 이진 탐색 한 번으로 판단할 수 있다.
+    데이터베이스가 원본이며, 인덱스는 예약 생성/삭제 시점에 함께 갱신된다.
+    반복 예약은 전체 회차를 같은 예약 ID의 구간들로 보관한다.
+    """
+
+    def __init__(self):
+        self._intervals: Dict[int, List[Interval]] = {}
+        self._reservations: Dict[int, Tuple[int, List[Tuple[datetime, datetime]]]] = {}
+        self._lock = threading.RLock()
+        self.loaded = False
+
+    def load(self, session: Session):
+        """데이터베이스의 예약 전체로 인덱스 재구성"""
+        rows = session.query(
+            ReservationEntity.id,
+            ReservationEntity.room_id,
+            ReservationEntity.start_time,
+            ReservationEntity.end_time,
+            ReservationRecurrenceEntity
+        ).outerjoin(ReservationEntity.recurrence).all()
+
+        with self._lock:
+            self._intervals = {}
+            self._reservations = {}
+            for reservation_id, room_id, start_time, end_time, recurrence in rows:
+                if recurrence is None:
+                    self.add(reservation_id, room_id, start_time, end_time)
+                else:
+                    self.add_series(
+                        reservation_id,
+                        room_id,
+                        expand_occurrences(recurrence.to_rule(), start_time, end_time)
+                    )
+            self.loaded = True
+
+        logger.info(f"가용성 인덱스 로드 완료: 예약 {len(rows)}건")
+
+    def add(self, reservation_id: int, room_id: int, start_time: datetime, end_time: datetime):
+        """예약 구간 추가"""
+        self.add_series(reservation_id, room_id, [(start_time, end_time)])
+
+    def add_series(self, reservation_id: int, room_id: int, occurrences: Iterable[Tuple[datetime, datetime]]):
+        """반복 예약의 회차 구간 추가 (같은 ID의 기존 구간은 교체)"""
+        with self._lock:
+            if reservation_id in self._reservations:
+                self.remove(reservation_id)
+
+            occurrences = list(occurrences)
+            intervals = self._intervals.setdefault(room_id, [])
+            for start_time, end_time in occurrences:
+                insort(intervals, (start_time, end_time, reservation_id), key=itemgetter(0))
+            self._reservations[reservation_id] = (room_id, occurrences)
+
+    def remove(self, reservation_id: int) -> bool:
+        """예약 구간 제거 (반복 예약은 전체 회차)"""
+        with self._lock:
+            entry = self._reservations.pop(reservation_id, None)
+            if entry is None:
+                return False
+
+            room_id, occurrences = entry
+            intervals = self._intervals[room_id]
+            for start_time, end_time in occurrences:
+                intervals.remove((start_time, end_time, reservation_id))
+            if not intervals:
+                del self._intervals[room_id]
+            return True
+
+    def has_conflict(self, room_id: int, start_time: datetime, end_time: datetime) -> bool:
+        """해당 시간대에 겹치는 예약이 있는지 확인 (O(log n))"""
+        with self._lock:
+            intervals = self._intervals.get(room_id)
+            if not intervals:
+                return False
+
+            # start < end_time 을 만족하는 구간 중 마지막 구간만 확인하면 충분
+            position = bisect_left(intervals, end_time, key=itemgetter(0))
+            return position > 0 and intervals[position - 1][1] > start_time
+
+    def free_room_ids(
+            self,
+            room_ids: Iterable[int],
+            start_time: datetime,
+            end_time: datetime
+    ) -> Set[int]:
+        """주어진 회의실 중 해당 시간대에 예약이 없는 회의실 ID"""
+        with self._lock:
+            return {
+                room_id for room_id in room_ids
+                if not self.has_conflict(room_id, start_time, end_time)
+            }
+
+    def busy_room_ids(self, start_time: datetime, end_time: datetime) -> Set[int]:
+        """해당 시간대에 예약이 있는 회의실 ID"""
+        with self._lock:
+            return {
+                room_id for room_id in self._intervals
+                if self.has_conflict(room_id, start_time, end_time)
+            }
+
+    @property
+    def reservation_count(self) -> int:
+        return len(self._reservations)
@@ -0,0 +1,108 @@
+"""
+회의실 점유 격자 (슬롯 단위 비트맵)
+"""
+
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+MINUTES_PER_DAY = 24 * 60
+
+
+class OccupancyGrid:
+    """회의실 x 일자 x 슬롯 형태의 점유 격자
+
+    하루를 slot_minutes 단위로 나누고 예약이 걸친 슬롯을 1로 표시한다.
+    여러 회의실/여러 날짜의 빈 시간대 검색을 NumPy 배열 연산 한 번으로 처리한다.
+    """
+
+    def __init__(self, room_ids: List[int], start_date: date, days: int, slot_minutes: int = 15):
+        if slot_minutes <= 0 or MINUTES_PER_DAY % slot_minutes != 0:
+            raise ValueError("슬롯 크기는 하루(1440분)를 나누어 떨어지게 하는 값이어야 합니다")
+
+        self.room_ids = list(room_ids)
+        self.start_date = start_date
+        self.days = days
+        self.slot_minutes = slot_minutes
+        self.slots_per_day = MINUTES_PER_DAY // slot_minutes
+
+        self._rows = {room_id: row for row, room_id in enumerate(self.room_ids)}
+        self.grid = np.zeros((len(self.room_ids), days, self.slots_per_day), dtype=np.uint8)
+
+    @classmethod
+    def from_reservations(
+            cls,
+            room_ids: List[int],
+            reservations: Iterable[Tuple[int, datetime, datetime]],
+            start_date: date,
+            days: int,
+            slot_minutes: int = 15
+    ) -> 'OccupancyGrid':
+        """(room_id, start_time, end_time) 목록으로 격자 생성"""
+        grid = cls(room_ids, start_date, days, slot_minutes)
+        for room_id, start_time, end_time in reservations:
+            grid.mark(room_id, start_time, end_time)
+        return grid
+
+    def mark(self, room_id: int, start_time: datetime, end_time: datetime):
+        """예약 구간을 점유로 표시 (슬롯 경계 바깥쪽으로 맞춤)"""
+        row = self._rows.get(room_id)
+        if row is None:
+            return
+
+        first = max(self._slot_floor(start_time), 0)
+        last = min(self._slot_ceil(end_time), self.days * self.slots_per_day)
+        if first < last:
+            self.grid[row].reshape(-1)[first:last] = 1
+
+    def free_ranges(
+            self,
+            duration_minutes: int,
+            day_start: time,
+            day_end: time
+    ) -> Dict[int, List[Tuple[datetime, datetime]]]:
+        """업무 시간 안에서 duration_minutes 이상 연속으로 비어 있는 구간 (회의실별)"""
+        window = -(-duration_minutes // self.slot_minutes)
+        first_slot = -(-(day_start.hour * 60 + day_start.minute) // self.slot_minutes)
+        last_slot = (day_end.hour * 60 + day_end.minute) // self.slot_minutes
+        if day_end == time(0, 0):
+            last_slot = self.slots_per_day
+
+        result: Dict[int, List[Tuple[datetime, datetime]]] = {room_id: [] for room_id in self.room_ids}
+        if window <= 0 or last_slot - first_slot < window or not self.room_ids:
+            return result
+
+        # 누적합으로 모든 시작 슬롯의 윈도우 점유 수를 한 번에 계산
+        occupied = self.grid[:, :, first_slot:last_slot].astype(np.int32)
+        cumulative = np.zeros(occupied.shape[:2] + (occupied.shape[2] + 1,), dtype=np.int32)
+        np.cumsum(occupied, axis=2, out=cumulative[:, :, 1:])
+        free = (cumulative[:, :, window:] - cumulative[:, :, :-window]) == 0
+
+        # 연속된 시작 가능 슬롯을 하나의 구간으로 묶음
+        edges = np.diff(np.pad(free, ((0, 0), (0, 0), (1, 1))).astype(np.int8), axis=2)
+        run_starts = np.argwhere(edges == 1)
+        run_ends = np.argwhere(edges == -1)
+
+        slot = timedelta(minutes=self.slot_minutes)
+        for (row, day, start), (_, _, end) in zip(run_starts, run_ends):
+            day_origin = datetime.combine(self.start_date + timedelta(days=int(day)), time(0, 0))
+            range_start = day_origin + slot * int(first_slot + start)
+            range_end = day_origin + slot * int(first_slot + end - 1 + window)
+            result[self.room_ids[row]].append((range_start, range_end))
+
+        return result
+
+    def _slot_index(self, moment: datetime) -> Tuple[int, int]:
+        """(전체 슬롯 인덱스, 슬롯 내 잔여 분)"""
+        origin = datetime.combine(self.start_date, time(0, 0))
+        minutes, remainder = divmod(int((moment - origin).total_seconds()), 60)
+        slot, offset = divmod(minutes, self.slot_minutes)
+        return slot, offset * 60 + remainder
+
+    def _slot_floor(self, moment: datetime) -> int:
+        return self._slot_index(moment)[0]
+
+    def _slot_ceil(self, moment: datetime) -> int:
+        slot, rest = self._slot_index(moment)
+        return slot + 1 if rest else slot
@@ -1,5 +1,7 @@
+from typing import Iterable, List, Union
+
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Text, Index
+    Column, Integer, String, DateTime, Text, Index, ForeignKey
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -24,13 +26,26 @@ class MeetingRoomEntity(Base):
 
     # 관계 설정
     reservations = relationship("ReservationEntity", back_populates="room")
+    equipment_tags = relationship(
+        "RoomEquipmentEntity",
+        back_populates="room",
+        cascade="all, delete-orphan"
+    )
 
     # 인덱스
     __table_args__ = (
         Index('idx_meeting_rooms_status', 'status'),
         Index('idx_meeting_rooms_capacity', 'capacity'),
+        Index('idx_meeting_rooms_capacity_name', 'capacity', 'name', 'id'),  # 검색 결과 키셋 순서
+        Index('idx_meeting_rooms_location_capacity', 'location', 'capacity', 'id'),  # 전체 목록 키셋 순서
     )
 
+    def sync_equipment_tags(self):
+        """equipment 텍스트 컬럼 기준으로 정규화된 장비 태그 재구성"""
+        self.equipment_tags = [
+            RoomEquipmentEntity(tag=tag) for tag in normalize_equipment(self.equipment or "")
+        ]
+
     def to_model(self) -> MeetingRoom:
         """엔티티를 모델로 변환"""
         return MeetingRoom(
@@ -41,3 +56,35 @@ class MeetingRoomEntity(Base):
             equipment=self.equipment or "",
             status=RoomStatus(self.status)
         )
+
+
+class RoomEquipmentEntity(Base):
+    """회의실-장비 연관 테이블"""
+    __tablename__ = 'room_equipment'
+
+    room_id = Column(Integer, ForeignKey('meeting_rooms.id', ondelete='CASCADE'), primary_key=True)
+    tag = Column(String(100), primary_key=True)
+
+    # 관계 설정
+    room = relationship("MeetingRoomEntity", back_populates="equipment_tags")
+
+    # 인덱스 (장비 -> 회의실 조회용)
+    __table_args__ = (
+        Index('idx_room_equipment_tag', 'tag', 'room_id'),
+    )
+
+
+def normalize_equipment(equipment: Union[str, Iterable[str]]) -> List[str]:
+    """장비 목록을 소문자/공백 제거된 중복 없는 태그 목록으로 변환
+
+    "TV, 화이트보드, 프로젝터" 같은 쉼표 구분 문자열과 문자열 목록을 모두 받는다.
+    """
+    items = equipment.split(',') if isinstance(equipment, str) else equipment
+
+    tags = []
+    for item in items:
+        tag = item.strip().lower()
+        if tag and tag not in tags:
+            tags.append(tag)
+
+    return tags
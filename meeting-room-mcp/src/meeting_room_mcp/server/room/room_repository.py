@@ -3,15 +3,24 @@
 """
 
 import logging
-from datetime import datetime
-from typing import List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
 
+from sqlalchemy import exists, func, select
 from sqlalchemy.orm import Session
 
+from src.meeting_room_mcp.config.database_config import is_database_locked, retry_on_database_lock
 from src.meeting_room_mcp.server.entities import ReservationEntity
+from src.meeting_room_mcp.server.read_cache import ReadCache
+from src.meeting_room_mcp.server.reservation.reservation_repository import (
+    SINGLE_RESERVATION, ReservationRepository
+)
 from src.meeting_room_mcp.server.room.room_enum import RoomStatus
-from src.meeting_room_mcp.server.room.room_models import MeetingRoomEntity
+from src.meeting_room_mcp.server.room.room_models import (
+    MeetingRoomEntity, RoomEquipmentEntity, normalize_equipment
+)
 from src.meeting_room_mcp.shared.models import MeetingRoom, RoomSearchCriteria
+from src.meeting_room_mcp.shared.pagination import keyset_after
 
 logger = logging.getLogger(__name__)
 
@@ -19,21 +28,22 @@ logger = logging.getLogger(__name__)
 class RoomRepository:
     """회의실 데이터 접근 객체"""
 
-    def __init__(self, session: Session):
+    def __init__(self, session: Session, read_cache: Optional[ReadCache] = None):
         self.session = session
+        self.read_cache = read_cache
 
     def get_by_id(self, room_id: int) -> Optional[MeetingRoom]:
         """회의실 ID로 조회"""
         try:
-            room_entity = self.session.query(MeetingRoomEntity).filter(
+            current_time = datetime.now()
+            row = self._query_with_current_status(current_time).filter(
                 MeetingRoomEntity.id == room_id
             ).first()
 
-            if room_entity:
-                room = room_entity.to_model()
-                # 현재 시간에 예약이 있는지 확인
-                room.status = self._get_current_room_status(room_id)
-                return room
+            if row:
+                room_entity, in_use = row
+                in_use = in_use or room_id in self._series_in_use_room_ids(current_time)
+                return self._to_model_with_status(room_entity, in_use)
 
             return None
 
@@ -55,21 +65,31 @@ class RoomRepository:
             logger.error(f"회의실 조회 실패 (이름: {room_name}): {e}")
             return None
 
-    def get_all(self) -> List[MeetingRoom]:
-        """모든 회의실 조회"""
+    def get_by_ids(self, room_ids: Iterable[int]) -> Dict[int, MeetingRoom]:
+        """회의실 ID 목록으로 한 번에 조회"""
+        room_entities = self.session.query(MeetingRoomEntity).filter(
+            MeetingRoomEntity.id.in_(set(room_ids))
+        ).all()
+
+        return {entity.id: entity.to_model() for entity in room_entities}
+
+    def get_all(self, after: Optional[Tuple[str, int, int]] = None, limit: Optional[int] = None) -> List[MeetingRoom]:
+        """모든 회의실을 (location, capacity, id) 순으로 키셋 조회"""
         try:
-            room_entities = self.session.query(MeetingRoomEntity).order_by(
-                MeetingRoomEntity.location, MeetingRoomEntity.capacity
-            ).all()
+            current_time = datetime.now()
+            query = self._query_with_current_status(current_time)
 
-            rooms = []
-            for entity in room_entities:
-                room = entity.to_model()
-                # 현재 시간에 예약이 있는지 확인
-                room.status = self._get_current_room_status(entity.id)
-                rooms.append(room)
+            order = (MeetingRoomEntity.location, MeetingRoomEntity.capacity, MeetingRoomEntity.id)
+            if after:
+                query = query.filter(keyset_after(order, after))
 
-            return rooms
+            rows = query.order_by(*order).limit(limit).all()
+            series_in_use = self._series_in_use_room_ids(current_time)
+
+            return [
+                self._to_model_with_status(entity, in_use or entity.id in series_in_use)
+                for entity, in_use in rows
+            ]
 
         except Exception as e:
             logger.error(f"전체 회의실 조회 실패: {e}")
@@ -79,47 +99,37 @@ class RoomRepository:
             self,
             start_time: datetime,
             end_time: datetime,
-            criteria: Optional[RoomSearchCriteria] = None
+            criteria: Optional[RoomSearchCriteria] = None,
+            after: Optional[Tuple[int, str, int]] = None,
+            limit: Optional[int] = None
     ) -> List[MeetingRoom]:
-        """사용 가능한 회의실 조회"""
+        """사용 가능한 회의실을 (capacity, name, id) 순으로 키셋 조회"""
         try:
-            query = self.session.query(MeetingRoomEntity).filter(
-                MeetingRoomEntity.status == 'available'
-            )
-
-            # 최소 인원수 조건
-            if criteria and criteria.min_capacity:
-                query = query.filter(MeetingRoomEntity.capacity >= criteria.min_capacity)
-
-            # 위치 조건
-            if criteria and criteria.location_preference:
-                query = query.filter(
-                    MeetingRoomEntity.location.contains(criteria.location_preference)
-                )
-
-            # 장비 조건
-            if criteria and criteria.equipment_required:
-                for equipment in criteria.equipment_required:
-                    query = query.filter(
-                        MeetingRoomEntity.equipment.contains(equipment)
-                    )
+            query = self._query_candidates(criteria, after)
 
             # 시간 충돌 체크 - 해당 시간에 예약이 없는 회의실만
-            conflicting_reservations = self.session.query(ReservationEntity.room_id).filter(
+            conflicting_reservations = select(ReservationEntity.room_id).where(
                 (
                         (ReservationEntity.start_time < end_time) &
                         (ReservationEntity.end_time > start_time)
-                )
-            ).subquery()
+                ),
+                SINGLE_RESERVATION
+            )
 
             query = query.filter(
                 ~MeetingRoomEntity.id.in_(conflicting_reservations)
             )
 
-            # 정렬
-            query = query.order_by(MeetingRoomEntity.capacity.asc(), MeetingRoomEntity.name.asc())
+            # 반복 예약은 검색 구간의 회차만 전개하여 제외
+            series_busy = {
+                room_id for room_id, _, _ in ReservationRepository(self.session).get_series_intervals(
+                    start_time, end_time
+                )
+            }
+            if series_busy:
+                query = query.filter(MeetingRoomEntity.id.notin_(series_busy))
 
-            room_entities = query.all()
+            room_entities = query.limit(limit).all()
             rooms = [entity.to_model() for entity in room_entities]
 
             logger.info(f"사용 가능한 회의실 {len(rooms)}개 조회됨 ({start_time} ~ {end_time})")
@@ -129,6 +139,22 @@ class RoomRepository:
             logger.error(f"회의실 조회 실패: {e}")
             return []
 
+    def get_candidate_rooms(
+            self,
+            criteria: Optional[RoomSearchCriteria] = None,
+            after: Optional[Tuple[int, str, int]] = None,
+            limit: Optional[int] = None
+    ) -> List[MeetingRoom]:
+        """시간 조건을 제외한 검색 조건에 맞는 회의실을 (capacity, name, id) 순으로 키셋 조회"""
+        try:
+            room_entities = self._query_candidates(criteria, after).limit(limit).all()
+            return [entity.to_model() for entity in room_entities]
+
+        except Exception as e:
+            logger.error(f"후보 회의실 조회 실패: {e}")
+            return []
+
+    @retry_on_database_lock
     def update_status(self, room_id: int, status: RoomStatus) -> bool:
         """회의실 상태 업데이트"""
         try:
@@ -140,12 +166,18 @@ class RoomRepository:
                 room_entity.status = status.value
                 self.session.commit()
 
+                if self.read_cache:
+                    self.read_cache.invalidate(room_id)
+
                 logger.info(f"회의실 상태 업데이트: room_id={room_id}, status={status.value}")
                 return True
 
             return False
 
         except Exception as e:
+            self.session.rollback()
+            if is_database_locked(e):
+                raise
             logger.error(f"회의실 상태 업데이트 실패: {e}")
             return False
 
@@ -159,6 +191,7 @@ class RoomRepository:
             MeetingRoomEntity.status == 'available'
         ).count()
 
+    @retry_on_database_lock
     def insert_sample_data(self):
         """샘플 데이터 삽입"""
         if self.session.query(MeetingRoomEntity).count() > 0:
@@ -224,39 +257,84 @@ class RoomRepository:
         ]
 
         for room in sample_rooms:
+            room.sync_equipment_tags()
             self.session.add(room)
 
         self.session.commit()
+        if self.read_cache:
+            self.read_cache.clear()
         logger.info(f"샘플 회의실 {len(sample_rooms)}개 추가됨")
 
-    def _get_current_room_status(self, room_id: int) -> RoomStatus:
-        """현재 시간 기준으로 회의실의 실제 사용 가능 상태 반환"""
-        try:
-            # 먼저 회의실의 기본 상태 확인
-            room_entity = self.session.query(MeetingRoomEntity).filter(
-                MeetingRoomEntity.id == room_id
-            ).first()
+    def _query_candidates(
+            self,
+            criteria: Optional[RoomSearchCriteria] = None,
+            after: Optional[Tuple[int, str, int]] = None
+    ):
+        """상태/인원/위치/장비 조건이 적용된 회의실 쿼리 ((capacity, name, id) 순, after 이후)"""
+        query = self.session.query(MeetingRoomEntity).filter(
+            MeetingRoomEntity.status == 'available'
+        )
 
-            if not room_entity:
-                return RoomStatus.MAINTENANCE
+        # 최소 인원수 조건
+        if criteria and criteria.min_capacity:
+            query = query.filter(MeetingRoomEntity.capacity >= criteria.min_capacity)
 
-            # 기본 상태가 available이 아니면 그대로 반환
-            if room_entity.status != 'available':
-                return RoomStatus(room_entity.status)
+        # 위치 조건
+        if criteria and criteria.location_preference:
+            query = query.filter(
+                MeetingRoomEntity.location.contains(criteria.location_preference)
+            )
 
-            # 현재 시간에 진행 중인 예약이 있는지 확인
-            current_time = datetime.now()
-            current_reservation = self.session.query(ReservationEntity).filter(
-                ReservationEntity.room_id == room_id,
-                ReservationEntity.start_time <= current_time,
-                ReservationEntity.end_time > current_time
-            ).first()
+        # 장비 조건 - 필요한 장비 태그를 모두 가진 회의실만 (idx_room_equipment_tag)
+        required_tags = normalize_equipment(criteria.equipment_required) if criteria else []
+        if required_tags:
+            equipped_rooms = self.session.query(RoomEquipmentEntity.room_id).filter(
+                RoomEquipmentEntity.tag.in_(required_tags)
+            ).group_by(
+                RoomEquipmentEntity.room_id
+            ).having(
+                func.count(RoomEquipmentEntity.tag) == len(required_tags)
+            )
 
-            if current_reservation:
-                return RoomStatus.OCCUPIED
+            query = query.filter(MeetingRoomEntity.id.in_(equipped_rooms))
 
-            return RoomStatus.AVAILABLE
+        # 정렬 (id까지 포함해 키셋 커서가 유일하도록)
+        order = (MeetingRoomEntity.capacity, MeetingRoomEntity.name, MeetingRoomEntity.id)
+        if after:
+            query = query.filter(keyset_after(order, after))
 
-        except Exception as e:
-            logger.error(f"회의실 상태 확인 실패 (room_id: {room_id}): {e}")
-            return RoomStatus.MAINTENANCE
+        return query.order_by(*order)
+
+    def _query_with_current_status(self, current_time: datetime):
+        """회의실과 현재 진행 중인 예약 여부를 한 번에 조회하는 쿼리
+
+        회의실마다 상태를 따로 확인하지 않도록 EXISTS 상관 서브쿼리를 컬럼으로 붙인다.
+        서브쿼리는 idx_reservations_room_time 인덱스(room_id, start_time, end_time)로 처리된다.
+        """
+        in_use = exists().where(
+            ReservationEntity.room_id == MeetingRoomEntity.id,
+            ReservationEntity.start_time <= current_time,
+            ReservationEntity.end_time > current_time,
+            SINGLE_RESERVATION
+        ).label('in_use')
+
+        return self.session.query(MeetingRoomEntity, in_use)
+
+    def _series_in_use_room_ids(self, current_time: datetime) -> set:
+        """현재 진행 중인 반복 예약 회차가 있는 회의실 ID"""
+        return {
+            room_id for room_id, _, _ in ReservationRepository(self.session).get_series_intervals(
+                current_time, current_time + timedelta(microseconds=1)
+            )
+        }
+
+    @staticmethod
+    def _to_model_with_status(room_entity: MeetingRoomEntity, in_use: bool) -> MeetingRoom:
+        """현재 시간 기준의 실제 사용 가능 상태를 반영하여 모델로 변환"""
+        room = room_entity.to_model()
+
+        # 기본 상태가 available이 아니면 그대로 유지
+        if room.status == RoomStatus.AVAILABLE and in_use:
+            room.status = RoomStatus.OCCUPIED
+
+        return room
@@ -3,32 +3,59 @@
 """
 
 import logging
-from datetime import datetime
-from typing import List, Optional
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple
 
-from src.meeting_room_mcp.config.database_config import DatabaseConfig
+from sqlalchemy.orm import Session
+
+from src.meeting_room_mcp.config.database_config import AsyncDatabaseConfig
+from src.meeting_room_mcp.server.read_cache import CacheScope, ReadCache, read_through
+from src.meeting_room_mcp.server.reservation.reservation_repository import ReservationRepository
+from src.meeting_room_mcp.server.room.availability_index import AvailabilityIndex
+from src.meeting_room_mcp.server.room.occupancy_grid import OccupancyGrid
 from src.meeting_room_mcp.server.room.room_enum import RoomStatus
+from src.meeting_room_mcp.server.room.room_models import normalize_equipment
 from src.meeting_room_mcp.server.room.room_repository import RoomRepository
+from src.meeting_room_mcp.server.single_flight import SingleFlight
 from src.meeting_room_mcp.shared.models import MeetingRoom, RoomSearchCriteria
+from src.meeting_room_mcp.shared.pagination import Page, decode_cursor, paginate, validate_limit
 
 logger = logging.getLogger(__name__)
 
+# 가용성 인덱스로 걸러낼 때 한 번에 가져오는 후보 회의실 최소 건수
+CANDIDATE_BATCH_SIZE = 50
+
 
 class RoomService:
     """회의실 비즈니스 로직"""
 
-    def __init__(self, db_config: DatabaseConfig):
+    def __init__(
+            self,
+            db_config: AsyncDatabaseConfig,
+            availability_index: Optional[AvailabilityIndex] = None,
+            read_cache: Optional[ReadCache] = None
+    ):
         self.db_config = db_config
+        self.availability_index = availability_index
+        self.read_cache = read_cache
+        self.search_flights = SingleFlight()  # 동시에 들어온 같은 조건의 검색을 한 번만 실행
 
-    def search_available_rooms(
+    async def search_available_rooms(
             self,
             start_time: datetime,
             end_time: datetime,
             min_capacity: int = 1,
             location_preference: str = "",
-            equipment_required: List[str] = []
-    ) -> List[MeetingRoom]:
-        """사용 가능한 회의실 검색"""
+            equipment_required: List[str] = [],
+            limit: Optional[int] = None,
+            cursor: Optional[str] = None
+    ) -> Page[MeetingRoom]:
+        """사용 가능한 회의실 검색 ((capacity, name, id) 순 키셋 페이지네이션, limit 미지정 시 전체)"""
+        if limit is not None:
+            validate_limit(limit)
+        after = decode_cursor(cursor, int, str, int) if cursor else None
+        fetch = limit + 1 if limit is not None else None
+
         # 검색 조건 생성
         criteria = RoomSearchCriteria(
             start_time=start_time,
@@ -38,31 +65,181 @@ class RoomService:
             location_preference=location_preference if location_preference else None
         )
 
-        with self.db_config.get_session() as session:
+        def search(session: Session) -> List[MeetingRoom]:
             room_repo = RoomRepository(session)
-            return room_repo.get_available_rooms(start_time, end_time, criteria)
 
-    def get_room_info(self, room_id: int) -> Optional[MeetingRoom]:
-        """회의실 상세 정보 조회"""
-        with self.db_config.get_session() as session:
-            room_repo = RoomRepository(session)
-            return room_repo.get_by_id(room_id)
+            if not self._use_availability_index():
+                return room_repo.get_available_rooms(start_time, end_time, criteria, after, fetch)
+
+            # 인메모리 인덱스가 준비되어 있으면 시간 충돌 체크를 인덱스로 처리
+            # (후보를 키셋 배치로 가져와 필요한 건수가 찰 때까지만 조회)
+            batch_size = max(fetch or 0, CANDIDATE_BATCH_SIZE) if fetch is not None else None
+            rooms = []
+            batch_after = after
+            while True:
+                candidates = room_repo.get_candidate_rooms(criteria, batch_after, batch_size)
+                free_ids = self.availability_index.free_room_ids(
+                    [room.id for room in candidates], start_time, end_time
+                )
+                rooms.extend(room for room in candidates if room.id in free_ids)
+
+                if batch_size is None or len(candidates) < batch_size or len(rooms) >= fetch:
+                    return rooms[:fetch]
+                batch_after = self._search_key(candidates[-1])
+
+        async def load() -> Page[MeetingRoom]:
+            rooms = await self.db_config.run_sync(search, read_only=True)
+            return paginate(rooms, limit, self._search_key)
+
+        # 결과가 같은 조건은 같은 키가 되도록 정규화 (장비는 태그 순서/대소문자 무관)
+        key = (
+            'search_available_rooms', start_time, end_time, min_capacity, criteria.location_preference,
+            tuple(sorted(normalize_equipment(equipment_required))), limit, cursor
+        )
+        return await read_through(
+            self.read_cache,
+            key,
+            lambda: self.search_flights.do(key, load),
+            CacheScope(start=start_time, end=end_time)
+        )
+
+    async def find_free_windows(
+            self,
+            start_date: date,
+            end_date: date,
+            duration_minutes: int = 60,
+            day_start: time = time(9, 0),
+            day_end: time = time(18, 0),
+            min_capacity: int = 1,
+            location_preference: str = "",
+            equipment_required: List[str] = [],
+            slot_minutes: int = 15
+    ) -> List[Tuple[MeetingRoom, List[Tuple[datetime, datetime]]]]:
+        """기간 내 업무 시간 중 회의 길이만큼 비어 있는 시간대를 회의실별로 검색"""
+        days = (end_date - start_date).days + 1
+        if days <= 0:
+            raise ValueError("종료 날짜가 시작 날짜보다 빠를 수 없습니다")
+        if days > 31:
+            raise ValueError("검색 기간은 31일을 초과할 수 없습니다")
+        if duration_minutes <= 0:
+            raise ValueError("회의 시간은 0분보다 커야 합니다")
+
+        criteria = RoomSearchCriteria(
+            start_time=datetime.combine(start_date, time(0, 0)),
+            end_time=datetime.combine(end_date + timedelta(days=1), time(0, 0)),
+            min_capacity=min_capacity,
+            equipment_required=equipment_required,
+            location_preference=location_preference if location_preference else None
+        )
+
+        def load(session: Session):
+            candidates = RoomRepository(session).get_candidate_rooms(criteria)
+            intervals = ReservationRepository(session).get_intervals_in_range(
+                criteria.start_time, criteria.end_time
+            )
+            return candidates, intervals
+
+        async def search() -> List[Tuple[MeetingRoom, List[Tuple[datetime, datetime]]]]:
+            candidates, intervals = await self.db_config.run_sync(load, read_only=True)
+
+            grid = OccupancyGrid.from_reservations(
+                [room.id for room in candidates], intervals, start_date, days, slot_minutes
+            )
+            free_ranges = grid.free_ranges(duration_minutes, day_start, day_end)
 
-    def get_all_rooms(self) -> List[MeetingRoom]:
-        """모든 회의실 목록 조회"""
-        with self.db_config.get_session() as session:
+            return [(room, free_ranges[room.id]) for room in candidates if free_ranges[room.id]]
+
+        # search_available_rooms와 같은 방식으로 정규화 (장비는 태그 순서/대소문자 무관)
+        key = (
+            'find_free_windows', start_date, end_date, duration_minutes, day_start, day_end,
+            min_capacity, criteria.location_preference, tuple(sorted(normalize_equipment(equipment_required))),
+            slot_minutes
+        )
+        return await read_through(
+            self.read_cache, key, search, CacheScope(start=criteria.start_time, end=criteria.end_time)
+        )
+
+    async def load_availability_index(self):
+        """가용성 인덱스를 데이터베이스 기준으로 로드"""
+        if self.availability_index is None:
+            return
+
+        await self.db_config.run_sync(self.availability_index.load)
+
+    async def check_availability_consistency(self, start_time: datetime, end_time: datetime) -> dict:
+        """가용성 인덱스 결과와 SQL 결과 비교"""
+        if not self._use_availability_index():
+            return {'checked': False}
+
+        def compare(session: Session):
             room_repo = RoomRepository(session)
-            return room_repo.get_all()
 
-    def update_room_status(self, room_id: int, status: RoomStatus) -> bool:
+            sql_ids = {room.id for room in room_repo.get_available_rooms(start_time, end_time)}
+            candidate_ids = [room.id for room in room_repo.get_candidate_rooms()]
+            index_ids = self.availability_index.free_room_ids(candidate_ids, start_time, end_time)
+            return sql_ids, index_ids
+
+        sql_ids, index_ids = await self.db_config.run_sync(compare)
+
+        result = {
+            'checked': True,
+            'consistent': sql_ids == index_ids,
+            'index_only': sorted(index_ids - sql_ids),
+            'sql_only': sorted(sql_ids - index_ids)
+        }
+
+        if not result['consistent']:
+            logger.warning(
+                f"가용성 인덱스 불일치 ({start_time} ~ {end_time}): "
+                f"인덱스에만 있음={result['index_only']}, SQL에만 있음={result['sql_only']}"
+            )
+
+        return result
+
+    async def get_room_info(self, room_id: int) -> Optional[MeetingRoom]:
+        """회의실 상세 정보 조회"""
+        async def load() -> Optional[MeetingRoom]:
+            return await self.db_config.run_sync(
+                lambda session: RoomRepository(session).get_by_id(room_id), read_only=True
+            )
+
+        return await read_through(
+            self.read_cache, ('get_room_info', room_id), load, self._current_status_scope(frozenset([room_id]))
+        )
+
+    async def get_rooms_by_ids(self, room_ids: Iterable[int]) -> Dict[int, MeetingRoom]:
+        """여러 회의실 정보를 한 번에 조회"""
+        room_ids = list(room_ids)
+        return await self.db_config.run_sync(
+            lambda session: RoomRepository(session).get_by_ids(room_ids), read_only=True
+        )
+
+    async def get_all_rooms(self, limit: Optional[int] = None, cursor: Optional[str] = None) -> Page[MeetingRoom]:
+        """모든 회의실 목록 조회 ((location, capacity, id) 순 키셋 페이지네이션, limit 미지정 시 전체)"""
+        if limit is not None:
+            validate_limit(limit)
+        after = decode_cursor(cursor, str, int, int) if cursor else None
+
+        async def load() -> Page[MeetingRoom]:
+            rooms = await self.db_config.run_sync(
+                lambda session: RoomRepository(session).get_all(after, limit + 1 if limit is not None else None),
+                read_only=True
+            )
+            return paginate(rooms, limit, lambda room: (room.location, room.capacity, room.id))
+
+        return await read_through(
+            self.read_cache, ('get_all_rooms', limit, cursor), load, self._current_status_scope()
+        )
+
+    async def update_room_status(self, room_id: int, status: RoomStatus) -> bool:
         """회의실 상태 업데이트"""
-        with self.db_config.get_session() as session:
-            room_repo = RoomRepository(session)
-            return room_repo.update_status(room_id, status)
+        return await self.db_config.run_sync(
+            lambda session: RoomRepository(session, self.read_cache).update_status(room_id, status)
+        )
 
-    def get_room_statistics(self) -> dict:
+    async def get_room_statistics(self) -> dict:
         """회의실 통계 정보"""
-        with self.db_config.get_session() as session:
+        def count(session: Session) -> dict:
             room_repo = RoomRepository(session)
 
             total_rooms = room_repo.get_room_count()
@@ -74,8 +251,24 @@ class RoomService:
                 'inactive_rooms': total_rooms - active_rooms
             }
 
-    def initialize_sample_data(self):
+        return await self.db_config.run_sync(count, read_only=True)
+
+    async def initialize_sample_data(self):
         """샘플 데이터 초기화"""
-        with self.db_config.get_session() as session:
-            room_repo = RoomRepository(session)
-            room_repo.insert_sample_data()
+        await self.db_config.run_sync(
+            lambda session: RoomRepository(session, self.read_cache).insert_sample_data()
+        )
+
+    @staticmethod
+    def _search_key(room: MeetingRoom) -> tuple:
+        """회의실 검색 결과 정렬/커서 키"""
+        return room.capacity, room.name, room.id
+
+    def _current_status_scope(self, room_ids: Optional[frozenset] = None) -> CacheScope:
+        """현재 사용 여부가 포함된 결과의 캐시 범위 (캐시 유효 기간 동안의 예약 변경에 영향을 받음)"""
+        now = datetime.now()
+        return CacheScope(room_ids, now, now + timedelta(seconds=self.read_cache.ttl if self.read_cache else 0))
+
+    def _use_availability_index(self) -> bool:
+        """가용성 인덱스 사용 가능 여부"""
+        return self.availability_index is not None and self.availability_index.loaded
@@ -3,90 +3,193 @@
 """
 
 import logging
-from datetime import datetime
+from datetime import date, datetime, time
 from typing import List
 
 from fastmcp import FastMCP
 
+from src.meeting_room_mcp.server.response_format import (
+    render_error, render_list, render_not_found, render_object, validate_format
+)
 from src.meeting_room_mcp.server.services import RoomService
 
 logger = logging.getLogger(__name__)
 
+ROOM_COLUMNS = ('id', 'name', 'location', 'capacity', 'equipment', 'status')
+
 
 def register_room_tools(app: FastMCP, room_service: RoomService):
     """회의실 관련 도구 등록"""
 
     @app.tool()
-    def search_available_rooms(
+    async def search_available_rooms(
             start_time: str,  # ISO 8601 형식
             end_time: str,  # ISO 8601 형식
             capacity: int = 1,  # 최소 필요 인원수
             location: str = "",  # 선호 위치
-            equipment: List[str] = []  # 필요한 장비
+            equipment: List[str] = [],  # 필요한 장비
+            limit: int = 20,  # 페이지 크기
+            cursor: str = "",  # 이전 결과의 다음 페이지 커서
+            format: str = "prose"  # 응답 형식: prose, json, compact
     ) -> str:
         """지정된 조건에 맞는 사용 가능한 회의실을 검색합니다."""
         try:
+            validate_format(format)
+
             # 시간 변환
             start_dt = datetime.fromisoformat(start_time.replace('Z', '+00:00'))
             end_dt = datetime.fromisoformat(end_time.replace('Z', '+00:00'))
 
             # 검색 실행
-            available_rooms = room_service.search_available_rooms(
-                start_dt, end_dt, capacity, location, equipment
+            page = await room_service.search_available_rooms(
+                start_dt, end_dt, capacity, location, equipment, limit, cursor or None
             )
 
-            if not available_rooms:
-                return "해당 조건에 맞는 사용 가능한 회의실이 없습니다."
+            def prose() -> str:
+                if not page.items:
+                    return "해당 조건에 맞는 사용 가능한 회의실이 없습니다."
 
-            # 결과 포맷팅
-            result = f"사용 가능한 회의실 ({len(available_rooms)}개):\n\n"
-            for room in available_rooms:
-                result += f"ID: {room.id}, 이름: {room.name}, 위치: {room.location}, "
-                result += f"수용인원: {room.capacity}명, 장비: {room.equipment}\n"
+                lines = [f"사용 가능한 회의실 ({len(page.items)}개):\n\n"]
+                lines.extend(
+                    f"ID: {room.id}, 이름: {room.name}, 위치: {room.location}, "
+                    f"수용인원: {room.capacity}명, 장비: {room.equipment}\n"
+                    for room in page.items
+                )
+                if page.next_cursor:
+                    lines.append(f"\n다음 페이지 커서: {page.next_cursor}\n")
+                return ''.join(lines)
 
-            return result
+            return render_list(format, page.items, ROOM_COLUMNS, prose, page.next_cursor)
 
         except Exception as e:
             logger.error(f"회의실 검색 오류: {e}")
-            return f"오류: {e}"
+            return render_error(format, str(e))
 
     @app.tool()
-    def get_room_info(room_id: int) -> str:
+    async def find_free_time_windows(
+            start_date: str,  # YYYY-MM-DD
+            end_date: str,  # YYYY-MM-DD
+            duration_minutes: int = 60,  # 필요한 회의 시간(분)
+            day_start: str = "09:00",  # 업무 시작 시각
+            day_end: str = "18:00",  # 업무 종료 시각
+            capacity: int = 1,  # 최소 필요 인원수
+            location: str = "",  # 선호 위치
+            equipment: List[str] = [],  # 필요한 장비
+            slot_minutes: int = 15,  # 시간 격자 단위(분)
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
+        """기간 내 여러 회의실의 빈 시간대를 한 번에 검색합니다."""
+        try:
+            validate_format(format)
+
+            free_windows = await room_service.find_free_windows(
+                date.fromisoformat(start_date),
+                date.fromisoformat(end_date),
+                duration_minutes,
+                time.fromisoformat(day_start),
+                time.fromisoformat(day_end),
+                capacity,
+                location,
+                equipment,
+                slot_minutes
+            )
+
+            def prose() -> str:
+                if not free_windows:
+                    return "해당 기간에 조건에 맞는 빈 시간대가 없습니다."
+
+                lines = [f"{duration_minutes}분 이상 빈 시간대가 있는 회의실 ({len(free_windows)}개):\n\n"]
+                for room, ranges in free_windows:
+                    lines.append(
+                        f"ID: {room.id}, 이름: {room.name}, 위치: {room.location}, 수용인원: {room.capacity}명\n"
+                    )
+                    lines.extend(
+                        f"  • {range_start.strftime('%Y-%m-%d %H:%M')} ~ {range_end.strftime('%H:%M')}\n"
+                        for range_start, range_end in ranges
+                    )
+                return ''.join(lines)
+
+            items = [
+                {
+                    'id': room.id,
+                    'name': room.name,
+                    'location': room.location,
+                    'capacity': room.capacity,
+                    'windows': [[range_start, range_end] for range_start, range_end in ranges]
+                }
+                for room, ranges in free_windows
+            ]
+            if format == 'compact':
+                # 한 칸에 넣을 수 있도록 시간대를 "시작~종료" 문자열로 변환
+                for item in items:
+                    item['windows'] = [
+                        f"{range_start.strftime('%Y-%m-%d %H:%M')}~{range_end.strftime('%H:%M')}"
+                        for range_start, range_end in item['windows']
+                    ]
+
+            return render_list(format, items, ('id', 'name', 'location', 'capacity', 'windows'), prose)
+
+        except Exception as e:
+            logger.error(f"빈 시간대 검색 오류: {e}")
+            return render_error(format, str(e))
+
+    @app.tool()
+    async def get_room_info(
+            room_id: int,
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
         """특정 회의실의 상세 정보를 조회합니다."""
         try:
-            room = room_service.get_room_info(room_id)
+            validate_format(format)
+
+            room = await room_service.get_room_info(room_id)
             if not room:
-                return f"회의실 ID {room_id}를 찾을 수 없습니다."
+                return render_not_found(format, f"회의실 ID {room_id}를 찾을 수 없습니다.")
 
-            result = f"회의실 정보:\n"
-            result += f"• ID: {room.id}\n"
-            result += f"• 이름: {room.name}\n"
-            result += f"• 위치: {room.location}\n"
-            result += f"• 수용인원: {room.capacity}명\n"
-            result += f"• 장비: {room.equipment}\n"
-            result += f"• 상태: {room.status.value}\n"
+            def prose() -> str:
+                result = f"회의실 정보:\n"
+                result += f"• ID: {room.id}\n"
+                result += f"• 이름: {room.name}\n"
+                result += f"• 위치: {room.location}\n"
+                result += f"• 수용인원: {room.capacity}명\n"
+                result += f"• 장비: {room.equipment}\n"
+                result += f"• 상태: {room.status.value}\n"
+                return result
 
-            return result
+            return render_object(format, room, ROOM_COLUMNS, prose)
 
         except Exception as e:
             logger.error(f"회의실 정보 조회 오류: {e}")
-            return f"오류: {e}"
+            return render_error(format, str(e))
 
     @app.tool()
-    def get_all_rooms() -> str:
+    async def get_all_rooms(
+            limit: int = 20,  # 페이지 크기
+            cursor: str = "",  # 이전 결과의 다음 페이지 커서
+            format: str = "prose"  # 응답 형식: prose, json, compact
+    ) -> str:
         """모든 회의실 목록을 조회합니다."""
         try:
-            rooms = room_service.get_all_rooms()
-            if not rooms:
-                return "등록된 회의실이 없습니다."
+            validate_format(format)
+
+            page = await room_service.get_all_rooms(limit, cursor or None)
+
+            def prose() -> str:
+                if not page.items:
+                    return "등록된 회의실이 없습니다."
 
-            result = f"전체 회의실 ({len(rooms)}개):\n\n"
-            for room in rooms:
-                result += f"ID: {room.id}, 이름: {room.name}, 위치: {room.location}, "
-                result += f"수용인원: {room.capacity}명, 상태: {room.status.value}\n"
+                lines = [f"전체 회의실 ({len(page.items)}개):\n\n"]
+                lines.extend(
+                    f"ID: {room.id}, 이름: {room.name}, 위치: {room.location}, "
+                    f"수용인원: {room.capacity}명, 상태: {room.status.value}\n"
+                    for room in page.items
+                )
+                if page.next_cursor:
+                    lines.append(f"\n다음 페이지 커서: {page.next_cursor}\n")
+                return ''.join(lines)
 
-            return result
+            return render_list(format, page.items, ROOM_COLUMNS, prose, page.next_cursor)
 
         except Exception as e:
             logger.error(f"회의실 목록 조회 오류: {e}")
-            return f"오류: {e}"
+            return render_error(format, str(e))
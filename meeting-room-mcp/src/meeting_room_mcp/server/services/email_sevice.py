@@ -2,18 +2,35 @@
 이메일 서비스 모듈
 """
 
-import smtplib
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Set
 from datetime import datetime
 
+from src.meeting_room_mcp.server.services.email_templates import DEFAULT_TEMPLATE_DIR, EmailTemplates, RenderedEmail
+from src.meeting_room_mcp.server.services.smtp_pool import SMTPConnectionPool
 from src.meeting_room_mcp.shared.models import Reservation, MeetingRoom, EmailNotification
 
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class ComposedEmail:
+    """렌더링을 마친 발송 전 알림 메일"""
+    to_emails: List[str]
+    subject: str
+    rendered: RenderedEmail
+    reservation: Reservation
+    room: MeetingRoom
+
+    def text_for(self, recipient_email: str) -> str:
+        """수신자에게 보낼 텍스트 본문"""
+        return self.rendered.for_recipient(recipient_email)[0]
+
+
 class EmailService:
     """이메일 발송 서비스"""
 
@@ -24,7 +41,15 @@ class EmailService:
             username: Optional[str] = None,
             password: Optional[str] = None,
             use_tls: bool = True,
-            mock_mode: bool = True  # 개발 모드에서는 실제 메일 발송 대신 로그만
+            mock_mode: bool = True,  # 개발 모드에서는 실제 메일 발송 대신 로그만
+            pool_size: int = 4,
+            max_connection_age: float = 300.0,
+            noop_interval: float = 30.0,
+            timeout: float = 10.0,
+            batch_recipients: bool = False,
+            template_dir: str = str(DEFAULT_TEMPLATE_DIR),
+            template_auto_reload: bool = True,
+            template_reload_interval: float = 2.0
     ):
         self.smtp_server = smtp_server
         self.smtp_port = smtp_port
@@ -32,6 +57,22 @@ class EmailService:
         self.password = password
         self.use_tls = use_tls
         self.mock_mode = mock_mode
+        self.batch_recipients = batch_recipients
+
+        # 연결은 처음 발송할 때 만들어지므로 모의 모드에서는 네트워크를 쓰지 않는다
+        self.smtp_pool = SMTPConnectionPool(
+            smtp_server,
+            smtp_port,
+            username=username,
+            password=password,
+            use_tls=use_tls,
+            max_size=pool_size,
+            max_age=max_connection_age,
+            noop_interval=noop_interval,
+            timeout=timeout
+        )
+        self._recipient_executor = ThreadPoolExecutor(max_workers=pool_size, thread_name_prefix="smtp-send")
+        self.templates = EmailTemplates(template_dir, auto_reload=template_auto_reload, reload_interval=template_reload_interval)
 
     def send_meeting_notification(
             self,
@@ -41,18 +82,17 @@ class EmailService:
     ) -> bool:
         """회의 알림 메일 발송"""
         try:
-            notification = EmailNotification(
+            context = self._template_context(reservation, room)
+            context['additional_message_block'] = additional_message + "\n\n" if additional_message else ""
+
+            return self.send_composed(self._compose(
+                "meeting",
+                context,
                 to_emails=reservation.participants + [reservation.organizer_email],
                 subject=f"[회의 알림] {reservation.title}",
-                body="",  # 자동 생성됨
                 reservation=reservation,
                 room=room
-            )
-
-            if additional_message:
-                notification.body = additional_message + "\n\n" + notification.body
-
-            return self._send_email(notification)
+            ))
 
         except Exception as e:
             logger.error(f"회의 알림 메일 발송 실패: {e}")
@@ -65,18 +105,7 @@ class EmailService:
     ) -> bool:
         """예약 확인 메일 발송"""
         try:
-            subject = f"[예약 확인] {reservation.title} - {room.name}"
-            body = self._generate_confirmation_body(reservation, room)
-
-            notification = EmailNotification(
-                to_emails=[reservation.organizer_email],
-                subject=subject,
-                body=body,
-                reservation=reservation,
-                room=room
-            )
-
-            return self._send_email(notification)
+            return self.send_composed(self.compose_confirmation(reservation, room))
 
         except Exception as e:
             logger.error(f"예약 확인 메일 발송 실패: {e}")
@@ -90,29 +119,139 @@ class EmailService:
     ) -> bool:
         """예약 취소 메일 발송"""
         try:
-            subject = f"[예약 취소] {reservation.title} - {room.name}"
-            body = self._generate_cancellation_body(reservation, room, reason)
+            return self.send_composed(self.compose_cancellation(reservation, room, reason))
 
-            notification = EmailNotification(
-                to_emails=reservation.participants + [reservation.organizer_email],
-                subject=subject,
-                body=body,
-                reservation=reservation,
-                room=room
+        except Exception as e:
+            logger.error(f"예약 취소 메일 발송 실패: {e}")
+            return False
+
+    def compose_confirmation(self, reservation: Reservation, room: MeetingRoom) -> ComposedEmail:
+        """예약 확인 메일 렌더링"""
+        return self._compose(
+            "confirmation",
+            self._template_context(reservation, room),
+            to_emails=[reservation.organizer_email],
+            subject=f"[예약 확인] {reservation.title} - {room.name}",
+            reservation=reservation,
+            room=room
+        )
+
+    def compose_cancellation(self, reservation: Reservation, room: MeetingRoom, reason: str = "") -> ComposedEmail:
+        """예약 취소 메일 렌더링"""
+        context = self._template_context(reservation, room)
+        context['reason_block'] = f"\n📝 취소 사유: {reason}" if reason else ""
+
+        return self._compose(
+            "cancellation",
+            context,
+            to_emails=reservation.participants + [reservation.organizer_email],
+            subject=f"[예약 취소] {reservation.title} - {room.name}",
+            reservation=reservation,
+            room=room
+        )
+
+    def compose_reminder(self, reservation: Reservation, room: MeetingRoom, minutes_before: int = 30) -> ComposedEmail:
+        """회의 리마인더 메일 렌더링"""
+        context = self._template_context(reservation, room)
+        context['minutes_before'] = minutes_before
+
+        return self._compose(
+            "reminder",
+            context,
+            to_emails=reservation.participants + [reservation.organizer_email],
+            subject=f"[회의 알림] {reservation.title} - {minutes_before}분 전",
+            reservation=reservation,
+            room=room
+        )
+
+    def send_composed(self, email: ComposedEmail, to_emails: Optional[List[str]] = None) -> bool:
+        """렌더링된 메일 발송 (to_emails를 주면 그 수신자에게만)"""
+        to_emails = email.to_emails if to_emails is None else to_emails
+        return set(to_emails) <= self.deliver_composed(email, to_emails)
+
+    def deliver_composed(self, email: ComposedEmail, to_emails: Optional[List[str]] = None) -> Set[str]:
+        """렌더링된 메일 발송 후 받은 수신자 반환 (수신자별 발송은 일부 수신자만 실패할 수 있음)"""
+        to_emails = email.to_emails if to_emails is None else to_emails
+        notification = EmailNotification(
+            to_emails=to_emails,
+            subject=email.subject,
+            body=email.text_for(', '.join(to_emails)),
+            reservation=email.reservation,
+            room=email.room
+        )
+        return self._deliver_email(notification, email.rendered)
+
+    def send_digest(self, recipient_email: str, emails: List[ComposedEmail]) -> bool:
+        """한 수신자에게 보낼 여러 알림을 메일 1건으로 묶어 발송"""
+        try:
+            separator = "\n" + "─" * 30 + "\n"
+            items = separator.join(
+                f"[{index}] {email.subject}\n{email.text_for(recipient_email).strip()}"
+                for index, email in enumerate(emails, 1)
             )
+            rendered = self.templates.render("digest", {'count': len(emails), 'items': items})
 
-            return self._send_email(notification)
+            notification = EmailNotification(
+                to_emails=[recipient_email],
+                subject=f"[회의 알림 모음] 알림 {len(emails)}건",
+                body=rendered.for_recipient(recipient_email)[0],
+                reservation=emails[0].reservation,
+                room=emails[0].room
+            )
+            return self._send_email(notification, rendered)
 
         except Exception as e:
-            logger.error(f"예약 취소 메일 발송 실패: {e}")
+            logger.error(f"알림 모음 메일 발송 실패: {e}")
             return False
 
-    def _send_email(self, notification: EmailNotification) -> bool:
-        """실제 이메일 발송"""
+    def message_count(self, recipient_count: int) -> int:
+        """수신자 recipient_count명에게 알림 1건을 보낼 때 SMTP 메시지 수"""
+        if self.batch_recipients:
+            return min(recipient_count, 1)
+        return recipient_count
+
+    def _compose(
+            self,
+            template_name: str,
+            context: Dict[str, Any],
+            to_emails: List[str],
+            subject: str,
+            reservation: Reservation,
+            room: MeetingRoom
+    ) -> ComposedEmail:
+        """템플릿을 알림 1건에 한 번 렌더링 (수신자별 필드는 발송할 때 수신자마다 채움)"""
+        rendered = self.templates.render(template_name, context)
+        return ComposedEmail(to_emails, subject, rendered, reservation, room)
+
+    def _template_context(self, reservation: Reservation, room: MeetingRoom) -> Dict[str, Any]:
+        """예약/회의실 정보로 만든 템플릿 공통 값"""
+        return {
+            'reservation_id': reservation.id,
+            'title': reservation.title,
+            'description': reservation.description,
+            'start_time': reservation.start_time.strftime('%Y년 %m월 %d일 %H:%M'),
+            'end_time': reservation.end_time.strftime('%H:%M'),
+            'start_datetime': reservation.start_time.strftime('%Y-%m-%d %H:%M'),
+            'end_datetime': reservation.end_time.strftime('%Y-%m-%d %H:%M'),
+            'duration_hours': f"{reservation.duration_hours:.1f}",
+            'organizer_email': reservation.organizer_email,
+            'participants': ', '.join(reservation.participants),
+            'room_name': room.name,
+            'room_location': room.location,
+            'room_capacity': room.capacity,
+            'room_equipment': room.equipment
+        }
+
+    def _send_email(self, notification: EmailNotification, rendered: Optional[RenderedEmail] = None) -> bool:
+        """실제 이메일 발송 (rendered가 없으면 notification.body를 텍스트 본문으로 발송)"""
+        return set(notification.to_emails) <= self._deliver_email(notification, rendered)
+
+    def _deliver_email(self, notification: EmailNotification, rendered: Optional[RenderedEmail] = None) -> Set[str]:
+        """이메일 발송 후 받은 수신자 반환"""
         if self.mock_mode:
-            return self._mock_send_email(notification)
+            return set(notification.to_emails) if self._mock_send_email(notification) else set()
         else:
-            return self._real_send_email(notification)
+            return self._real_deliver_email(notification, rendered)
 
     def _mock_send_email(self, notification: EmailNotification) -> bool:
         """모의 이메일 발송 (개발/테스트용)"""
@@ -127,118 +266,74 @@ class EmailService:
             logger.error(f"모의 이메일 발송 실패: {e}")
             return False
 
-    def _real_send_email(self, notification: EmailNotification) -> bool:
-        """실제 이메일 발송"""
-        try:
-            # SMTP 서버 연결
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                    
-                if self.username and self.password:
-                    server.login(self.username, self.password)
-                
-                # 각 수신자에게 개별 발송
-                for to_email in notification.to_emails:
-                    msg = MIMEMultipart()
-                    msg['From'] = self.username or 'meeting-system@company.com'
-                    msg['To'] = to_email
-                    msg['Subject'] = notification.subject
-                    
-                    # 본문 추가
-                    msg.attach(MIMEText(notification.body, 'plain', 'utf-8'))
-                    
-                    # 발송
-                    server.send_message(msg)
-                    
-                logger.info(f"이메일 발송 완료: {len(notification.to_emails)}명")
-                return True
-                
-        except Exception as e:
-            logger.error(f"이메일 발송 실패: {e}")
-            return False
-            
-    def _generate_confirmation_body(self, reservation: Reservation, room: MeetingRoom) -> str:
-        """예약 확인 이메일 본문 생성"""
-        return f"""
-🎉 회의실 예약이 확정되었습니다!
-
-📋 예약 정보:
-• 예약 ID: {reservation.id}
-• 회의 제목: {reservation.title}
-• 회의 설명: {reservation.description}
-• 일시: {reservation.start_time.strftime('%Y년 %m월 %d일 %H:%M')} ~ {reservation.end_time.strftime('%H:%M')}
-• 지속 시간: {reservation.duration_hours:.1f}시간
-• 주최자: {reservation.organizer_email}
-• 참가자: {', '.join(reservation.participants)}
-
-🏢 회의실 정보:
-• 이름: {room.name}
-• 위치: {room.location}
-• 수용인원: {room.capacity}명
-• 장비: {room.equipment}
-
-📝 참고사항:
-• 회의 시작 10분 전에 회의실에 도착해 주세요.
-• 회의 종료 후 정리를 부탁드립니다.
-• 예약 변경이나 취소가 필요한 경우 관리자에게 연락해 주세요.
-
-이 메일은 자동으로 발송된 메일입니다.
-"""
-
-    def _generate_cancellation_body(self, reservation: Reservation, room: MeetingRoom, reason: str = "") -> str:
-        """예약 취소 이메일 본문 생성"""
-        body = f"""
-❌ 회의실 예약이 취소되었습니다.
-
-📋 취소된 예약 정보:
-• 예약 ID: {reservation.id}
-• 회의 제목: {reservation.title}
-• 일시: {reservation.start_time.strftime('%Y년 %m월 %d일 %H:%M')} ~ {reservation.end_time.strftime('%H:%M')}
-• 회의실: {room.name} ({room.location})
-• 주최자: {reservation.organizer_email}
-"""
-        
-        if reason:
-            body += f"\n📝 취소 사유: {reason}"
-            
-        body += """
-
-죄송합니다. 일정에 변동이 있어 예약이 취소되었습니다.
-새로운 회의 일정이 확정되면 다시 예약해 주세요.
+    def _real_deliver_email(self, notification: EmailNotification, rendered: Optional[RenderedEmail] = None) -> Set[str]:
+        """실제 이메일 발송 후 받은 수신자 반환 (풀의 연결 재사용, 수신자별 발송은 여러 연결로 병렬 처리)"""
+        sender = self.username or 'meeting-system@company.com'
+
+        def bodies(to_emails: List[str]):
+            if rendered is None:
+                return notification.body, None
+            return rendered.for_recipient(', '.join(to_emails))
+
+        if self.batch_recipients or len(notification.to_emails) == 1:
+            # 한 메시지에 수신자 여러 명 (RCPT TO 여러 번)
+            try:
+                refused = self._send_message(
+                    sender, notification.to_emails, notification.subject, *bodies(notification.to_emails)
+                )
+            except Exception as e:
+                logger.error(f"이메일 발송 실패: {e}")
+                return set()
+
+            # 일부 수신자만 거부되면 예외 없이 거부된 수신자만 돌아온다
+            if refused:
+                logger.error(f"이메일 수신자 거부: {refused}")
+            delivered = set(notification.to_emails) - set(refused)
+            logger.info(f"이메일 발송 완료: {len(delivered)}/{len(set(notification.to_emails))}명")
+            return delivered
+
+        # 각 수신자에게 개별 발송 (다른 수신자 주소가 노출되지 않도록)
+        futures = {
+            to_email: self._recipient_executor.submit(
+                self._send_message, sender, [to_email], notification.subject, *bodies([to_email])
+            )
+            for to_email in dict.fromkeys(notification.to_emails)
+        }
+        delivered = set()
+        for to_email, future in futures.items():
+            try:
+                future.result()
+                delivered.add(to_email)
+            except Exception as e:
+                logger.error(f"이메일 발송 실패: {to_email}: {e}")
+
+        logger.info(f"이메일 발송 완료: {len(delivered)}/{len(futures)}명")
+        return delivered
+
+    def _send_message(
+            self, sender: str, to_emails: List[str], subject: str, body: str, html_body: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """풀에서 빌린 연결로 메시지 1건 발송 후 거부된 수신자 반환 (HTML 본문이 있으면 텍스트/HTML 대체 본문으로)"""
+        msg = MIMEMultipart('alternative') if html_body is not None else MIMEMultipart()
+        msg['From'] = sender
+        msg['To'] = ', '.join(to_emails)
+        msg['Subject'] = subject
+        msg.attach(MIMEText(body, 'plain', 'utf-8'))
+        if html_body is not None:
+            msg.attach(MIMEText(html_body, 'html', 'utf-8'))
+
+        with self.smtp_pool.connection() as server:
+            return server.send_message(msg, from_addr=sender, to_addrs=to_emails)
+
+    def close(self):
+        """SMTP 연결 및 발송 스레드 정리"""
+        self.smtp_pool.close()
+        self._recipient_executor.shutdown(wait=False)
 
-이 메일은 자동으로 발송된 메일입니다.
-"""
-        
-        return body
-        
     def send_reminder(self, reservation: Reservation, room: MeetingRoom, minutes_before: int = 30) -> bool:
         """회의 리마인더 발송"""
         try:
-            subject = f"[회의 알림] {reservation.title} - {minutes_before}분 전"
-            body = f"""
-⏰ 회의 시작 {minutes_before}분 전입니다!
-
-📋 회의 정보:
-• 제목: {reservation.title}
-• 시작 시간: {reservation.start_time.strftime('%Y년 %m월 %d일 %H:%M')}
-• 회의실: {room.name} ({room.location})
-• 지속 시간: {reservation.duration_hours:.1f}시간
-
-🏃‍♂️ 회의실로 이동 준비를 해주세요!
-
-이 메일은 자동으로 발송된 메일입니다.
-"""
-            
-            notification = EmailNotification(
-                to_emails=reservation.participants + [reservation.organizer_email],
-                subject=subject,
-                body=body,
-                reservation=reservation,
-                room=room
-            )
-            
-            return self._send_email(notification)
+            return self.send_composed(self.compose_reminder(reservation, room, minutes_before))
             
         except Exception as e:
             logger.error(f"리마인더 메일 발송 실패: {e}")
@@ -251,13 +346,10 @@ class EmailService:
             return True
             
         try:
-            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
-                if self.use_tls:
-                    server.starttls()
-                    
-                if self.username and self.password:
-                    server.login(self.username, self.password)
-                    
+            # 확인에 쓴 연결은 풀에 남겨 첫 발송에 재사용
+            with self.smtp_pool.connection() as server:
+                server.noop()
+
             logger.info("이메일 서버 연결 테스트 성공")
             return True
             
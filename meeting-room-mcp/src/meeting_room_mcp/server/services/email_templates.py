@@ -0,0 +1,172 @@
+"""
+이메일 템플릿 모듈 (템플릿 디렉터리에서 한 번 읽어 캐시, 파일이 바뀌면 다시 읽음)
+"""
+
+import html
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from string import Template
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+from src.meeting_room_mcp.config.settings import PROJECT_ROOT
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TEMPLATE_DIR = PROJECT_ROOT / "templates" / "email"
+
+# 수신자마다 값이 달라 발송할 때 채우는 필드 (나머지는 알림 1건에 한 번만 렌더링)
+RECIPIENT_FIELDS = frozenset({'recipient_email'})
+
+# 공통 부분 렌더링 후 수신자별 필드 자리를 표시하는 구분자
+_FIELD_MARK = '\x00'
+
+
+@dataclass
+class _CompiledTemplate:
+    """컴파일된 템플릿 (텍스트 필수, HTML은 선택)"""
+    text: Template
+    html: Optional[Template]
+    mtimes: Tuple[Optional[float], Optional[float]]
+    checked_at: float
+
+
+class RenderedEmail:
+    """공통 부분까지 렌더링한 이메일 (수신자별 필드만 발송할 때 채움)"""
+
+    def __init__(self, text_segments: List[str], html_segments: Optional[List[str]]):
+        # 짝수 인덱스는 렌더링된 문자열, 홀수 인덱스는 수신자별 필드 이름
+        self._text_segments = text_segments
+        self._html_segments = html_segments
+
+    @property
+    def has_html(self) -> bool:
+        return self._html_segments is not None
+
+    @property
+    def per_recipient(self) -> bool:
+        """수신자마다 본문이 달라지는지 여부"""
+        return len(self._text_segments) > 1 or (self._html_segments is not None and len(self._html_segments) > 1)
+
+    def for_recipient(self, recipient_email: str) -> Tuple[str, Optional[str]]:
+        """수신자별 필드를 채운 (텍스트 본문, HTML 본문)"""
+        values = {'recipient_email': recipient_email}
+        text = _join(self._text_segments, values)
+        if self._html_segments is None:
+            return text, None
+        return text, _join(self._html_segments, {key: html.escape(value) for key, value in values.items()})
+
+
+class EmailTemplates:
+    """이메일 템플릿 저장소
+
+    template_dir의 <이름>.txt(필수)와 <이름>.html(선택)을 처음 사용할 때 읽어 컴파일해 두고,
+    auto_reload가 켜져 있으면 reload_interval초마다 수정 시각을 확인해 바뀐 파일만 다시 읽는다.
+    템플릿은 string.Template 문법($name, ${name})을 쓰며, HTML 템플릿에 들어가는 값은 이스케이프된다.
+    """
+
+    def __init__(
+            self,
+            template_dir: str = str(DEFAULT_TEMPLATE_DIR),
+            auto_reload: bool = True,
+            reload_interval: float = 2.0
+    ):
+        self.template_dir = Path(template_dir)
+        self.auto_reload = auto_reload
+        self.reload_interval = reload_interval
+
+        self._cache: Dict[str, _CompiledTemplate] = {}
+        self._lock = threading.Lock()
+
+        self.loads = 0
+        self.renders = 0
+
+    def render(self, name: str, context: Mapping[str, Any]) -> RenderedEmail:
+        """템플릿을 공통 값으로 렌더링 (수신자별 필드는 RenderedEmail.for_recipient에서 채움)"""
+        compiled = self._get(name)
+        text_segments = _render(compiled.text, context, str, name)
+        html_segments = _render(compiled.html, context, _escape_html, name) if compiled.html else None
+
+        self.renders += 1
+        return RenderedEmail(text_segments, html_segments)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시된 템플릿 및 로드/렌더링 횟수"""
+        with self._lock:
+            return {
+                'template_dir': str(self.template_dir),
+                'cached': sorted(self._cache),
+                'loads': self.loads,
+                'renders': self.renders
+            }
+
+    def _get(self, name: str) -> _CompiledTemplate:
+        """캐시된 템플릿 조회 (확인 주기가 지났으면 파일 수정 여부 확인 후 다시 읽음)"""
+        with self._lock:
+            compiled = self._cache.get(name)
+            now = time.monotonic()
+            if compiled is not None and (not self.auto_reload or now - compiled.checked_at < self.reload_interval):
+                return compiled
+
+            mtimes = (self._mtime(f"{name}.txt"), self._mtime(f"{name}.html"))
+            if compiled is not None and compiled.mtimes == mtimes:
+                compiled.checked_at = now
+                return compiled
+
+            if mtimes[0] is None:
+                raise FileNotFoundError(f"이메일 템플릿을 찾을 수 없습니다: {self.template_dir / f'{name}.txt'}")
+
+            compiled = _CompiledTemplate(
+                text=self._compile(f"{name}.txt"),
+                html=self._compile(f"{name}.html") if mtimes[1] is not None else None,
+                mtimes=mtimes,
+                checked_at=now
+            )
+            self._cache[name] = compiled
+            self.loads += 1
+            logger.info(f"이메일 템플릿 로드: {name}")
+            return compiled
+
+    def _mtime(self, filename: str) -> Optional[float]:
+        try:
+            return os.stat(self.template_dir / filename).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def _compile(self, filename: str) -> Template:
+        """템플릿 파일을 읽어 컴파일 (잘못된 자리 표시자는 로드할 때 오류)"""
+        template = Template((self.template_dir / filename).read_text(encoding='utf-8'))
+        if not template.is_valid():
+            raise ValueError(f"이메일 템플릿 문법 오류: {filename}")
+        return template
+
+
+def _escape_html(value: Any) -> str:
+    """HTML 본문에 넣을 값 이스케이프 (앞뒤 줄바꿈은 빼고 나머지 줄바꿈은 <br>로)"""
+    return html.escape(str(value).strip('\n')).replace('\n', '<br>\n')
+
+
+def _render(template: Template, context: Mapping[str, Any], convert: Callable[[Any], str], name: str) -> List[str]:
+    """공통 값을 채우고 수신자별 필드 자리에서 나눈 조각 목록 반환"""
+    identifiers = set(template.get_identifiers())
+    missing = identifiers - RECIPIENT_FIELDS - context.keys()
+    if missing:
+        raise ValueError(f"이메일 템플릿 {name}에 필요한 값이 없습니다: {', '.join(sorted(missing))}")
+
+    values = {key: convert(context[key]) for key in identifiers - RECIPIENT_FIELDS}
+    recipient_fields = identifiers & RECIPIENT_FIELDS
+    if not recipient_fields:
+        return [template.substitute(values)]
+
+    values.update({field: f"{_FIELD_MARK}{field}{_FIELD_MARK}" for field in recipient_fields})
+    return template.substitute(values).split(_FIELD_MARK)
+
+
+def _join(segments: List[str], values: Mapping[str, str]) -> str:
+    """렌더링된 조각 사이에 수신자별 필드 값 채우기"""
+    if len(segments) == 1:
+        return segments[0]
+    return ''.join(segment if index % 2 == 0 else values[segment] for index, segment in enumerate(segments))
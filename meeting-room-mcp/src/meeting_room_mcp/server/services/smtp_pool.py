@@ -0,0 +1,211 @@
+"""
+SMTP 커넥션 풀 (연결 재사용, NOOP 상태 확인, 최대 수명)
+"""
+
+import logging
+import smtplib
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class _PooledConnection:
+    smtp: smtplib.SMTP
+    created_at: float
+    last_used_at: float = field(default=0.0)
+
+
+class SMTPConnectionPool:
+    """스레드 간에 공유하는 SMTP 커넥션 풀
+
+    연결(STARTTLS + 로그인)은 처음 필요할 때 만들고 발송 후 풀에 돌려놓는다.
+    max_age초가 지난 연결은 닫고 새로 만들며, noop_interval초 넘게 쉬던 연결은 꺼낼 때
+    NOOP으로 살아 있는지 확인한다. 사용 중 연결이 끊기면 풀에 돌려놓지 않고 버린다.
+    max_size개가 모두 사용 중이면 반납될 때까지 기다린다.
+    """
+
+    def __init__(
+            self,
+            host: str,
+            port: int,
+            username: Optional[str] = None,
+            password: Optional[str] = None,
+            use_tls: bool = True,
+            max_size: int = 4,
+            max_age: float = 300.0,
+            noop_interval: float = 30.0,
+            timeout: float = 10.0,
+            clock: Callable[[], float] = time.monotonic
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.use_tls = use_tls
+        self.max_size = max_size
+        self.max_age = max_age
+        self.noop_interval = noop_interval
+        self.timeout = timeout
+        self._clock = clock
+
+        self._idle: List[_PooledConnection] = []
+        self._open = 0
+        self._closed = False
+        self._condition = threading.Condition()
+
+        self.connects = 0
+        self.reuses = 0
+        self.expired = 0
+        self.health_check_failures = 0
+        self.discarded = 0
+
+    @contextmanager
+    def connection(self) -> Iterator[smtplib.SMTP]:
+        """연결 하나를 빌려 사용 (블록이 연결 오류로 끝나면 연결을 버림)"""
+        conn = self._acquire()
+        try:
+            yield conn.smtp
+        except smtplib.SMTPServerDisconnected:
+            self._discard(conn)
+            raise
+        except smtplib.SMTPException:
+            # 수신자 거부 등 프로토콜 오류는 연결 자체는 쓸 수 있으므로 트랜잭션만 초기화
+            # (SMTPException도 OSError이므로 소켓 오류보다 먼저 확인)
+            self._release(conn, reset=True)
+            raise
+        except OSError:
+            self._discard(conn)
+            raise
+        except BaseException:
+            self._discard(conn)
+            raise
+        else:
+            self._release(conn)
+
+    def close(self):
+        """유휴 연결을 모두 닫고 이후 반납되는 연결도 닫음"""
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+            self._open -= len(idle)
+            self._condition.notify_all()
+
+        for conn in idle:
+            self._quit(conn)
+
+    def stats(self) -> Dict[str, int]:
+        """연결 생성/재사용/폐기 지표"""
+        with self._condition:
+            return {
+                'max_size': self.max_size,
+                'open': self._open,
+                'idle': len(self._idle),
+                'connects': self.connects,
+                'reuses': self.reuses,
+                'expired': self.expired,
+                'health_check_failures': self.health_check_failures,
+                'discarded': self.discarded
+            }
+
+    def _acquire(self) -> _PooledConnection:
+        """유휴 연결 중 쓸 수 있는 것을 꺼내거나 새로 연결"""
+        while True:
+            with self._condition:
+                while not self._idle and self._open >= self.max_size and not self._closed:
+                    if not self._condition.wait(self.timeout):
+                        raise TimeoutError("SMTP 연결 대기 시간이 초과되었습니다")
+                if self._closed:
+                    raise RuntimeError("SMTP 커넥션 풀이 닫혔습니다")
+
+                # 가장 최근에 반납된 연결부터 사용 (오래 쉰 연결은 자연스럽게 만료되도록)
+                conn = self._idle.pop() if self._idle else None
+                if conn is None:
+                    self._open += 1
+
+            if conn is None:
+                try:
+                    return self._connect()
+                except BaseException:
+                    with self._condition:
+                        self._open -= 1
+                        self._condition.notify()
+                    raise
+
+            now = self._clock()
+            if now - conn.created_at >= self.max_age:
+                self.expired += 1
+                self._discard(conn)
+                continue
+
+            if now - conn.last_used_at >= self.noop_interval and not self._is_alive(conn):
+                self.health_check_failures += 1
+                self._discard(conn)
+                continue
+
+            self.reuses += 1
+            return conn
+
+    def _connect(self) -> _PooledConnection:
+        """새 SMTP 연결 (STARTTLS, 로그인 포함)"""
+        smtp = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_tls:
+                smtp.starttls()
+
+            if self.username and self.password:
+                smtp.login(self.username, self.password)
+        except BaseException:
+            smtp.close()
+            raise
+
+        self.connects += 1
+        now = self._clock()
+        logger.debug(f"SMTP 연결 생성: {self.host}:{self.port}")
+        return _PooledConnection(smtp, created_at=now, last_used_at=now)
+
+    def _is_alive(self, conn: _PooledConnection) -> bool:
+        """NOOP으로 연결 상태 확인"""
+        try:
+            return conn.smtp.noop()[0] == 250
+        except (smtplib.SMTPException, OSError):
+            return False
+
+    def _release(self, conn: _PooledConnection, reset: bool = False):
+        """연결 반납"""
+        if reset:
+            try:
+                conn.smtp.rset()
+            except (smtplib.SMTPException, OSError):
+                self._discard(conn)
+                return
+
+        conn.last_used_at = self._clock()
+        with self._condition:
+            if not self._closed:
+                self._idle.append(conn)
+                self._condition.notify()
+                return
+            self._open -= 1
+
+        self._quit(conn)
+
+    def _discard(self, conn: _PooledConnection):
+        """연결을 닫고 풀에서 제외"""
+        with self._condition:
+            self._open -= 1
+            self.discarded += 1
+            self._condition.notify()
+
+        self._quit(conn)
+
+    @staticmethod
+    def _quit(conn: _PooledConnection):
+        try:
+            conn.smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.smtp.close()
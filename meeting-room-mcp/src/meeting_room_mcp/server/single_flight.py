@@ -0,0 +1,51 @@
+"""
+동일 요청 병합 (single-flight)
+"""
+
+import asyncio
+import logging
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """같은 키로 동시에 들어온 호출을 하나의 실행으로 합치는 도구
+
+    진행 중인 실행이 있으면 새 호출은 그 결과(또는 예외)를 함께 기다린다.
+    실행은 별도 태스크로 돌리므로 먼저 호출한 쪽이 취소되어도 나머지는 결과를 받는다.
+    같은 이벤트 루프 안에서만 사용한다.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, asyncio.Task] = {}
+        self.executions = 0
+        self.coalesced = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """진행 중인 같은 키의 실행이 있으면 합류, 없으면 fn 실행"""
+        task = self._flights.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            task = asyncio.ensure_future(fn())
+            self._flights[key] = task
+            self.executions += 1
+            task.add_done_callback(lambda done: self._finish(key, done))
+
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        """실행/병합 횟수"""
+        return {
+            'executions': self.executions,
+            'coalesced': self.coalesced,
+            'in_flight': len(self._flights)
+        }
+
+    def _finish(self, key: Hashable, task: asyncio.Task):
+        """완료된 실행 정리 (기다리던 호출이 모두 취소된 경우에도 예외 경고가 남지 않도록 확인)"""
+        if self._flights.get(key) is task:
+            del self._flights[key]
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug(f"병합된 요청 실패: {task.exception()}")
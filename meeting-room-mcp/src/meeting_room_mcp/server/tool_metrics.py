@@ -0,0 +1,232 @@
+"""
+MCP 도구 호출 지표 (호출/오류 수, 지연 시간 히스토그램)
+"""
+
+import logging
+import math
+import os
+import time
+from contextvars import ContextVar
+from typing import Callable, Dict, List, Optional
+
+from fastmcp.server.middleware import Middleware, MiddlewareContext
+
+from src.meeting_room_mcp.config.database_config import QueryStats, track_queries
+
+logger = logging.getLogger(__name__)
+
+# 현재 도구 호출의 실패 여부 (도구가 예외 대신 오류 문자열을 반환하는 경우 기록)
+_current_call: ContextVar[Optional[dict]] = ContextVar('current_tool_call', default=None)
+
+# Prometheus로 내보내는 분위수
+EXPORTED_QUANTILES = (0.5, 0.9, 0.99)
+
+
+def mark_tool_failed():
+    """진행 중인 도구 호출을 오류로 기록 (도구 호출 밖에서는 무시)"""
+    call = _current_call.get()
+    if call is not None:
+        call['failed'] = True
+
+
+class LatencyHistogram:
+    """HDR 방식 지연 시간 히스토그램 (마이크로초 단위, 로그 구간마다 선형 하위 구간)
+
+    2^k 크기 구간마다 SUB_BUCKET_BITS로 정한 개수의 하위 구간을 두므로 기록 범위와 무관하게
+    상대 오차가 1/2^(SUB_BUCKET_BITS-1) 이하로 유지되고, 메모리는 실제 기록된 구간 수에만 비례한다.
+    """
+
+    SUB_BUCKET_BITS = 7  # 상대 오차 약 1.6%
+
+    def __init__(self):
+        self._sub_count = 1 << self.SUB_BUCKET_BITS
+        self._half_count = self._sub_count >> 1
+        self._counts: Dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.max_us = 0
+
+    def record(self, seconds: float):
+        """지연 시간 기록"""
+        value = max(int(seconds * 1_000_000), 0)
+        index = self._index(value)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_us += value
+        self.max_us = max(self.max_us, value)
+
+    def percentile(self, quantile: float) -> float:
+        """분위수 (밀리초, 해당 구간의 상한값)"""
+        if not self.count:
+            return 0.0
+
+        rank = max(math.ceil(quantile * self.count), 1)
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= rank:
+                return min(self._upper_bound(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    @property
+    def mean_ms(self) -> float:
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+    def _index(self, value: int) -> int:
+        """값이 속한 구간 번호"""
+        if value < self._sub_count:
+            return value
+        shift = value.bit_length() - self.SUB_BUCKET_BITS
+        return self._sub_count + (shift - 1) * self._half_count + (value >> shift) - self._half_count
+
+    def _upper_bound(self, index: int) -> int:
+        """구간에 속하는 가장 큰 값"""
+        if index < self._sub_count:
+            return index
+        shift = (index - self._sub_count) // self._half_count + 1
+        lower = (self._half_count + (index - self._sub_count) % self._half_count) << shift
+        return lower + (1 << shift) - 1
+
+
+class ToolStats:
+    """도구 하나의 호출 지표"""
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()
+        self.queries = 0
+        self.max_queries = 0
+        self.db_seconds = 0.0
+        self.n_plus_one_calls = 0
+
+    def snapshot(self) -> dict:
+        return {
+            'calls': self.calls,
+            'errors': self.errors,
+            'queries': self.queries,
+            'queries_per_call': round(self.queries / self.calls, 2) if self.calls else 0.0,
+            'max_queries_per_call': self.max_queries,
+            'db_ms': round(self.db_seconds * 1000, 3),
+            'n_plus_one_calls': self.n_plus_one_calls,
+            'mean_ms': round(self.latency.mean_ms, 3),
+            'p50_ms': self.latency.percentile(0.5),
+            'p90_ms': self.latency.percentile(0.9),
+            'p99_ms': self.latency.percentile(0.99),
+            'max_ms': self.latency.max_us / 1000
+        }
+
+
+class ToolMetrics:
+    """도구별 호출 지표 모음 (프로세스 단위, 멀티 워커에서는 워커마다 따로 집계)
+
+    멀티 워커 HTTP 모드에서는 스크레이프마다 다른 워커가 응답하므로, Prometheus 시계열마다
+    worker 레이블(기본값 프로세스 ID)을 붙여 워커별 카운터가 서로 섞여 리셋처럼 보이지 않게 한다.
+    합계는 sum without (worker) (...)로 구한다.
+    """
+
+    def __init__(self, worker: Optional[str] = None):
+        self.worker = worker or str(os.getpid())
+        self._tools: Dict[str, ToolStats] = {}
+        self.observers: List[Callable[[str, QueryStats], None]] = []  # 호출마다 (도구 이름, 쿼리 집계) 전달
+
+    def record(self, tool_name: str, seconds: float, failed: bool, queries: Optional[QueryStats] = None):
+        """도구 호출 한 번 기록"""
+        stats = self._tools.get(tool_name)
+        if stats is None:
+            stats = self._tools[tool_name] = ToolStats()
+
+        stats.calls += 1
+        if failed:
+            stats.errors += 1
+        stats.latency.record(seconds)
+
+        if queries is None:
+            return
+
+        stats.queries += queries.count
+        stats.max_queries = max(stats.max_queries, queries.count)
+        stats.db_seconds += queries.seconds
+
+        suspects = queries.n_plus_one_suspects()
+        if suspects:
+            stats.n_plus_one_calls += 1
+            for shape, count in suspects.items():
+                logger.warning(f"N+1 쿼리 의심 ({tool_name}): 같은 문장 {count}회 실행 - {shape[:200]}")
+
+        for observer in self.observers:
+            observer(tool_name, queries)
+
+    def snapshot(self) -> Dict[str, dict]:
+        """도구별 호출/오류 수와 지연 시간 분위수"""
+        return {name: stats.snapshot() for name, stats in sorted(self._tools.items())}
+
+    def to_prometheus(self) -> str:
+        """Prometheus 텍스트 형식 (summary + counter, 모든 시계열에 worker 레이블)"""
+        tools = sorted(self._tools.items())
+        labels = {name: f'worker="{self.worker}",tool="{name}"' for name, _ in tools}
+        lines: List[str] = [
+            "# HELP mcp_tool_calls_total MCP 도구 호출 수",
+            "# TYPE mcp_tool_calls_total counter",
+        ]
+        lines.extend(f'mcp_tool_calls_total{{{labels[name]}}} {stats.calls}' for name, stats in tools)
+
+        lines.extend([
+            "# HELP mcp_tool_errors_total MCP 도구 오류 수",
+            "# TYPE mcp_tool_errors_total counter",
+        ])
+        lines.extend(f'mcp_tool_errors_total{{{labels[name]}}} {stats.errors}' for name, stats in tools)
+
+        lines.extend([
+            "# HELP mcp_tool_queries_total MCP 도구 호출 중 실행된 SQL 문장 수",
+            "# TYPE mcp_tool_queries_total counter",
+        ])
+        lines.extend(f'mcp_tool_queries_total{{{labels[name]}}} {stats.queries}' for name, stats in tools)
+
+        lines.extend([
+            "# HELP mcp_tool_db_seconds_total MCP 도구 호출 중 SQL 실행 시간",
+            "# TYPE mcp_tool_db_seconds_total counter",
+        ])
+        lines.extend(f'mcp_tool_db_seconds_total{{{labels[name]}}} {stats.db_seconds}' for name, stats in tools)
+
+        lines.extend([
+            "# HELP mcp_tool_n_plus_one_total N+1 쿼리가 의심된 MCP 도구 호출 수",
+            "# TYPE mcp_tool_n_plus_one_total counter",
+        ])
+        lines.extend(f'mcp_tool_n_plus_one_total{{{labels[name]}}} {stats.n_plus_one_calls}' for name, stats in tools)
+
+        lines.extend([
+            "# HELP mcp_tool_latency_seconds MCP 도구 처리 시간",
+            "# TYPE mcp_tool_latency_seconds summary",
+        ])
+        for name, stats in tools:
+            for quantile in EXPORTED_QUANTILES:
+                lines.append(
+                    f'mcp_tool_latency_seconds{{{labels[name]},quantile="{quantile}"}} '
+                    f'{stats.latency.percentile(quantile) / 1000}'
+                )
+            lines.append(f'mcp_tool_latency_seconds_sum{{{labels[name]}}} {stats.latency.total_us / 1_000_000}')
+            lines.append(f'mcp_tool_latency_seconds_count{{{labels[name]}}} {stats.latency.count}')
+
+        return '\n'.join(lines) + '\n'
+
+
+class ToolMetricsMiddleware(Middleware):
+    """모든 도구 호출의 처리 시간, 성공/오류, SQL 문장 수/시간을 기록하는 미들웨어"""
+
+    def __init__(self, metrics: ToolMetrics):
+        self.metrics = metrics
+
+    async def on_call_tool(self, context: MiddlewareContext, call_next):
+        call = {'failed': False}
+        token = _current_call.set(call)
+        started = time.perf_counter()
+        with track_queries() as queries:
+            try:
+                return await call_next(context)
+            except Exception:
+                call['failed'] = True
+                raise
+            finally:
+                self.metrics.record(context.message.name, time.perf_counter() - started, call['failed'], queries)
+                _current_call.reset(token)
@@ -133,26 +133,3 @@ class EmailNotification:
     def __post_init__(self):
         if not self.subject:
             self.subject = f"[회의 알림] {self.reservation.title}"
-
-        if not self.body:
-            self.body = self._generate_default_body()
-
-    def _generate_default_body(self) -> str:
-        """기본 이메일 본문 생성"""
-        return f"""
-회의가 예약되었습니다.
-
-📋 회의 정보:
-• 제목: {self.reservation.title}
-• 설명: {self.reservation.description}
-• 일시: {self.reservation.start_time.strftime('%Y-%m-%d %H:%M')} ~ {self.reservation.end_time.strftime('%Y-%m-%d %H:%M')}
-• 회의실: {self.room.name} ({self.room.location})
-• 주최자: {self.reservation.organizer_email}
-• 참가자: {', '.join(self.reservation.participants)}
-
-🏢 회의실 정보:
-• 수용인원: {self.room.capacity}명
-• 장비: {self.room.equipment}
-
-이 메일은 자동으로 발송된 메일입니다.
-"""
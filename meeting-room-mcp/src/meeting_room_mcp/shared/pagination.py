@@ -0,0 +1,68 @@
+"""
+키셋 페이지네이션 공통 모델
+"""
+
+import base64
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, List, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import and_, or_
+
+T = TypeVar('T')
+
+# 목록 조회 페이지 크기 상한
+MAX_PAGE_SIZE = 100
+
+
+@dataclass
+class Page(Generic[T]):
+    """한 페이지 결과와 다음 페이지 커서 (마지막 페이지면 None)"""
+    items: List[T] = field(default_factory=list)
+    next_cursor: Optional[str] = None
+
+
+def encode_cursor(*values) -> str:
+    """정렬 키 값들을 불투명한 커서 문자열로 인코딩"""
+    payload = json.dumps(list(values), separators=(',', ':'), default=str)
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+
+def decode_cursor(cursor: str, *converters: Callable[[Any], Any]) -> tuple:
+    """커서 문자열을 정렬 키 값으로 디코딩 (converters로 각 값의 타입 복원)
+
+    예: decode_cursor(cursor, datetime.fromisoformat, int) -> (start_time, id)
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        if not isinstance(values, list) or len(values) != len(converters):
+            raise ValueError(cursor)
+        return tuple(convert(value) for convert, value in zip(converters, values))
+    except (ValueError, TypeError):
+        raise ValueError("올바르지 않은 페이지 커서입니다")
+
+
+def validate_limit(limit: int):
+    """페이지 크기 검증"""
+    if not 1 <= limit <= MAX_PAGE_SIZE:
+        raise ValueError(f"페이지 크기는 1~{MAX_PAGE_SIZE} 사이여야 합니다")
+
+
+def paginate(items: List[T], limit: Optional[int], key: Callable[[T], Sequence]) -> Page[T]:
+    """limit + 1건까지 조회한 결과로 페이지 구성 (초과분이 있으면 마지막 항목 키로 다음 커서 생성)"""
+    if limit is None or len(items) <= limit:
+        return Page(items)
+
+    return Page(items[:limit], encode_cursor(*key(items[limit - 1])))
+
+
+def keyset_after(columns: Sequence, values: Tuple):
+    """(c1, c2, ...) > (v1, v2, ...) 사전식 비교 조건
+
+    행 값 비교 대신 OR 전개를 사용해 SQLite/MySQL 모두에서 정렬 인덱스 범위 탐색이 되도록 한다.
+    """
+    return or_(*[
+        and_(*[column == value for column, value in zip(columns[:i], values[:i])], columns[i] > values[i])
+        for i in range(len(columns))
+    ])
@@ -0,0 +1,50 @@
+"""
+테스트 공용 픽스처
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, List
+
+import pytest
+
+from src.meeting_room_mcp.config.database_config import QueryStats
+from src.meeting_room_mcp.server.tool_metrics import ToolMetrics
+
+
+@contextmanager
+def _assert_max_queries(metrics: ToolMetrics, tool_name: str, max_queries: int) -> Iterator[List[QueryStats]]:
+    """블록 안에서 호출된 tool_name 도구가 호출마다 max_queries개 이하의 SQL 문장만 실행했는지 확인"""
+    calls: List[QueryStats] = []
+
+    def observe(name: str, queries: QueryStats):
+        if name == tool_name:
+            calls.append(queries)
+
+    metrics.observers.append(observe)
+    try:
+        yield calls
+    finally:
+        metrics.observers.remove(observe)
+
+    if not calls:
+        raise AssertionError(f"{tool_name} 도구가 호출되지 않았습니다")
+
+    worst = max(calls, key=lambda queries: queries.count)
+    if worst.count > max_queries:
+        shapes = '\n'.join(
+            f"  {count}회: {shape[:200]}"
+            for shape, count in sorted(worst.shapes.items(), key=lambda item: -item[1])
+        )
+        raise AssertionError(
+            f"{tool_name} 호출 SQL 문장 수 {worst.count}개 (허용 {max_queries}개):\n{shapes}"
+        )
+
+
+@pytest.fixture
+def assert_max_queries():
+    """도구 호출당 SQL 문장 수 상한 확인 컨텍스트 매니저
+
+    with assert_max_queries(server.tool_metrics, "get_all_rooms", 2):
+        await client.call_tool("get_all_rooms", {})
+    """
+    return _assert_max_queries
@@ -0,0 +1,85 @@
+"""
+이메일 템플릿 테스트 (수신자별 필드 조각 나누기, HTML 이스케이프, 기본 템플릿 렌더링)
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+from src.meeting_room_mcp.server.room.room_schemas import MeetingRoom
+from src.meeting_room_mcp.server.services.email_sevice import EmailService
+from src.meeting_room_mcp.server.services.email_templates import EmailTemplates
+
+ORGANIZER = "organizer@company.com"
+MEMBER = "member@company.com"
+
+
+@pytest.fixture
+def templates(tmp_path):
+    (tmp_path / "note.txt").write_text("$recipient_email 님, $title\n($recipient_email)", encoding='utf-8')
+    (tmp_path / "note.html").write_text("<p>$recipient_email 님</p><p>$title</p>", encoding='utf-8')
+    (tmp_path / "plain.txt").write_text("$title", encoding='utf-8')
+    return EmailTemplates(str(tmp_path), auto_reload=False)
+
+
+def test_recipient_fields_are_filled_per_recipient_after_one_render(templates):
+    rendered = templates.render("note", {'title': "주간 회의"})
+
+    assert rendered.per_recipient and rendered.has_html
+    assert rendered.for_recipient("a@company.com") == (
+        "a@company.com 님, 주간 회의\n(a@company.com)", "<p>a@company.com 님</p><p>주간 회의</p>"
+    )
+    assert rendered.for_recipient("b@company.com")[0] == "b@company.com 님, 주간 회의\n(b@company.com)"
+    assert templates.stats()['renders'] == 1
+
+
+def test_html_values_are_escaped_and_text_values_are_not(templates):
+    title = "<b>R&D</b>\n2부\n"
+    recipient = '"Kim" <kim@company.com>'
+
+    text, html_body = templates.render("note", {'title': title}).for_recipient(recipient)
+
+    assert text == f"{recipient} 님, {title}\n({recipient})"
+    assert html_body == (
+        "<p>&quot;Kim&quot; &lt;kim@company.com&gt; 님</p><p>&lt;b&gt;R&amp;D&lt;/b&gt;<br>\n2부</p>"
+    )
+
+
+def test_template_without_recipient_fields_is_a_single_segment(templates):
+    rendered = templates.render("plain", {'title': "주간 회의"})
+
+    assert not rendered.per_recipient and not rendered.has_html
+    assert rendered.for_recipient("a@company.com") == ("주간 회의", None)
+
+
+def test_missing_value_is_rejected(templates):
+    with pytest.raises(ValueError, match="title"):
+        templates.render("note", {})
+    with pytest.raises(FileNotFoundError):
+        templates.render("missing", {})
+
+
+def test_reminder_addresses_each_recipient():
+    service = EmailService()
+    reservation = Reservation(
+        id=1,
+        room_id=1,
+        title="주간 회의",
+        description="",
+        start_time=datetime(2027, 1, 1, 10, 0),
+        end_time=datetime(2027, 1, 1, 11, 0),
+        organizer_email=ORGANIZER,
+        participants=[MEMBER]
+    )
+    room = MeetingRoom(id=1, name="대회의실", capacity=10, location="3층", equipment="프로젝터")
+    try:
+        email = service.compose_reminder(reservation, room)
+    finally:
+        service.close()
+
+    assert email.rendered.per_recipient
+    text, html_body = email.rendered.for_recipient(MEMBER)
+    assert f"{MEMBER} 님께" in text and f"{MEMBER} 님께" in html_body
+    assert ORGANIZER not in email.text_for(MEMBER)
+    assert f"{ORGANIZER} 님께" in email.text_for(ORGANIZER)
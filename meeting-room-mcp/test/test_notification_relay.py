@@ -0,0 +1,168 @@
+"""
+알림 릴레이 회귀 테스트 (일부 수신자만 실패하면 그 수신자에게만 다시 발송, 선점을 잃은 릴레이의 늦은 결과 무시)
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+from collections import Counter
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.meeting_room_mcp.server.main as main
+from src.meeting_room_mcp.server.notification.notification_relay import NotificationRelay
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+
+ORGANIZER = "organizer@company.com"
+FLAKY = "flaky@company.com"
+MEMBER = "member@company.com"
+
+
+@pytest.mark.parametrize("coalesce_window", [0.0, 0.2])
+def test_retry_resends_only_to_failed_recipients(tmp_path, monkeypatch, coalesce_window):
+    database_path = tmp_path / "meeting_room.db"
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{database_path}")
+    start = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+    received = Counter()
+    failures = {FLAKY: 1}
+
+    def deliver(notification, rendered=None):
+        delivered = set()
+        for recipient in notification.to_emails:
+            if failures.get(recipient):
+                failures[recipient] -= 1
+                continue
+            received[recipient] += 1
+            delivered.add(recipient)
+        return delivered
+
+    async def scenario():
+        server = main.MeetingRoomServer()
+        relay = server.notification_relay
+        relay.poll_interval = 0.05
+        relay.retry_base_delay = 0.01
+        relay.retry_max_delay = 0.01
+        relay.coalesce_window = coalesce_window
+        monkeypatch.setattr(server.email_service, '_deliver_email', deliver)
+
+        await server.initialize_database()
+        await server.startup()
+        try:
+            reservation_id = await server.reservation_service.create_reservation(Reservation(
+                id=None,
+                room_id=1,
+                title="주간 회의",
+                description="",
+                start_time=start,
+                end_time=start + timedelta(hours=1),
+                organizer_email=ORGANIZER,
+                participants=[FLAKY, MEMBER]
+            ))
+            assert await server.reservation_service.cancel_reservation(reservation_id)
+
+            for _ in range(40):
+                await asyncio.sleep(0.05)
+                if (await relay.stats())['pending'] == 0:
+                    break
+            return await relay.stats()
+        finally:
+            await server.shutdown()
+
+    stats = asyncio.run(scenario())
+
+    assert stats['pending'] == 0 and stats['dead'] == 0
+    assert stats['relayed_retries'] == 1
+    # 취소 알림 재시도는 실패한 수신자에게만 간다
+    assert received[FLAKY] == 1
+    assert received[MEMBER] == 1
+    assert received[ORGANIZER] == (1 if coalesce_window else 2)
+
+    with sqlite3.connect(database_path) as connection:
+        statuses = connection.execute("SELECT status FROM notification_outbox").fetchall()
+    assert statuses == [('sent',), ('sent',)]
+
+
+def test_late_result_after_lease_expired_is_not_recorded(tmp_path, monkeypatch):
+    database_path = tmp_path / "meeting_room.db"
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{database_path}")
+    start = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+    # 발송 순서대로 시작 신호/진행 허용 - 첫 발송은 모두 받고, 두 번째 발송은 FLAKY만 받지 못한다
+    entered = [threading.Event(), threading.Event()]
+    release = [threading.Event(), threading.Event()]
+    calls = []
+    lock = threading.Lock()
+
+    def deliver(notification, rendered=None):
+        with lock:
+            index = len(calls)
+            calls.append(list(notification.to_emails))
+        entered[index].set()
+        release[index].wait(5)
+        return {recipient for recipient in notification.to_emails if index == 0 or recipient != FLAKY}
+
+    def outbox_row():
+        with sqlite3.connect(database_path) as connection:
+            return connection.execute(
+                "SELECT status, attempts, delivered_to, last_error FROM notification_outbox "
+                "WHERE notification_type = 'cancellation'"
+            ).fetchone()
+
+    async def scenario():
+        # 릴레이를 직접 돌리기 위해 서버는 시작하지 않고 DB와 예약만 준비
+        server = main.MeetingRoomServer()
+        await server.initialize_database()
+        monkeypatch.setattr(server.email_service, '_deliver_email', deliver)
+        try:
+            reservation_id = await server.reservation_service.create_reservation(Reservation(
+                id=None,
+                room_id=1,
+                title="주간 회의",
+                description="",
+                start_time=start,
+                end_time=start + timedelta(hours=1),
+                organizer_email=ORGANIZER,
+                participants=[FLAKY, MEMBER]
+            ))
+            assert await server.reservation_service.cancel_reservation(reservation_id)
+            # 참가자 모두에게 가는 취소 알림만 남긴다
+            with sqlite3.connect(database_path) as connection:
+                connection.execute(
+                    "UPDATE notification_outbox SET status = 'sent' WHERE notification_type = 'confirmation'"
+                )
+
+            # 선점 시간 0초: 선점하자마자 다른 릴레이가 다시 가져갈 수 있다
+            slow, fresh = (
+                NotificationRelay(server.async_db_config, server.email_service, claim_timeout=0, retry_base_delay=60)
+                for _ in range(2)
+            )
+            slow_drain = asyncio.create_task(slow.drain_once())
+            await asyncio.to_thread(entered[0].wait, 5)
+            fresh_drain = asyncio.create_task(fresh.drain_once())
+            await asyncio.to_thread(entered[1].wait, 5)
+
+            # 선점을 잃은 릴레이의 성공 결과는 기록되지 않는다 (다른 릴레이가 아직 발송 중)
+            release[0].set()
+            assert await slow_drain == 1
+            after_slow = outbox_row()
+
+            release[1].set()
+            assert await fresh_drain == 1
+            return after_slow, outbox_row(), await slow.stats(), await fresh.stats()
+        finally:
+            for event in release:
+                event.set()
+            await server.shutdown()
+
+    after_slow, after_fresh, slow_stats, fresh_stats = asyncio.run(scenario())
+
+    assert len(calls) == 2
+    assert after_slow == ('pending', 2, None, None)
+    status, attempts, delivered_to, last_error = after_fresh
+    assert (status, attempts) == ('pending', 2)
+    assert json.loads(delivered_to) == sorted([ORGANIZER, MEMBER])
+    assert FLAKY in last_error
+    assert (slow_stats['relayed_sent'], slow_stats['lease_lost']) == (0, 1)
+    assert (fresh_stats['relayed_retries'], fresh_stats['lease_lost']) == (1, 0)
@@ -0,0 +1,90 @@
+"""
+send_notification 작업 상태를 다른 워커에서 조회하는 회귀 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from fastmcp import Client
+
+import src.meeting_room_mcp.server.main as main
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+
+
+def make_reservation(start_time: datetime) -> Reservation:
+    return Reservation(
+        id=None,
+        room_id=1,
+        title="주간 회의",
+        description="",
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=1),
+        organizer_email="organizer@company.com",
+        participants=["member@company.com"]
+    )
+
+
+async def call(server, tool: str, arguments: dict) -> str:
+    async with Client(server.app) as client:
+        return (await client.call_tool(tool, arguments)).content[0].text
+
+
+def test_notification_status_visible_from_other_worker(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{tmp_path / 'meeting_room.db'}")
+    start = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+    async def scenario():
+        # HTTP 멀티 워커처럼 같은 DB를 쓰는 서버 두 개
+        worker_a, worker_b = main.MeetingRoomServer(), main.MeetingRoomServer()
+        await worker_a.initialize_database()
+        for worker in (worker_a, worker_b):
+            worker.notification_relay.poll_interval = 0.05
+            await worker.startup()
+        try:
+            reservation_id = await worker_a.reservation_service.create_reservation(make_reservation(start))
+            submitted = await call(worker_a, 'send_notification', {
+                'reservation_id': reservation_id, 'notification_type': 'reminder'
+            })
+            job_id = submitted.rsplit(' ', 1)[-1]
+
+            await asyncio.sleep(0.5)
+            return job_id, await call(worker_b, 'get_notification_status', {'job_id': job_id})
+        finally:
+            for worker in (worker_a, worker_b):
+                await worker.shutdown()
+
+    job_id, status = asyncio.run(scenario())
+
+    assert f"알림 작업 {job_id}" in status
+    assert "발송 완료" in status
+
+
+def test_multi_worker_http_requires_outbox(monkeypatch):
+    monkeypatch.setattr(main.settings, 'mcp_http_workers', 2)
+    monkeypatch.setattr(main.email_settings, 'outbox_enabled', False)
+
+    with pytest.raises(ValueError):
+        main.check_http_workers()
+
+
+@pytest.mark.parametrize("outbox_enabled", [True, False])
+def test_unsupported_notification_type_is_rejected_before_db_reads(
+        tmp_path, monkeypatch, assert_max_queries, outbox_enabled
+):
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{tmp_path / 'meeting_room.db'}")
+    monkeypatch.setattr(main.email_settings, 'outbox_enabled', outbox_enabled)
+
+    async def scenario():
+        server = main.MeetingRoomServer()
+        await server.initialize_database()
+        await server.startup()
+        try:
+            with assert_max_queries(server.tool_metrics, 'send_notification', 0):
+                return await call(server, 'send_notification', {
+                    'reservation_id': 1, 'notification_type': 'invitation'
+                })
+        finally:
+            await server.shutdown()
+
+    assert asyncio.run(scenario()) == "지원하지 않는 알림 타입: invitation"
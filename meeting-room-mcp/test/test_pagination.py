@@ -0,0 +1,174 @@
+"""
+키셋 페이지네이션 테스트 (정렬 키가 같은 행, 반복 예약 회차 병합, 잘못된 커서)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.meeting_room_mcp.server.main as main
+from src.meeting_room_mcp.server.reservation.reservation_schemas import RecurrenceRule, Reservation
+from src.meeting_room_mcp.server.room.room_models import MeetingRoomEntity
+from src.meeting_room_mcp.shared.pagination import (
+    MAX_PAGE_SIZE, Page, decode_cursor, encode_cursor, paginate, validate_limit
+)
+
+ME = "me@company.com"
+PAGE_SIZES = [1, 2, 3, 5]
+
+
+@pytest.mark.parametrize("cursor, converters", [
+    ("!!!", (int,)),
+    ("", (int,)),
+    (encode_cursor(1, 2), (int,)),
+    (encode_cursor("a", "b", 3), (int, str, int)),
+    (encode_cursor("2027-13-01T00:00:00", 1), (datetime.fromisoformat, int)),
+    ("eyJhIjoxfQ", (int,)),  # {"a":1}
+])
+def test_decode_cursor_rejects_bad_cursor(cursor, converters):
+    with pytest.raises(ValueError, match="올바르지 않은 페이지 커서"):
+        decode_cursor(cursor, *converters)
+
+
+def test_cursor_round_trip():
+    start = datetime(2027, 1, 1, 10, 0)
+    cursor = encode_cursor(start.isoformat(), 7)
+    assert decode_cursor(cursor, datetime.fromisoformat, int) == (start, 7)
+
+
+@pytest.mark.parametrize("limit", [0, MAX_PAGE_SIZE + 1])
+def test_validate_limit_rejects_out_of_range(limit):
+    with pytest.raises(ValueError):
+        validate_limit(limit)
+
+
+@pytest.mark.parametrize("items, limit, expected", [
+    ([1, 2, 3], None, Page([1, 2, 3])),
+    ([1, 2, 3], 3, Page([1, 2, 3])),
+    ([1, 2, 3], 2, Page([1, 2], encode_cursor(2))),
+])
+def test_paginate(items, limit, expected):
+    assert paginate(items, limit, lambda item: (item,)) == expected
+
+
+async def walk(fetch_page, limit: int) -> list:
+    """다음 커서가 없을 때까지 모든 페이지를 순서대로 모음"""
+    items, cursor = [], None
+    for _ in range(100):
+        page = await fetch_page(limit, cursor)
+        assert len(page.items) <= limit
+        items.extend(page.items)
+        if page.next_cursor is None:
+            return items
+        cursor = page.next_cursor
+    raise AssertionError("페이지가 끝나지 않습니다")
+
+
+async def run_with_server(monkeypatch, tmp_path, scenario, use_availability_index=False):
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{tmp_path / 'meeting_room.db'}")
+    server = main.MeetingRoomServer(use_availability_index=use_availability_index, use_read_cache=False)
+    await server.initialize_database()
+
+    # 위치/인원이 모두 같은 회의실을 추가해 정렬 키 동률을 만든다
+    session = server.db_config.get_session()
+    try:
+        for number in range(3, 15):
+            room = MeetingRoomEntity(
+                name=f"소회의실 {number}", capacity=4, location='4층', equipment='화이트보드', status='available'
+            )
+            room.sync_equipment_tags()
+            session.add(room)
+        session.commit()
+    finally:
+        session.close()
+
+    await server.startup()
+    try:
+        return await scenario(server)
+    finally:
+        await server.shutdown()
+
+
+@pytest.mark.parametrize("use_availability_index", [False, True])
+def test_room_pages_with_tied_sort_keys(tmp_path, monkeypatch, use_availability_index):
+    start = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+    end = start + timedelta(hours=1)
+
+    async def scenario(server):
+        rooms = server.room_service
+        # 인원 4명 회의실 일부를 예약해 검색 결과 중간에 빈자리를 만든다
+        for room_id in (5, 10, 11):
+            await server.reservation_service.create_reservation(Reservation(
+                None, room_id, "주간 회의", "", start, end, ME, []
+            ))
+
+        all_rooms = (await rooms.get_all_rooms()).items
+        available = (await rooms.search_available_rooms(start, end)).items
+        for limit in PAGE_SIZES:
+            assert await walk(lambda size, cursor: rooms.get_all_rooms(size, cursor), limit) == all_rooms
+            assert await walk(
+                lambda size, cursor: rooms.search_available_rooms(start, end, limit=size, cursor=cursor), limit
+            ) == available
+        return all_rooms, available
+
+    all_rooms, available = asyncio.run(
+        run_with_server(monkeypatch, tmp_path, scenario, use_availability_index)
+    )
+
+    assert len(all_rooms) == 20
+    assert [(room.location, room.capacity, room.id) for room in all_rooms] == sorted(
+        (room.location, room.capacity, room.id) for room in all_rooms
+    )
+    assert len(available) == 17 and not {5, 10, 11} & {room.id for room in available}
+
+
+def test_reservation_pages_merge_series_with_single_reservations(tmp_path, monkeypatch):
+    start = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+    def reservation(room_id, start_time, organizer=ME, participants=(), recurrence=None):
+        return Reservation(
+            None, room_id, "주간 회의", "", start_time, start_time + timedelta(hours=1),
+            organizer, list(participants), recurrence=recurrence
+        )
+
+    async def scenario(server):
+        service = server.reservation_service
+        # 같은 시작 시각의 단일 예약 여러 건과 반복 예약 두 개
+        for room_id in (1, 2, 3):
+            await service.create_reservation(reservation(room_id, start))
+        await service.create_reservation(reservation(4, start, recurrence=RecurrenceRule('daily', count=4)))
+        await service.create_reservation(reservation(
+            5, start, organizer="other@company.com", participants=[ME], recurrence=RecurrenceRule('daily', count=3)
+        ))
+        await service.create_reservation(reservation(1, start + timedelta(days=1)))
+        await service.create_reservation(reservation(4, start + timedelta(days=1, hours=4), participants=[ME]))
+        await service.create_reservation(reservation(6, start, organizer="other@company.com"))
+
+        window_end = start + timedelta(days=7)
+        mine = (await service.get_my_reservations(ME, start - timedelta(hours=1), window_end, MAX_PAGE_SIZE)).items
+        room_4 = (await service.get_room_reservations(4)).items
+        for limit in PAGE_SIZES:
+            assert await walk(
+                lambda size, cursor: service.get_my_reservations(
+                    ME, start - timedelta(hours=1), window_end, size, cursor
+                ),
+                limit
+            ) == mine
+            assert await walk(
+                lambda size, cursor: service.get_room_reservations(4, limit=size, cursor=cursor), limit
+            ) == room_4
+
+        with pytest.raises(ValueError, match="올바르지 않은 페이지 커서"):
+            await service.get_my_reservations(ME, start, window_end, 5, encode_cursor("a", "b", "c"))
+        with pytest.raises(ValueError, match="올바르지 않은 페이지 커서"):
+            await server.room_service.get_all_rooms(5, encode_cursor(start.isoformat(), 1))
+        return mine, room_4
+
+    mine, room_4 = asyncio.run(run_with_server(monkeypatch, tmp_path, scenario))
+
+    keys = [(reservation.start_time, reservation.id) for reservation in mine]
+    assert keys == sorted(set(keys))
+    assert len(mine) == 3 + 4 + 3 + 1 + 1
+    assert [reservation.room_id for reservation in mine[:5]] == [1, 2, 3, 4, 5]
+    assert len(room_4) == 5
@@ -0,0 +1,163 @@
+"""
+조회 응답 캐시 테스트 (회의실/시간 범위 무효화, 조회 중 무효화된 결과 저장 방지)
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.meeting_room_mcp.server.main as main
+from src.meeting_room_mcp.server.read_cache import CacheScope, ReadCache
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+
+T0 = datetime(2027, 1, 1, 10, 0)
+
+
+def hours(n: float) -> datetime:
+    return T0 + timedelta(hours=n)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def cached(value):
+    async def loader():
+        return value
+    return loader
+
+
+@pytest.mark.parametrize("scope, change, expected", [
+    (CacheScope(frozenset([1]), hours(0), hours(2)), (1, hours(1), hours(3)), True),
+    (CacheScope(frozenset([1]), hours(0), hours(2)), (2, hours(1), hours(3)), False),
+    (CacheScope(frozenset([1]), hours(0), hours(2)), (None, hours(1), hours(3)), True),
+    (CacheScope(start=hours(0), end=hours(2)), (5, hours(1), hours(3)), True),
+    (CacheScope(start=hours(0), end=hours(2)), (5, hours(3), hours(4)), False),
+    (CacheScope(start=hours(2), end=hours(4)), (5, hours(0), hours(1)), False),
+    # 경계가 맞닿아도 영향이 있다고 본다
+    (CacheScope(start=hours(0), end=hours(2)), (5, hours(2), hours(3)), True),
+    (CacheScope(frozenset([1])), (1, hours(100), hours(101)), True),
+    (CacheScope(), (None, None, None), True),
+])
+def test_scope_touches(scope, change, expected):
+    assert scope.touches(*change) is expected
+
+
+def test_invalidate_evicts_only_overlapping_entries():
+    cache = ReadCache()
+
+    async def scenario():
+        await cache.get_or_load('room-1', cached('a'), CacheScope(frozenset([1]), hours(0), hours(2)))
+        await cache.get_or_load('room-2', cached('b'), CacheScope(frozenset([2]), hours(0), hours(2)))
+        await cache.get_or_load('morning', cached('c'), CacheScope(start=hours(0), end=hours(2)))
+        await cache.get_or_load('evening', cached('d'), CacheScope(start=hours(8), end=hours(10)))
+
+        cache.invalidate(1, hours(1), hours(3))
+        return {key for key in ('room-1', 'room-2', 'morning', 'evening') if key in cache._entries}
+
+    assert asyncio.run(scenario()) == {'room-2', 'evening'}
+    assert cache.stats()['invalidations'] == 2
+
+
+def test_load_racing_invalidation_is_not_cached():
+    cache = ReadCache()
+    loads = []
+
+    async def scenario():
+        started, release = asyncio.Event(), asyncio.Event()
+
+        async def slow_loader():
+            loads.append('stale')
+            started.set()
+            await release.wait()
+            return 'stale'
+
+        pending = asyncio.create_task(
+            cache.get_or_load('search', slow_loader, CacheScope(start=hours(0), end=hours(2)))
+        )
+        await started.wait()
+        # 조회가 끝나기 전에 커밋된 변경 (조회 결과가 이미 오래된 값일 수 있음)
+        cache.invalidate(1, hours(0), hours(1))
+        release.set()
+        first = await pending
+
+        async def fresh_loader():
+            loads.append('fresh')
+            return 'fresh'
+
+        return first, await cache.get_or_load('search', fresh_loader)
+
+    assert asyncio.run(scenario()) == ('stale', 'fresh')
+    assert loads == ['stale', 'fresh']
+
+
+def test_entries_expire_and_least_recently_used_is_evicted():
+    clock = FakeClock()
+    cache = ReadCache(max_entries=2, ttl=10.0, clock=clock)
+
+    async def scenario():
+        await cache.get_or_load('a', cached(1))
+        await cache.get_or_load('b', cached(2))
+        await cache.get_or_load('a', cached(None))
+        await cache.get_or_load('c', cached(3))
+
+        clock.now = 11.0
+        return await cache.get_or_load('a', cached(4)), await cache.get_or_load('missing', cached(None))
+
+    assert asyncio.run(scenario()) == (4, None)
+    stats = cache.stats()
+    assert (stats['evictions'], stats['expirations']) == (1, 1)
+    assert 'b' not in cache._entries and 'missing' not in cache._entries
+
+
+def test_reservation_writes_evict_matching_tool_responses(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{tmp_path / 'meeting_room.db'}")
+    start = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+    end = start + timedelta(hours=1)
+    next_day = start + timedelta(days=1)
+
+    async def scenario():
+        server = main.MeetingRoomServer(use_availability_index=False, use_read_cache=True)
+        await server.initialize_database()
+        await server.startup()
+        rooms, reservations, cache = server.room_service, server.reservation_service, server.read_cache
+        try:
+            async def free_room_ids(start_time):
+                page = await rooms.search_available_rooms(start_time, start_time + timedelta(hours=1))
+                return {room.id for room in page.items}
+
+            async def booked(room_id):
+                return [reservation.id for reservation in (await reservations.get_room_reservations(room_id)).items]
+
+            assert 1 in await free_room_ids(start)
+            assert 1 in await free_room_ids(next_day)
+            assert await booked(1) == [] and await booked(2) == []
+
+            reservation_id = await reservations.create_reservation(Reservation(
+                None, 1, "주간 회의", "", start, end, "organizer@company.com", []
+            ))
+            misses = cache.stats()['misses']
+
+            # 겹치는 시간의 검색과 같은 회의실 예약 목록만 다시 조회된다
+            assert 1 not in await free_room_ids(start)
+            assert await booked(1) == [reservation_id]
+            assert cache.stats()['misses'] == misses + 2
+            assert 1 in await free_room_ids(next_day)
+            assert await booked(2) == []
+            assert cache.stats()['misses'] == misses + 2
+
+            assert await reservations.cancel_reservation(reservation_id)
+            assert 1 in await free_room_ids(start)
+            assert await booked(1) == []
+            assert cache.stats()['misses'] == misses + 4
+            assert 1 in await free_room_ids(next_day)
+            assert cache.stats()['misses'] == misses + 4
+        finally:
+            await server.shutdown()
+
+    asyncio.run(scenario())
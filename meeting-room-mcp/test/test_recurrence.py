@@ -0,0 +1,196 @@
+"""
+반복 예약 회차 전개/종료 시각/충돌 검사 테스트
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+import src.meeting_room_mcp.server.main as main
+from src.meeting_room_mcp.server.reservation.recurrence import (
+    expand_occurrences, find_overlaps, occurrence_start, series_end, validate_rule
+)
+from src.meeting_room_mcp.server.reservation.reservation_repository import ReservationRepository
+from src.meeting_room_mcp.server.reservation.reservation_schemas import RecurrenceRule, Reservation
+
+FIRST_START = datetime(2027, 1, 1, 10, 0)
+FIRST_END = datetime(2027, 1, 1, 11, 0)
+
+
+def at(month: int, day: int, hour: int = 10, minute: int = 0, year: int = 2027) -> datetime:
+    return datetime(year, month, day, hour, minute)
+
+
+@pytest.mark.parametrize("rule, first_start, n, expected", [
+    (RecurrenceRule('daily', interval=2), at(1, 1), 3, at(1, 7)),
+    (RecurrenceRule('weekly'), at(1, 1), 2, at(1, 15)),
+    # 월 반복은 없는 날짜를 그 달 말일로 보정하고, 다음 달에는 원래 날짜로 돌아간다
+    (RecurrenceRule('monthly'), at(1, 31), 1, at(2, 28)),
+    (RecurrenceRule('monthly'), at(1, 31), 2, at(3, 31)),
+    (RecurrenceRule('monthly'), at(1, 31), 3, at(4, 30)),
+    (RecurrenceRule('monthly'), at(1, 31, year=2028), 1, at(2, 29, year=2028)),
+    (RecurrenceRule('monthly', interval=3), at(11, 30), 1, at(2, 29, year=2028)),
+    (RecurrenceRule('monthly', interval=3), at(11, 30), 2, at(5, 30, year=2028)),
+    (RecurrenceRule('monthly'), at(12, 15), 1, at(1, 15, year=2028)),
+])
+def test_occurrence_start(rule, first_start, n, expected):
+    assert occurrence_start(rule, first_start, n) == expected
+
+
+@pytest.mark.parametrize("rule, expected_starts", [
+    (RecurrenceRule('daily', count=3), [at(1, 1), at(1, 2), at(1, 3)]),
+    # until은 마지막 회차 시작 시각 상한 (같은 시각이면 포함)
+    (RecurrenceRule('daily', until=at(1, 4)), [at(1, 1), at(1, 2), at(1, 3), at(1, 4)]),
+    (RecurrenceRule('daily', until=at(1, 4, 9, 59)), [at(1, 1), at(1, 2), at(1, 3)]),
+    # count와 until을 함께 주면 먼저 닿는 쪽에서 끝난다
+    (RecurrenceRule('daily', count=10, until=at(1, 3)), [at(1, 1), at(1, 2), at(1, 3)]),
+    (RecurrenceRule('daily', count=2, until=at(1, 5)), [at(1, 1), at(1, 2)]),
+    # 제외 회차도 count에 포함되고, 회차와 맞지 않는 제외 시각은 무시된다
+    (RecurrenceRule('daily', count=4, exceptions=[at(1, 2)]), [at(1, 1), at(1, 3), at(1, 4)]),
+    (RecurrenceRule('daily', count=2, exceptions=[at(1, 2, 10, 30)]), [at(1, 1), at(1, 2)]),
+    (RecurrenceRule('weekly', interval=2, until=at(2, 1)), [at(1, 1), at(1, 15), at(1, 29)]),
+])
+def test_expand_occurrences(rule, expected_starts):
+    assert list(expand_occurrences(rule, FIRST_START, FIRST_END)) == [
+        (start, start + timedelta(hours=1)) for start in expected_starts
+    ]
+
+
+WINDOW_RULES = [
+    RecurrenceRule('daily', count=20),
+    RecurrenceRule('daily', interval=3, until=at(2, 20), exceptions=[at(1, 7), at(1, 19)]),
+    RecurrenceRule('weekly', interval=2, count=10, exceptions=[at(1, 29)]),
+    RecurrenceRule('monthly', count=14),
+    RecurrenceRule('monthly', interval=2, until=at(12, 31)),
+]
+
+
+@pytest.mark.parametrize("rule", WINDOW_RULES)
+# 말일 자정을 넘기는 회차는 다음 달까지 이어진다
+@pytest.mark.parametrize("first_start, duration", [(at(1, 1), timedelta(hours=1)), (at(1, 31, 23), timedelta(hours=2))])
+@pytest.mark.parametrize("window_length", [
+    timedelta(minutes=30), timedelta(hours=1), timedelta(days=1), timedelta(days=45)
+])
+def test_windowed_expansion_matches_full_expansion(rule, first_start, duration, window_length):
+    first_end = first_start + duration
+    full = list(expand_occurrences(rule, first_start, first_end))
+
+    # 회차 경계에 정확히 닿는 구간을 포함해 시리즈 앞뒤까지 7시간 간격으로 밀어 보며 비교
+    window_start = first_start - timedelta(days=2)
+    while window_start < full[-1][1] + timedelta(days=2):
+        window_end = window_start + window_length
+        expected = [(start, end) for start, end in full if end > window_start and start < window_end]
+        assert list(expand_occurrences(rule, first_start, first_end, window_start, window_end)) == expected
+        window_start += timedelta(hours=7)
+
+    for start, end in full:
+        assert list(expand_occurrences(rule, first_start, first_end, end)) == [
+            occurrence for occurrence in full if occurrence[0] >= end
+        ]
+        assert next(expand_occurrences(rule, first_start, first_end, end - timedelta(minutes=1))) == (start, end)
+
+
+@pytest.mark.parametrize("rule, first_start, expected", [
+    (RecurrenceRule('daily', count=5), at(1, 1), at(1, 5, 11)),
+    (RecurrenceRule('daily', until=at(1, 4, 10, 30)), at(1, 1), at(1, 4, 11)),
+    (RecurrenceRule('daily', count=10, until=at(1, 3)), at(1, 1), at(1, 3, 11)),
+    (RecurrenceRule('weekly', interval=2, until=at(2, 1)), at(1, 1), at(1, 29, 11)),
+    (RecurrenceRule('monthly', count=2), at(1, 31), at(2, 28, 11)),
+    (RecurrenceRule('monthly', until=at(4, 29)), at(1, 31), at(3, 31, 11)),
+    (RecurrenceRule('monthly', interval=3, until=at(3, 1, year=2028)), at(11, 30), at(2, 29, 11, year=2028)),
+    # 제외 회차와 무관한 상한
+    (RecurrenceRule('daily', count=3, exceptions=[at(1, 3)]), at(1, 1), at(1, 3, 11)),
+])
+def test_series_end(rule, first_start, expected):
+    assert series_end(rule, first_start, first_start + timedelta(hours=1)) == expected
+
+
+@pytest.mark.parametrize("rule", WINDOW_RULES)
+def test_series_end_is_last_occurrence_end(rule):
+    full_rule = RecurrenceRule(rule.frequency, rule.interval, rule.count, rule.until)
+    last_start, last_end = list(expand_occurrences(full_rule, FIRST_START, FIRST_END))[-1]
+    assert series_end(rule, FIRST_START, FIRST_END) == last_end
+
+
+@pytest.mark.parametrize("rule, message", [
+    (RecurrenceRule('yearly', count=2), "반복 주기"),
+    (RecurrenceRule('daily', interval=0, count=2), "반복 간격"),
+    (RecurrenceRule('daily'), "반복 횟수 또는 종료 날짜"),
+    (RecurrenceRule('daily', count=0), "반복 횟수는 1 이상"),
+    (RecurrenceRule('daily', until=at(12, 31, year=2026)), "첫 회차보다 빠를 수 없습니다"),
+    (RecurrenceRule('weekly', count=200), "일을 초과할 수 없습니다"),
+])
+def test_validate_rule_rejects(rule, message):
+    with pytest.raises(ValueError, match=message):
+        validate_rule(rule, FIRST_START, FIRST_END)
+
+
+@pytest.mark.parametrize("items, booked, expected", [
+    ([(at(1, 1, 9), at(1, 1, 10)), (at(1, 1, 10), at(1, 1, 11)), (at(1, 1, 11), at(1, 1, 12))],
+     [(at(1, 1, 10, 30), at(1, 1, 11, 30))],
+     [False, True, True]),
+    # 끝과 시작이 맞닿는 구간은 겹치지 않는다
+    ([(at(1, 1, 9), at(1, 1, 10)), (at(1, 1, 11), at(1, 1, 12))],
+     [(at(1, 1, 10), at(1, 1, 11))],
+     [False, False]),
+    ([(at(1, 1, 9), at(1, 1, 17))],
+     [(at(1, 1, 8), at(1, 1, 9)), (at(1, 1, 12), at(1, 1, 13))],
+     [True]),
+    ([(at(1, 1, 9), at(1, 1, 10))], [], [False]),
+])
+def test_find_overlaps(items, booked, expected):
+    assert find_overlaps(items, booked) == expected
+
+
+def make_reservation(start_time: datetime, recurrence: RecurrenceRule = None) -> Reservation:
+    return Reservation(
+        id=None,
+        room_id=1,
+        title="주간 회의",
+        description="",
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=1),
+        organizer_email="organizer@company.com",
+        participants=["member@company.com"],
+        recurrence=recurrence
+    )
+
+
+def test_repository_rejects_series_conflicts(tmp_path, monkeypatch):
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{tmp_path / 'meeting_room.db'}")
+    day = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+    server = main.MeetingRoomServer(use_availability_index=False, use_read_cache=False)
+    asyncio.run(server.initialize_database())
+
+    session = server.db_config.get_session()
+    try:
+        repository = ReservationRepository(session)
+        repository.create(make_reservation(day + timedelta(days=2)))
+
+        # 세 번째 회차가 기존 단일 예약과 겹친다
+        with pytest.raises(ValueError, match=(day + timedelta(days=2)).strftime('%Y-%m-%d %H:%M')):
+            repository.create_series(make_reservation(day, RecurrenceRule('daily', count=5)))
+
+        series_id = repository.create_series(make_reservation(
+            day, RecurrenceRule('daily', count=5, exceptions=[day + timedelta(days=2)])
+        ))
+
+        # 단일 예약이 반복 예약 회차와 겹친다
+        with pytest.raises(ValueError, match="이미 예약이 있습니다"):
+            repository.create(make_reservation(day + timedelta(days=3, minutes=30)))
+
+        # 다른 반복 예약의 회차와 겹친다
+        with pytest.raises(ValueError, match=(day + timedelta(days=4, minutes=30)).strftime('%Y-%m-%d %H:%M')):
+            repository.create_series(make_reservation(
+                day + timedelta(days=4, minutes=30), RecurrenceRule('weekly', count=2)
+            ))
+
+        # 마지막 회차 다음 날은 비어 있다
+        repository.create(make_reservation(day + timedelta(days=5)))
+
+        assert repository.get_reservation_count() == 3
+        assert repository.get_by_id(series_id).recurrence.exceptions == [day + timedelta(days=2)]
+    finally:
+        session.close()
+        asyncio.run(server.shutdown())
@@ -0,0 +1,58 @@
+"""
+같은 회의실에 겹치는 예약을 동시에 생성할 때 한 건만 성공하는지 확인하는 회귀 테스트
+"""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta
+
+import src.meeting_room_mcp.server.main as main
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+
+CONCURRENT_REQUESTS = 8
+
+
+def make_reservation(start_time: datetime, organizer_email: str) -> Reservation:
+    return Reservation(
+        id=None,
+        room_id=1,
+        title="주간 회의",
+        description="",
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=1),
+        organizer_email=organizer_email,
+        participants=[]
+    )
+
+
+def test_concurrent_overlapping_creates_insert_exactly_one(tmp_path, monkeypatch):
+    database_path = tmp_path / "meeting_room.db"
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{database_path}")
+    start = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+    async def scenario():
+        server = main.MeetingRoomServer()
+        await server.initialize_database()
+        await server.startup()
+        try:
+            # 5분씩 어긋나 서로 모두 겹치는 요청(10:00~11:35 사이)을 동시에 보낸다
+            return await asyncio.gather(*(
+                server.reservation_service.create_reservation(
+                    make_reservation(start + timedelta(minutes=5 * i), f"user{i}@company.com")
+                )
+                for i in range(CONCURRENT_REQUESTS)
+            ), return_exceptions=True)
+        finally:
+            await server.shutdown()
+
+    results = asyncio.run(scenario())
+
+    created = [result for result in results if isinstance(result, int)]
+    rejected = [result for result in results if isinstance(result, ValueError)]
+    assert len(created) == 1
+    assert len(rejected) == CONCURRENT_REQUESTS - 1
+    assert all("이미 예약이 있습니다" in str(error) for error in rejected)
+
+    with sqlite3.connect(database_path) as connection:
+        rows = connection.execute("SELECT id FROM reservations WHERE room_id = 1").fetchall()
+    assert rows == [(created[0],)]
@@ -0,0 +1,111 @@
+"""
+예약 취소 후 다시 예약할 때 알림 아웃박스 중복 방지 키 충돌 회귀 테스트
+"""
+
+import asyncio
+import sqlite3
+from datetime import datetime, timedelta
+
+from sqlalchemy import MetaData
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.schema import CreateTable
+
+import src.meeting_room_mcp.server.main as main
+from src.meeting_room_mcp.server.entities import ReservationEntity
+from src.meeting_room_mcp.server.reservation.reservation_schemas import RecurrenceRule, Reservation
+from src.meeting_room_mcp.server.room.room_models import MeetingRoomEntity
+
+
+def make_reservation(room_id: int, start_time: datetime, recurrence: RecurrenceRule = None) -> Reservation:
+    return Reservation(
+        id=None,
+        room_id=room_id,
+        title="주간 회의",
+        description="",
+        start_time=start_time,
+        end_time=start_time + timedelta(hours=1),
+        organizer_email="organizer@company.com",
+        participants=["member@company.com"],
+        recurrence=recurrence
+    )
+
+
+async def run_with_server(monkeypatch, database_path, scenario):
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{database_path}")
+    server = main.MeetingRoomServer()
+    await server.initialize_database()
+    await server.startup()
+    try:
+        return await scenario(server)
+    finally:
+        await server.shutdown()
+
+
+def outbox_keys(database_path):
+    with sqlite3.connect(database_path) as connection:
+        return [key for (key,) in connection.execute("SELECT dedupe_key FROM notification_outbox ORDER BY id")]
+
+
+def test_create_after_cancel_does_not_reuse_reservation_id(tmp_path, monkeypatch):
+    database_path = tmp_path / "meeting_room.db"
+    start = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+    async def scenario(server):
+        service = server.reservation_service
+        first_id = await service.create_reservation(make_reservation(1, start))
+        assert await service.cancel_reservation(first_id)
+
+        second_id = await service.create_reservation(make_reservation(1, start))
+        series_id = await service.create_reservation(
+            make_reservation(2, start, RecurrenceRule('daily', count=3))
+        )
+        results = await service.create_reservations_bulk([make_reservation(3, start)])
+        assert await service.cancel_reservation(second_id)
+        return first_id, second_id, series_id, results[0].reservation_id
+
+    ids = asyncio.run(run_with_server(monkeypatch, database_path, scenario))
+
+    assert len(set(ids)) == len(ids)
+    keys = outbox_keys(database_path)
+    assert len(keys) == len(set(keys))
+    assert f"cancellation:{ids[1]}" in keys
+
+
+def test_migration_rebuilds_reservations_without_reusing_deleted_ids(tmp_path, monkeypatch):
+    database_path = tmp_path / "meeting_room.db"
+    start = (datetime.now() + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+
+    async def create_two(server):
+        service = server.reservation_service
+        first_id = await service.create_reservation(make_reservation(1, start))
+        second_id = await service.create_reservation(make_reservation(2, start))
+        assert await service.cancel_reservation(second_id)
+        return first_id, second_id
+
+    first_id, deleted_id = asyncio.run(run_with_server(monkeypatch, database_path, create_two))
+
+    # 기존 배포의 AUTOINCREMENT 없는 reservations 테이블로 되돌린다
+    metadata = MetaData()
+    MeetingRoomEntity.__table__.to_metadata(metadata)
+    legacy = ReservationEntity.__table__.to_metadata(metadata, name="reservations_legacy")
+    legacy.dialect_kwargs['sqlite_autoincrement'] = False
+    with sqlite3.connect(database_path) as connection:
+        connection.execute(str(CreateTable(legacy).compile(dialect=sqlite.dialect())))
+        connection.execute("INSERT INTO reservations_legacy SELECT * FROM reservations")
+        connection.execute("DROP TABLE reservations")
+        connection.execute("ALTER TABLE reservations_legacy RENAME TO reservations")
+        connection.execute("DELETE FROM sqlite_sequence WHERE name = 'reservations'")
+        connection.execute("DELETE FROM schema_migrations WHERE name = '0004_rebuild_reservations_autoincrement'")
+
+    async def create_again(server):
+        return await server.reservation_service.create_reservation(make_reservation(2, start))
+
+    new_id = asyncio.run(run_with_server(monkeypatch, database_path, create_again))
+
+    assert new_id > deleted_id
+    with sqlite3.connect(database_path) as connection:
+        table_sql, = connection.execute("SELECT sql FROM sqlite_master WHERE name = 'reservations'").fetchone()
+        index_names = {row[1] for row in connection.execute("PRAGMA index_list('reservations')")}
+        assert connection.execute("SELECT id FROM reservations ORDER BY id").fetchall() == [(first_id,), (new_id,)]
+    assert 'AUTOINCREMENT' in table_sql.upper()
+    assert {index.name for index in ReservationEntity.__table__.indexes} <= index_names
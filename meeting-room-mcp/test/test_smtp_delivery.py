@@ -0,0 +1,194 @@
+"""
+SMTP 발송 테스트 (로컬 SMTP 대역 서버로 커넥션 풀 재사용, NOOP 확인/최대 수명, 일부 수신자 거부)
+"""
+
+import socketserver
+import threading
+from datetime import datetime
+
+import pytest
+
+from src.meeting_room_mcp.server.reservation.reservation_schemas import Reservation
+from src.meeting_room_mcp.server.room.room_schemas import MeetingRoom
+from src.meeting_room_mcp.server.services.email_sevice import EmailService
+from src.meeting_room_mcp.server.services.smtp_pool import SMTPConnectionPool
+
+ORGANIZER = "organizer@company.com"
+MEMBER = "member@company.com"
+BOUNCE = "bounce@company.com"
+
+
+class StandInSMTPHandler(socketserver.StreamRequestHandler):
+    """메시지를 받기만 하는 최소 SMTP 서버 (scripts/benchmark_smtp_delivery.py와 같은 구조, 수신자 거부 추가)"""
+
+    def reply(self, line: str):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        self.server.count('connections')
+        self.reply("220 stand-in ESMTP")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+
+            command = line.decode(errors='replace').strip()
+            verb = command.upper()
+            if verb.startswith(("EHLO", "HELO")):
+                self.reply("250-stand-in\r\n250 8BITMIME")
+            elif verb.startswith("NOOP"):
+                self.server.count('noops')
+                self.reply(self.server.noop_reply)
+            elif verb.startswith(("MAIL", "RSET")):
+                self.reply("250 OK")
+            elif verb.startswith("RCPT"):
+                address = command[command.index('<') + 1:command.index('>')]
+                if address in self.server.rejected:
+                    self.reply("550 no such user")
+                else:
+                    self.server.recipients.append(address)
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                while self.rfile.readline() not in (b".\r\n", b""):
+                    pass
+                self.server.count('messages')
+                self.reply("250 queued")
+            elif verb == "QUIT":
+                self.reply("221 bye")
+                return
+            else:
+                self.reply("502 not implemented")
+
+
+class StandInSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), StandInSMTPHandler)
+        self.rejected = {BOUNCE}
+        self.noop_reply = "250 OK"
+        self.counters = {'connections': 0, 'messages': 0, 'noops': 0}
+        self.recipients = []
+        self._lock = threading.Lock()
+
+    def count(self, name: str):
+        with self._lock:
+            self.counters[name] += 1
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def smtp_server():
+    server = StandInSMTPServer()
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_service(smtp_server, **kwargs) -> EmailService:
+    host, port = smtp_server.server_address
+    return EmailService(smtp_server=host, smtp_port=port, use_tls=False, mock_mode=False, **kwargs)
+
+
+def compose(service: EmailService, participants):
+    reservation = Reservation(
+        id=1,
+        room_id=1,
+        title="주간 회의",
+        description="",
+        start_time=datetime(2027, 1, 1, 10, 0),
+        end_time=datetime(2027, 1, 1, 11, 0),
+        organizer_email=ORGANIZER,
+        participants=list(participants)
+    )
+    room = MeetingRoom(id=1, name="대회의실", capacity=10, location="3층", equipment="프로젝터")
+    return service.compose_cancellation(reservation, room)
+
+
+def test_sends_reuse_pooled_connections(smtp_server):
+    service = make_service(smtp_server, pool_size=2)
+    try:
+        email = compose(service, [MEMBER, "guest@company.com"])
+        for _ in range(3):
+            assert service.deliver_composed(email) == set(email.to_emails)
+        stats = service.smtp_pool.stats()
+    finally:
+        service.close()
+
+    # 수신자 3명 x 3건을 풀 크기만큼의 연결로 보낸다
+    assert smtp_server.counters['messages'] == 9
+    assert smtp_server.counters['connections'] == stats['connects'] <= 2
+    assert stats['reuses'] == 9 - stats['connects']
+    assert stats['discarded'] == 0
+
+
+def test_idle_connection_is_checked_with_noop_and_old_connection_expires(smtp_server):
+    clock = FakeClock()
+    host, port = smtp_server.server_address
+    pool = SMTPConnectionPool(host, port, use_tls=False, max_size=1, max_age=300, noop_interval=30, clock=clock)
+
+    def send():
+        with pool.connection() as connection:
+            connection.sendmail(ORGANIZER, [MEMBER], "Subject: test\r\n\r\nbody")
+
+    try:
+        send()
+        clock.now = 10
+        send()
+        # 쉬는 시간이 짧으면 NOOP 없이 재사용
+        assert (smtp_server.counters['noops'], pool.stats()['reuses']) == (0, 1)
+
+        clock.now = 50
+        send()
+        assert (smtp_server.counters['noops'], pool.stats()['reuses']) == (1, 2)
+        assert smtp_server.counters['connections'] == 1
+
+        # NOOP에 실패하면 연결을 버리고 새로 연결
+        smtp_server.noop_reply = "421 closing"
+        clock.now = 100
+        send()
+        assert pool.stats()['health_check_failures'] == 1
+        assert smtp_server.counters['connections'] == 2
+
+        # 최대 수명이 지난 연결은 NOOP 없이 새로 연결
+        noops = smtp_server.counters['noops']
+        clock.now = 100 + 300
+        send()
+        stats = pool.stats()
+    finally:
+        pool.close()
+
+    assert stats['expired'] == 1
+    assert smtp_server.counters['noops'] == noops
+    assert smtp_server.counters['connections'] == stats['connects'] == 3
+    assert (stats['open'], stats['discarded']) == (1, 2)
+    assert smtp_server.counters['messages'] == 5
+
+
+@pytest.mark.parametrize("batch_recipients", [False, True])
+def test_refused_recipient_is_not_reported_as_delivered(smtp_server, batch_recipients):
+    service = make_service(smtp_server, pool_size=2, batch_recipients=batch_recipients)
+    try:
+        email = compose(service, [MEMBER, BOUNCE])
+        delivered = service.deliver_composed(email)
+        # 거부 응답 뒤에도 연결은 버리지 않고 다음 발송에 재사용
+        assert service.deliver_composed(email, [MEMBER]) == {MEMBER}
+        stats = service.smtp_pool.stats()
+    finally:
+        service.close()
+
+    assert delivered == {ORGANIZER, MEMBER}
+    assert BOUNCE not in smtp_server.recipients
+    assert smtp_server.counters['messages'] == (2 if batch_recipients else 3)
+    assert stats['discarded'] == 0
+    assert smtp_server.counters['connections'] == stats['connects']
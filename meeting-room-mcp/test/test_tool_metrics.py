@@ -0,0 +1,141 @@
+"""
+도구 호출 지표 테스트 (Prometheus 레이블, 도구별 SQL 문장 수 상한)
+"""
+
+import asyncio
+import json
+import os
+from datetime import datetime, timedelta
+
+import pytest
+from fastmcp import Client
+
+import src.meeting_room_mcp.server.main as main
+from src.meeting_room_mcp.server.entities import ReservationEntity
+from src.meeting_room_mcp.server.reservation.reservation_schemas import RecurrenceRule, Reservation
+from src.meeting_room_mcp.server.room.room_models import MeetingRoomEntity
+from src.meeting_room_mcp.server.tool_metrics import ToolMetrics
+
+ME = "me@company.com"
+EXTRA_ROOMS = 30
+
+
+def test_prometheus_series_carry_worker_label():
+    metrics = ToolMetrics(worker="w1")
+    metrics.record("get_all_rooms", 0.01, failed=False)
+    metrics.record("get_all_rooms", 0.02, failed=True)
+
+    samples = [line for line in metrics.to_prometheus().splitlines() if line and not line.startswith('#')]
+
+    assert samples
+    assert all(line.startswith('mcp_tool_') and '{worker="w1",tool="get_all_rooms"' in line for line in samples)
+    assert 'mcp_tool_calls_total{worker="w1",tool="get_all_rooms"} 2' in samples
+    assert 'mcp_tool_errors_total{worker="w1",tool="get_all_rooms"} 1' in samples
+
+
+def test_worker_label_defaults_to_process_id():
+    assert ToolMetrics().worker == str(os.getpid())
+
+
+async def run_with_server(tmp_path, monkeypatch, scenario):
+    """회의실/예약이 많은 DB로 서버를 띄워 MCP 클라이언트로 시나리오 실행 (캐시 없이 매번 DB 조회)"""
+    monkeypatch.setattr(main, 'database_url', f"sqlite:///{tmp_path / 'meeting_room.db'}")
+    server = main.MeetingRoomServer(use_availability_index=False, use_read_cache=False)
+    await server.initialize_database()
+
+    now = datetime.now()
+    session = server.db_config.get_session()
+    try:
+        for number in range(EXTRA_ROOMS):
+            room = MeetingRoomEntity(
+                name=f"프로젝트룸 {number}", capacity=6, location='6층', equipment='TV, 화이트보드', status='available'
+            )
+            room.sync_equipment_tags()
+            session.add(room)
+        session.flush()
+
+        # 지금 사용 중인 회의실이 있어야 현재 상태 계산 경로를 탄다
+        for room_id in range(1, 6):
+            session.add(ReservationEntity(
+                room_id=room_id,
+                title="진행 중인 회의",
+                start_time=now - timedelta(minutes=10),
+                end_time=now + timedelta(minutes=50),
+                organizer_email=ME,
+                participants='[]'
+            ))
+        session.commit()
+    finally:
+        session.close()
+
+    await server.startup()
+    try:
+        start = (now + timedelta(days=1)).replace(hour=10, minute=0, second=0, microsecond=0)
+        for room_id in range(6, 20):
+            await server.reservation_service.create_reservation(Reservation(
+                None, room_id, "주간 회의", "", start, start + timedelta(hours=1),
+                ME if room_id % 2 else "other@company.com",
+                [] if room_id % 2 else [ME],
+                recurrence=RecurrenceRule('daily', count=3) if room_id % 3 == 0 else None
+            ))
+
+        async with Client(server.app) as client:
+            return await scenario(server, client, start)
+    finally:
+        await server.shutdown()
+
+
+@pytest.mark.parametrize("tool, arguments, max_queries", [
+    ('get_all_rooms', {}, 2),
+    ('get_all_rooms', {'limit': 100, 'format': 'json'}, 2),
+    ('search_available_rooms', {}, 2),
+    ('search_available_rooms', {'equipment': ['tv'], 'capacity': 6, 'format': 'compact'}, 2),
+    ('get_my_reservations', {'email': ME}, 5),
+    ('get_my_reservations', {'email': ME, 'limit': 100, 'format': 'json'}, 4),
+])
+def test_tool_query_budget(tmp_path, monkeypatch, assert_max_queries, tool, arguments, max_queries):
+    async def scenario(server, client, start):
+        if tool != 'get_all_rooms':
+            arguments.setdefault('start_time', start.isoformat())
+            arguments.setdefault('end_time', (start + timedelta(days=3)).isoformat())
+
+        with assert_max_queries(server.tool_metrics, tool, max_queries) as calls:
+            result = await client.call_tool(tool, arguments)
+        return result.content[0].text, calls
+
+    text, calls = asyncio.run(run_with_server(tmp_path, monkeypatch, scenario))
+
+    # 결과가 비어 있지 않아야 문장 수가 행 수와 무관한지 확인한 것이 된다
+    assert len(calls) == 1 and calls[0].count > 0
+    assert "오류" not in text
+    if arguments.get('format') == 'json':
+        assert len(json.loads(text)['items']) > 10
+
+
+def test_query_budget_fails_on_n_plus_one(tmp_path, monkeypatch, assert_max_queries):
+    async def scenario(server, client, start):
+        # 회의실마다 예약 목록을 따로 조회하는 N+1 도구
+        @server.app.tool()
+        async def room_reservation_counts() -> str:
+            rooms = (await server.room_service.get_all_rooms()).items
+            counts = [
+                len((await server.reservation_service.get_room_reservations(room.id)).items) for room in rooms
+            ]
+            return str(sum(counts))
+
+        with pytest.raises(AssertionError) as failure:
+            with assert_max_queries(server.tool_metrics, 'room_reservation_counts', 5):
+                await client.call_tool('room_reservation_counts', {})
+        return str(failure.value), server.tool_metrics.snapshot()['room_reservation_counts']
+
+    message, stats = asyncio.run(run_with_server(tmp_path, monkeypatch, scenario))
+
+    assert "room_reservation_counts 호출 SQL 문장 수" in message
+    assert "허용 5개" in message
+    assert stats['n_plus_one_calls'] == 1
+
+
+def test_query_budget_fails_when_tool_not_called(assert_max_queries):
+    with pytest.raises(AssertionError, match="호출되지 않았습니다"):
+        with assert_max_queries(ToolMetrics(), 'get_all_rooms', 2):
+            pass